@@ -6,6 +6,7 @@ from typing import Optional, Callable, List, Dict, Any
 
 from core.async_log_collector import AsyncLogCollector, LogEntry
 from core.async_monitor import AsyncResourceMonitor
+from utils.constants import RESOURCE_MONITOR_INTERVAL
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,8 @@ class AsyncApp:
         self.resource_monitor = resource_monitor
         self._running = False
         self._tasks: List[asyncio.Task] = []
+        # 资源监控循环的周期（秒），由界面根据数值是否稳定调整
+        self._resource_interval = RESOURCE_MONITOR_INTERVAL
         
         # 回调函数
         self._on_logs_updated: Optional[Callable[[List[LogEntry]], Any]] = None
@@ -29,6 +32,9 @@ class AsyncApp:
     def set_resources_callback(self, callback: Callable[[Dict[str, Any]], Any]):
         self._on_resources_updated = callback
     
+    def set_resource_interval(self, seconds: float):
+        self._resource_interval = seconds
+    
     async def start(self):
         """启动所有异步任务"""
         self._running = True
@@ -86,7 +92,7 @@ class AsyncApp:
             except Exception as e:
                 logger.debug(f"资源监控异常: {e}")
             
-            await asyncio.sleep(3.0)
+            await asyncio.sleep(self._resource_interval)
     
     async def _uin_fetch_loop(self):
         """UIN 获取循环"""
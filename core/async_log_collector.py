@@ -5,25 +5,40 @@ import logging
 import subprocess
 import threading
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Callable, Dict
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     timestamp: datetime
     process_name: str
     level: str
     message: str
+    # 收集器追加时分配的递增序号
+    seq: int = field(default=0, init=False, repr=False, compare=False)
+    # HH:MM:SS 格式的时间文本，首次使用时生成
+    _time_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def time_text(self) -> str:
+        """返回 HH:MM:SS 格式的时间，条目生命周期内只调用一次 strftime"""
+        text = self._time_text
+        if text is None:
+            text = self._time_text = self.timestamp.strftime("%H:%M:%S")
+        return text
 
 
 class AsyncLogCollector:
     def __init__(self, max_lines: int = 1000):
         self.max_lines = max_lines
         self._logs: deque = deque(maxlen=max_lines)
+        # 日志变更序号，每次追加或清空时递增，供界面判断是否需要刷新
+        self._seq = 0
+        # 读取线程会并发推送日志，序号递增与追加需在锁内完成
+        self._lock = threading.Lock()
         self._queue: Optional[asyncio.Queue] = None
         self._callbacks: List[Callable[[LogEntry], None]] = []
         self._reader_threads: Dict[str, List[threading.Thread]] = {}
@@ -38,8 +53,10 @@ class AsyncLogCollector:
     
     def _push_log(self, entry: LogEntry):
         """从任意线程安全地推送日志到队列"""
-        # 同时写入 deque（线程安全）
-        self._logs.append(entry)
+        with self._lock:
+            self._seq += 1
+            entry.seq = self._seq
+            self._logs.append(entry)
         self._write_to_log_file(entry)
         
         # 尝试推送到队列（如果队列已初始化）
@@ -49,6 +66,15 @@ class AsyncLogCollector:
             except (asyncio.QueueFull, RuntimeError):
                 pass
     
+    def add_system_log(self, message: str) -> None:
+        """追加一条来自管理器自身的系统日志"""
+        self._push_log(LogEntry(
+            timestamp=datetime.now(),
+            process_name="系统",
+            level="stdout",
+            message=message
+        ))
+    
     async def consume_logs(self) -> Optional[LogEntry]:
         """主线程异步消费日志，返回一条日志或 None（超时）"""
         self._ensure_queue()
@@ -120,6 +146,11 @@ class AsyncLogCollector:
             return list(self._logs)
         return [e for e in self._logs if e.process_name == process_name]
     
+    @property
+    def seq(self) -> int:
+        """日志变更序号，追加或清空日志时递增；序号未变说明日志内容没有变化"""
+        return self._seq
+    
     def get_log_count(self) -> int:
         return len(self._logs)
     
@@ -131,13 +162,15 @@ class AsyncLogCollector:
         return list(islice(self._logs, start_idx, None))
     
     def clear_logs(self, process_name: Optional[str] = None) -> None:
-        if process_name is None:
-            self._logs.clear()
-        else:
-            self._logs = deque(
-                (e for e in self._logs if e.process_name != process_name),
-                maxlen=self.max_lines
-            )
+        with self._lock:
+            self._seq += 1
+            if process_name is None:
+                self._logs.clear()
+            else:
+                self._logs = deque(
+                    (e for e in self._logs if e.process_name != process_name),
+                    maxlen=self.max_lines
+                )
     
     def stop(self):
         self._running = False
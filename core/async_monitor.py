@@ -23,6 +23,8 @@ class AsyncResourceMonitor:
         self._nickname: Optional[str] = None
         self._running = False
         self._on_uin_callback: Optional[Callable[[str, str], None]] = None
+        # 复用 Process 对象，cpu_percent(None) 返回距上次采样的占用，无需阻塞等待
+        self._procs: Dict[int, psutil.Process] = {}
     
     def set_pmhq_port(self, port: int):
         self._pmhq_port = port
@@ -47,6 +49,14 @@ class AsyncResourceMonitor:
     def uin(self) -> Optional[str]:
         return self._uin
     
+    def _get_proc(self, pid: int) -> psutil.Process:
+        proc = self._procs.get(pid)
+        if proc is None:
+            proc = psutil.Process(pid)
+            proc.cpu_percent(None)
+            self._procs[pid] = proc
+        return proc
+    
     async def start(self):
         self._running = True
     
@@ -83,13 +93,15 @@ class AsyncResourceMonitor:
         """异步更新 QQ 资源占用"""
         def get_resources():
             try:
-                proc = psutil.Process(pid)
+                proc = self._get_proc(pid)
                 if not proc.is_running():
+                    self._procs.pop(pid, None)
                     return None
-                cpu = proc.cpu_percent(interval=0.05)
+                cpu = proc.cpu_percent(None)
                 memory = proc.memory_info().rss / (1024 * 1024)
                 return {"cpu": cpu, "memory": memory}
             except (psutil.NoSuchProcess, psutil.AccessDenied):
+                self._procs.pop(pid, None)
                 return None
         
         result = await asyncio.to_thread(get_resources)
@@ -132,13 +144,15 @@ class AsyncResourceMonitor:
         """异步获取进程资源占用"""
         def get_resources():
             try:
-                proc = psutil.Process(pid)
+                proc = self._get_proc(pid)
                 if not proc.is_running():
+                    self._procs.pop(pid, None)
                     return 0.0, 0.0, False
-                cpu = proc.cpu_percent(interval=0.05)
+                cpu = proc.cpu_percent(None)
                 mem = proc.memory_info().rss / 1024 / 1024
                 return cpu, mem, True
             except (psutil.NoSuchProcess, psutil.AccessDenied):
+                self._procs.pop(pid, None)
                 return 0.0, 0.0, False
         
         return await asyncio.to_thread(get_resources)
@@ -17,6 +17,8 @@ class ConfigManager:
     def __init__(self, config_path: str = CONFIG_FILE):
         self.config_path = config_path
         self._config_cache: Optional[Dict[str, Any]] = None
+        # 缓存对应的配置文件 (mtime_ns, size)，文件未变化时不重新解析
+        self._cache_stamp: Optional[Tuple[int, int]] = None
     
     def load_config(self) -> Dict[str, Any]:
         """加载配置文件
@@ -28,8 +30,15 @@ class ConfigManager:
             ConfigError: 配置文件格式无效
         """
         # 如果文件不存在，返回默认配置
-        if not os.path.exists(self.config_path):
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
             self._config_cache = self.get_default_config()
+            self._cache_stamp = None
+            return self._config_cache.copy()
+        
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._config_cache is not None and stamp == self._cache_stamp:
             return self._config_cache.copy()
         
         try:
@@ -46,6 +55,7 @@ class ConfigManager:
                 raise ConfigError(f"配置文件格式无效: {error_msg}")
             
             self._config_cache = merged_config
+            self._cache_stamp = stamp
             return self._config_cache.copy()
         
         except json.JSONDecodeError as e:
@@ -59,6 +69,7 @@ class ConfigManager:
         if not is_valid:
             return False
         
+        self._cache_stamp = None
         try:
             with open(self.config_path, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=2, ensure_ascii=False)
@@ -151,6 +162,7 @@ class ConfigManager:
         return self._save_config_without_validation(self._config_cache)
     
     def _save_config_without_validation(self, config: Dict[str, Any]) -> bool:
+        self._cache_stamp = None
         try:
             with open(self.config_path, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=2, ensure_ascii=False)
@@ -5,7 +5,7 @@ import subprocess
 import threading
 import time
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Callable, Dict
 
@@ -13,18 +13,31 @@ from typing import Optional, List, Callable, Dict
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     timestamp: datetime
     process_name: str
     level: str  # "stdout" 或 "stderr"
     message: str
+    # 收集器追加时分配的递增序号
+    seq: int = field(default=0, init=False, repr=False, compare=False)
+    # HH:MM:SS 格式的时间文本，首次使用时生成
+    _time_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def time_text(self) -> str:
+        """返回 HH:MM:SS 格式的时间，条目生命周期内只调用一次 strftime"""
+        text = self._time_text
+        if text is None:
+            text = self._time_text = self.timestamp.strftime("%H:%M:%S")
+        return text
 
 
 class LogCollector:
     def __init__(self, max_lines: int = 1000):
         self.max_lines = max_lines
         self._logs: deque = deque(maxlen=max_lines)
+        # 日志变更序号，每次追加或清空时递增，供界面判断是否需要刷新
+        self._seq = 0
         self._lock = threading.Lock()
         self._callbacks: List[Callable[[LogEntry], None]] = []
         self._reader_threads: Dict[str, List[threading.Thread]] = {}
@@ -84,6 +97,8 @@ class LogCollector:
                             )
                             
                             with self._lock:
+                                self._seq += 1
+                                entry.seq = self._seq
                                 self._logs.append(entry)
                             
                             self._write_to_log_file(entry)
@@ -123,6 +138,8 @@ class LogCollector:
                     )
                     
                     with self._lock:
+                        self._seq += 1
+                        entry.seq = self._seq
                         self._logs.append(entry)
                     
                     self._write_to_log_file(entry)
@@ -144,6 +161,11 @@ class LogCollector:
             else:
                 return [entry for entry in self._logs if entry.process_name == process_name]
     
+    @property
+    def seq(self) -> int:
+        """日志变更序号，追加或清空日志时递增；序号未变说明日志内容没有变化"""
+        return self._seq
+    
     def get_log_count(self) -> int:
         with self._lock:
             return len(self._logs)
@@ -159,6 +181,7 @@ class LogCollector:
     
     def clear_logs(self, process_name: Optional[str] = None) -> None:
         with self._lock:
+            self._seq += 1
             if process_name is None:
                 self._logs.clear()
             else:
@@ -18,6 +18,9 @@ from utils.pmhq_client import PMHQClient
 
 logger = logging.getLogger(__name__)
 
+# get_all_pids 结果的复用时长（秒），同一次界面刷新中的多次查询只检查一次进程
+_PIDS_CACHE_TTL = 0.25
+
 
 def is_admin() -> bool:
     """检查当前进程是否以管理员权限运行"""
@@ -59,6 +62,8 @@ class ProcessManager:
         self._qq_process: Optional["psutil.Process"] = None
         self._http_client: Optional[HttpClient] = None
         self._pmhq_client: Optional[PMHQClient] = None
+        # (托管进程快照, 检查时间, 结果)；启动或停止进程会改变快照，缓存随之失效
+        self._pids_cache: Optional[tuple] = None
         
     def start_pmhq(self, pmhq_path: str, config_path: str = "pmhq_config.json", 
                    qq_path: str = "", auto_login_qq: str = "", headless: bool = False) -> bool:
@@ -915,20 +920,26 @@ class ProcessManager:
         try:
             import psutil
             
-            # 每次创建新的 Process 对象，避免多线程共享问题
-            proc = psutil.Process(pid)
+            # 复用同一 PID 的 Process 对象，cpu_percent(None) 按两次采样间的差值计算，
+            # 无需阻塞采样；首次采样返回 0
+            with self._lock:
+                proc = self._qq_process
+            if proc is None or proc.pid != pid:
+                proc = psutil.Process(pid)
             
             if not proc.is_running():
                 with self._lock:
                     self._qq_pid = None
+                    self._qq_process = None
                     self._qq_resources = {"cpu": 0.0, "memory": 0.0}
                 return
             
-            # 使用 interval=0.05 进行短暂采样，获取准确的 CPU 值
-            cpu = proc.cpu_percent(interval=0.05)
-            memory = proc.memory_info().rss / (1024 * 1024)
+            with proc.oneshot():
+                cpu = proc.cpu_percent(None)
+                memory = proc.memory_info().rss / (1024 * 1024)
             
             with self._lock:
+                self._qq_process = proc
                 self._qq_resources = {"cpu": cpu, "memory": memory}
             logger.debug(f"QQ资源占用 - PID: {pid}, CPU: {cpu:.1f}%, 内存: {memory:.1f}MB")
             
@@ -936,6 +947,7 @@ class ProcessManager:
             logger.debug(f"QQ进程 {pid} 不存在")
             with self._lock:
                 self._qq_pid = None
+                self._qq_process = None
                 self._qq_resources = {"cpu": 0.0, "memory": 0.0}
         except psutil.AccessDenied:
             logger.debug(f"无权限访问QQ进程 {pid}")
@@ -980,6 +992,13 @@ class ProcessManager:
             字典，键为进程名称，值为PID（如果进程不存在则为None）
         """
         with self._lock:
+            snapshot = (self._processes.get("pmhq"), self._processes.get("llbot"),
+                        self._admin_pids.get("pmhq"), self._admin_pids.get("llbot"))
+            now = time.monotonic()
+            cached = self._pids_cache
+            if cached is not None and cached[0] == snapshot and now - cached[1] < _PIDS_CACHE_TTL:
+                return dict(cached[2])
+            
             pids = {}
             for name in ["pmhq", "llbot"]:
                 # 先检查普通进程
@@ -1000,7 +1019,8 @@ class ProcessManager:
                             pids[name] = None
                     else:
                         pids[name] = None
-            return pids
+            self._pids_cache = (snapshot, now, pids)
+            return dict(pids)
     
     def _start_monitoring(self) -> None:
         """启动进程监控线程"""
@@ -5,14 +5,46 @@ import json
 import re
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
+
+
+def _file_stamp(path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 
 class VersionDetector:
+    def __init__(self):
+        # (组件, 规范化路径) -> (文件与 package.json 的 (mtime_ns, size), 版本号)
+        self._version_cache: Dict[Tuple[str, str], Tuple[tuple, str]] = {}
+    
+    def _cached_detect(self, kind: str, path: str, detect: Callable[[str], Optional[str]]) -> Optional[str]:
+        """文件和同目录 package.json 均未变化时复用上次检测到的版本，避免重复启动子进程"""
+        stamp = (_file_stamp(path), _file_stamp(Path(path).parent / 'package.json'))
+        key = (kind, os.path.normcase(os.path.abspath(path)))
+        cached = self._version_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        version = detect(path)
+        # 检测失败（超时等）不缓存，下次重新尝试
+        if version is not None:
+            self._version_cache[key] = (stamp, version)
+        return version
+    
+    def clear_cache(self):
+        """清空版本缓存，组件更新完成后调用"""
+        self._version_cache.clear()
+    
     def detect_pmhq_version(self, pmhq_path: str) -> Optional[str]:
         if not pmhq_path:
             return None
-        
+        return self._cached_detect('pmhq', pmhq_path, self._detect_pmhq_version)
+    
+    def _detect_pmhq_version(self, pmhq_path: str) -> Optional[str]:
         pmhq_dir = Path(pmhq_path).parent
         
         # 方法1: 尝试读取 package.json（优先）
@@ -66,7 +98,9 @@ class VersionDetector:
     def detect_llbot_version(self, script_path: str) -> Optional[str]:
         if not script_path or not os.path.exists(script_path):
             return None
-            
+        return self._cached_detect('llbot', script_path, self._detect_llbot_version)
+    
+    def _detect_llbot_version(self, script_path: str) -> Optional[str]:
         script_dir = Path(script_path).parent
         
         # 方法1: 尝试读取 package.json
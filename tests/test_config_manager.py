@@ -0,0 +1,65 @@
+"""测试配置管理模块"""
+
+import json
+import os
+import tempfile
+
+import pytest
+
+from core.config_manager import ConfigManager
+
+
+@pytest.fixture
+def config_path():
+    """创建临时配置文件路径"""
+    fd, path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    os.remove(path)
+    yield path
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _write(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def test_load_config_reuses_cache_when_file_unchanged(config_path):
+    """测试文件未变化时不重新解析配置"""
+    _write(config_path, {"port": 3080})
+    manager = ConfigManager(config_path)
+    first = manager.load_config()
+
+    with open(config_path, 'rb') as f:
+        content = f.read()
+    stat = os.stat(config_path)
+    # 内容被破坏但 mtime 和大小不变，说明返回的是缓存
+    with open(config_path, 'wb') as f:
+        f.write(b' ' * len(content))
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    second = manager.load_config()
+    assert second == first
+    assert second is not first
+
+
+def test_load_config_reloads_after_file_changed(config_path):
+    """测试文件变化后重新加载配置"""
+    _write(config_path, {"port": 3080})
+    manager = ConfigManager(config_path)
+    assert manager.load_config()["port"] == 3080
+
+    _write(config_path, {"port": 30800})
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert manager.load_config()["port"] == 30800
+
+
+def test_save_config_invalidates_cache(config_path):
+    """测试保存配置后读取到新值"""
+    manager = ConfigManager(config_path)
+    config = manager.load_config()
+    config["port"] = 4000
+    assert manager.save_config(config)
+    assert manager.load_config()["port"] == 4000
@@ -214,3 +214,158 @@ def test_config_page_callback_on_save(config_manager):
     assert callback_called == True
     assert saved_config is not None
     assert saved_config["pmhq_path"] == "pmhq.exe"
+
+
+def test_config_page_refresh_rereads_startup_state_when_config_unchanged(config_manager, monkeypatch):
+    """测试配置文件未变化时仍会同步应用外修改的开机自启状态"""
+    import ui.config_page as config_page_module
+    monkeypatch.setattr(config_page_module, "is_startup_enabled", lambda: False)
+    config_manager.save_config({"qq_path": "/initial/qq.exe"})
+    
+    page = ConfigPage(config_manager)
+    page.build()
+    page.refresh()
+    assert page.startup_checkbox.value is False
+    
+    monkeypatch.setattr(config_page_module, "is_startup_enabled", lambda: True)
+    page.refresh()
+    assert page.startup_checkbox.value is True
+
+
+def test_retention_hours_change_ignores_non_decimal_digits(config_manager):
+    """测试保留时长输入中的上标、带圈数字等字符被过滤而不是导致异常"""
+    page = ConfigPage(config_manager)
+    page.build()
+    
+    class _Event:
+        def __init__(self, control):
+            self.control = control
+    
+    field = page.log_retention_hours_field
+    for raw, expected_value, expected_hours in (("24", "24", 24), ("2²", "2", 2), ("①", "", 168)):
+        field.value = raw
+        page._on_retention_hours_change(_Event(field))
+        assert field.value == expected_value
+        assert page._retention_hours == expected_hours
+
+
+def test_picker_worker_rebuilds_root_after_tcl_error(monkeypatch):
+    """测试 Tk 根窗口出错后被销毁，下次请求重新创建"""
+    import queue
+    import ui.config_page as config_page_module
+    
+    created = []
+    
+    class _FakeRoot:
+        def __init__(self):
+            self.destroyed = False
+            created.append(self)
+        
+        def withdraw(self):
+            pass
+        
+        def attributes(self, *args):
+            pass
+        
+        def destroy(self):
+            self.destroyed = True
+    
+    class _Stop(BaseException):
+        pass
+    
+    monkeypatch.setattr(config_page_module.tk, "Tk", _FakeRoot)
+    
+    def _broken(root):
+        raise config_page_module.tk.TclError("application has been destroyed")
+    
+    def _stop(root):
+        raise _Stop()
+    
+    jobs = queue.Queue()
+    for job in (_broken, lambda root: None, _stop):
+        jobs.put(job)
+    with pytest.raises(_Stop):
+        config_page_module._picker_worker(jobs)
+    
+    assert len(created) == 2
+    assert created[0].destroyed is True
+    assert created[1].destroyed is False
+
+
+def test_cleanup_queue_runs_jobs_on_daemon_thread():
+    """测试日志清理在守护线程中串行执行，不会阻塞进程退出"""
+    import threading
+    done = threading.Event()
+    seen = []
+    
+    def job():
+        seen.append(threading.current_thread().daemon)
+        done.set()
+    
+    jobs = ConfigPage._get_cleanup_queue()
+    assert ConfigPage._get_cleanup_queue() is jobs
+    jobs.put(lambda: 1 / 0)
+    jobs.put(job)
+    assert done.wait(5)
+    assert seen == [True]
+
+
+def _record_saves(config_manager, monkeypatch):
+    saved = []
+    original = config_manager.save_config
+    
+    def save_config(config):
+        saved.append(dict(config))
+        return original(config)
+    
+    monkeypatch.setattr(config_manager, "save_config", save_config)
+    return saved
+
+
+def test_save_without_changes_skips_write(config_manager, monkeypatch):
+    """测试配置无变化时保存不会重写配置文件"""
+    config_manager.save_config({"qq_path": "", "pmhq_path": "", "llbot_path": "", "node_path": ""})
+    page = ConfigPage(config_manager)
+    page.build()
+    page.on_page_enter()
+    page._on_save_config(None)
+    assert page.current_config == config_manager.load_config()
+    
+    saved = _record_saves(config_manager, monkeypatch)
+    page._on_save_config(None)
+    assert saved == []
+
+
+def test_save_without_changes_rewrites_broken_config(config_manager, temp_config_file, monkeypatch):
+    """测试配置文件损坏时即使界面未修改，保存也会重新写入"""
+    with open(temp_config_file, "w", encoding="utf-8") as f:
+        f.write("{broken")
+    page = ConfigPage(config_manager)
+    page.build()
+    page.on_page_enter()
+    
+    saved = _record_saves(config_manager, monkeypatch)
+    page._on_save_config(None)
+    assert len(saved) == 1
+    assert isinstance(config_manager.load_config(), dict)
+
+
+def test_save_triggers_log_cleanup_only_when_log_settings_change(config_manager, monkeypatch):
+    """测试只有日志保存相关设置变化时才触发日志清理"""
+    config_manager.save_config({"qq_path": "", "pmhq_path": "", "llbot_path": "", "node_path": ""})
+    page = ConfigPage(config_manager)
+    page.build()
+    page.on_page_enter()
+    page._on_save_config(None)
+    
+    cleanups = []
+    monkeypatch.setattr(page, "_trigger_log_cleanup", lambda: cleanups.append(True))
+    
+    page.auto_login_qq_field.value = "12345"
+    page._on_save_config(None)
+    assert cleanups == []
+    
+    page._retention_hours = 48
+    page._on_save_config(None)
+    assert cleanups == [True]
+    assert config_manager.load_config()["log_retention_seconds"] == 48 * 3600
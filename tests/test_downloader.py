@@ -25,7 +25,7 @@ class TestDownloader:
             mock_which.return_value = "/usr/bin/node"
             result = downloader.find_in_path("node")
             assert result == "/usr/bin/node"
-            mock_which.assert_called_once_with("node")
+            mock_which.assert_called_once_with("node", path=downloader._search_path())
     
     def test_find_in_path_returns_none_when_not_found(self, downloader):
         """测试在PATH中找不到可执行文件时返回None"""
@@ -34,6 +34,37 @@ class TestDownloader:
             result = downloader.find_in_path("nonexistent")
             assert result is None
     
+    def test_search_path_skips_missing_and_duplicate_dirs(self, downloader, tmp_path):
+        """测试搜索路径去掉不存在和重复的目录"""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        missing = tmp_path / "missing"
+        path = os.pathsep.join([str(bin_dir), str(missing), "", str(bin_dir)])
+        with patch.dict(os.environ, {"PATH": path}):
+            assert downloader._search_path() == str(bin_dir)
+    
+    def test_search_path_empty_falls_back_to_default(self, downloader, tmp_path):
+        """测试PATH为空或没有可用目录时交给shutil.which使用默认搜索路径"""
+        with patch.dict(os.environ, {"PATH": ""}):
+            assert downloader._search_path() is None
+        with patch.dict(os.environ, {"PATH": str(tmp_path / "missing")}):
+            assert downloader._search_path() is None
+    
+    def test_get_node_version_cached_until_file_changes(self, downloader, tmp_path):
+        """测试 node 文件未变化时不重复执行 node --version"""
+        node = tmp_path / "node.exe"
+        node.write_bytes(b"")
+        result = Mock(returncode=0, stdout="v22.1.0\n")
+        with patch('subprocess.run', return_value=result) as mock_run:
+            assert downloader.get_node_version(str(node)) == 22
+            assert downloader.get_node_version(str(node)) == 22
+            assert mock_run.call_count == 1
+            
+            st = node.stat()
+            os.utime(node, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            assert downloader.get_node_version(str(node)) == 22
+            assert mock_run.call_count == 2
+    
     def test_check_node_available_finds_node_exe(self, downloader):
         """测试检测系统中的node.exe"""
         with patch('utils.downloader.shutil.which') as mock_which:
@@ -307,6 +338,25 @@ class TestDownloader:
             assert result is True
             mock_download.assert_called_once()
 
+    def test_download_qq_streams_chunks_to_file(self, downloader, tmp_path):
+        """测试QQ安装包分块直接写入文件"""
+        save_path = tmp_path / "QQInstaller.exe"
+        chunks = [b"a" * 10, b"b" * 5, b""]
+        
+        mock_response = MagicMock()
+        mock_response.headers = {'content-length': '15'}
+        mock_response.status = 200
+        mock_response.read.side_effect = chunks
+        mock_response.__enter__.return_value = mock_response
+        
+        progress_calls = []
+        with patch('utils.http_client.urllib.request.urlopen', return_value=mock_response):
+            result = downloader.download_qq(str(save_path), lambda d, t: progress_calls.append((d, t)))
+        
+        assert result is True
+        assert save_path.read_bytes() == b"a" * 10 + b"b" * 5
+        assert progress_calls == [(10, 15), (15, 15)]
+
 
     def test_get_app_update_download_url(self, downloader):
         """测试获取应用更新下载URL"""
@@ -1,6 +1,9 @@
 """首页UI组件测试"""
 
 import pytest
+import flet as ft
+from datetime import datetime
+from core.async_log_collector import LogEntry
 from core.process_manager import ProcessManager, ProcessStatus
 from core.config_manager import ConfigManager
 from ui.home_page import (
@@ -10,6 +13,12 @@ from ui.home_page import (
 )
 
 
+@pytest.fixture
+def mounted(monkeypatch):
+    """模拟控件已挂载到页面上"""
+    monkeypatch.setattr(ft.BaseControl, "page", property(lambda self: object()))
+
+
 def test_process_resource_card_creation():
     """测试进程资源卡片创建"""
     card = ProcessResourceCard("pmhq", "PMHQ")
@@ -53,43 +62,62 @@ def test_log_preview_update_with_empty_logs():
     assert len(card.log_entries) == 0
 
 
-def test_log_preview_update_with_logs():
+def test_log_preview_update_with_logs(mounted):
     """测试日志列表更新"""
     card = LogPreviewCard()
     card.build()
     
     logs = [
-        {
-            "timestamp": "2024-01-01 12:00:00",
-            "process_name": "pmhq",
-            "level": "stdout",
-            "message": "Test message 1"
-        },
-        {
-            "timestamp": "2024-01-01 12:00:01",
-            "process_name": "llbot",
-            "level": "stderr",
-            "message": "Test message 2"
-        }
+        LogEntry(
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            process_name="pmhq",
+            level="stdout",
+            message="Test message 1"
+        ),
+        LogEntry(
+            timestamp=datetime(2024, 1, 1, 12, 0, 1),
+            process_name="llbot",
+            level="stderr",
+            message="Test message 2"
+        )
     ]
     
-    card.update_logs(logs)
+    assert card.update_logs(logs, seq=2) is True
+    assert len(card.log_entries) == 2
+    assert card._empty_container.visible is False
+    assert card._log_texts[0].value == "[12:00:00] [pmhq] Test message 1"
+    assert card._log_texts[1].value == "[12:00:01] [llbot] Test message 2"
+    assert [row.visible for row in card._log_row_containers[:3]] == [True, True, False]
+    
+    # 序号未变化时跳过刷新
+    assert card.update_logs([], seq=2) is False
     assert len(card.log_entries) == 2
+    
+    # LLBot 的日志自带时间和来源，直接显示原文
+    logs.append(LogEntry(
+        timestamp=datetime(2024, 1, 1, 12, 0, 2),
+        process_name="LLBot",
+        level="stdout",
+        message="[LLBot] ready"
+    ))
+    assert card.update_logs(logs, seq=3) is True
+    assert card._log_texts[0].value == "[12:00:00] [pmhq] Test message 1"
+    assert card._log_texts[2].value == "[LLBot] ready"
 
 
-def test_log_preview_limits_to_10_entries():
+def test_log_preview_limits_to_10_entries(mounted):
     """测试日志预览限制为10条"""
     card = LogPreviewCard()
     card.build()
     
     # 创建15条日志
     logs = [
-        {
-            "timestamp": f"2024-01-01 12:00:{i:02d}",
-            "process_name": "pmhq",
-            "level": "stdout",
-            "message": f"Test message {i}"
-        }
+        LogEntry(
+            timestamp=datetime(2024, 1, 1, 12, 0, i),
+            process_name="pmhq",
+            level="stdout",
+            message=f"Test message {i}"
+        )
         for i in range(15)
     ]
     
@@ -97,5 +125,133 @@ def test_log_preview_limits_to_10_entries():
     # 应该只保留最新的10条
     assert len(card.log_entries) == 10
     # 验证是最新的10条（索引5-14）
-    assert card.log_entries[0]["message"] == "Test message 5"
-    assert card.log_entries[-1]["message"] == "Test message 14"
+    assert card.log_entries[0].message == "Test message 5"
+    assert card.log_entries[-1].message == "Test message 14"
+    assert card._log_texts[0].value.endswith("Test message 5")
+    assert card._log_texts[-1].value.endswith("Test message 14")
+
+
+def test_start_all_services_releases_guard_on_exception():
+    """测试启动序列抛出异常后释放进行中标记，后续启动不会被忽略"""
+    home_page = HomePage(ProcessManager(), ConfigManager())
+    calls = []
+    
+    def failing_sequence():
+        calls.append(home_page._start_in_progress.locked())
+        raise RuntimeError("boom")
+    
+    home_page._run_start_sequence = failing_sequence
+    with pytest.raises(RuntimeError):
+        home_page._start_all_services()
+    assert not home_page._start_in_progress.locked()
+    
+    home_page._run_start_sequence = lambda: calls.append(home_page._start_in_progress.locked())
+    home_page._start_all_services()
+    assert calls == [True, True]
+    assert not home_page._start_in_progress.locked()
+
+
+def test_start_all_services_ignores_concurrent_request():
+    """测试启动序列进行中时，其他线程的启动请求被忽略"""
+    import threading
+    home_page = HomePage(ProcessManager(), ConfigManager())
+    entered = threading.Event()
+    release = threading.Event()
+    calls = []
+    
+    def slow_sequence():
+        calls.append(threading.current_thread().name)
+        entered.set()
+        release.wait(5)
+    
+    home_page._run_start_sequence = slow_sequence
+    worker = threading.Thread(target=home_page._start_all_services, name="first")
+    worker.start()
+    assert entered.wait(5)
+    home_page._start_all_services()
+    release.set()
+    worker.join(5)
+    assert calls == ["first"]
+    assert not home_page._start_in_progress.locked()
+
+
+def _steady_sample():
+    return {"bot": (1.0, 100.0, True), "qq": (2.0, 200.0, True, ""), "system_cpu": 5.0}
+
+
+def test_one_off_resource_refresh_does_not_adapt_period():
+    """测试临时采样不参与刷新周期的调整，只有周期性采样会放大周期"""
+    home_page = HomePage(ProcessManager(), ConfigManager())
+    home_page.build()
+    initial = home_page.refresh_period
+    for _ in range(10):
+        home_page._apply_resources(_steady_sample())
+    assert home_page.refresh_period == initial
+    
+    for _ in range(10):
+        home_page._apply_resources(_steady_sample(), adapt=True)
+    assert home_page.refresh_period > initial
+
+
+def test_refresh_all_resets_period_on_new_logs():
+    """测试资源稳定时出现新日志会恢复默认刷新周期"""
+    home_page = HomePage(ProcessManager(), ConfigManager())
+    home_page.build()
+    initial = home_page.refresh_period
+    
+    class _Control:
+        page = None
+    
+    class _LogCard:
+        control = object()
+        changed = False
+        
+        def update_logs(self, log_entries, seq=None):
+            return self.changed
+    
+    home_page.page = object()
+    home_page.control = _Control()
+    home_page.control.page = home_page.page
+    home_page.log_card = _LogCard()
+    home_page._collect_resources_sync = _steady_sample
+    home_page._safe_update = lambda *controls: None
+    
+    for _ in range(10):
+        home_page.refresh_all([], 0)
+    assert home_page.refresh_period > initial
+    
+    home_page.log_card.changed = True
+    home_page.refresh_all([], 1)
+    assert home_page.refresh_period == initial
+
+
+def test_reopen_dialog_waits_for_pending_dismiss():
+    """测试关闭后 dismiss 尚未处理时再次打开，对话框在 dismiss 完成后重新显示"""
+    home_page = HomePage(ProcessManager(), ConfigManager())
+    
+    class _Page:
+        def __init__(self):
+            self.dialogs = []
+        
+        def show_dialog(self, dialog):
+            if dialog in self.dialogs:
+                raise RuntimeError("Dialog is already opened")
+            dialog.open = True
+            self.dialogs.append(dialog)
+    
+    page = _Page()
+    home_page.page = page
+    home_page._show_error_dialog("启动失败", "first")
+    dialog = home_page._error_dialog
+    assert dialog.open is True
+    
+    # 已关闭但 dismiss 事件尚未到达，对话框仍在栈中
+    dialog.open = False
+    home_page._show_error_dialog("启动失败", "second")
+    assert dialog.open is False
+    
+    page.dialogs.remove(dialog)
+    home_page._on_reusable_dialog_dismiss(ft.Event("dismiss", dialog))
+    assert dialog.open is True
+    assert page.dialogs == [dialog]
+    assert dialog.content.value == "second"
@@ -169,3 +169,62 @@ def test_log_entry_dataclass():
     assert entry.process_name == "pmhq"
     assert entry.level == "stdout"
     assert entry.message == "Test message"
+
+
+def test_log_entry_time_text_cached():
+    """测试时间文本只格式化一次"""
+    entry = LogEntry(
+        timestamp=datetime(2024, 1, 2, 3, 4, 5),
+        process_name="pmhq",
+        level="stdout",
+        message="Test message"
+    )
+    
+    assert entry.time_text() == "03:04:05"
+    entry.timestamp = datetime(2024, 1, 2, 6, 7, 8)
+    assert entry.time_text() == "03:04:05"
+
+
+def test_async_collector_seq_unique_under_concurrent_push():
+    """测试多线程并发推送时每条日志的序号唯一且连续"""
+    import threading
+    from core.async_log_collector import AsyncLogCollector, LogEntry as AsyncLogEntry
+    
+    collector = AsyncLogCollector(max_lines=10000)
+    collector._write_to_log_file = lambda entry: None
+    
+    def push(name):
+        for i in range(500):
+            collector._push_log(AsyncLogEntry(datetime.now(), name, "stdout", str(i)))
+    
+    threads = [threading.Thread(target=push, args=(f"p{n}",)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    seqs = sorted(e.seq for e in collector.get_logs())
+    assert seqs == list(range(1, 2001))
+    assert collector._seq == 2000
+
+
+def test_async_collector_add_system_log():
+    """测试系统日志经过统一入口追加并分配序号"""
+    from core.async_log_collector import AsyncLogCollector
+    
+    collector = AsyncLogCollector()
+    collector.add_system_log("正在启动...")
+    
+    logs = collector.get_logs()
+    assert len(logs) == 1
+    assert logs[0].process_name == "系统"
+    assert logs[0].message == "正在启动..."
+    assert logs[0].seq == collector.seq == 1
+
+
+def test_seq_property_tracks_changes():
+    """测试seq属性在清空日志时递增"""
+    collector = LogCollector()
+    before = collector.seq
+    collector.clear_logs()
+    assert collector.seq == before + 1
@@ -224,6 +224,22 @@ class TestProcessManager:
         assert pids["pmhq"] is None
         assert pids["llbot"] is None
     
+    def test_get_all_pids_reuses_result_until_processes_change(self):
+        """测试托管进程未变化时短时间内复用get_all_pids结果"""
+        from core.process_manager import ProcessManager
+        
+        pm = ProcessManager()
+        process = Mock(pid=1234)
+        process.poll.return_value = None
+        pm._processes["llbot"] = process
+        
+        assert pm.get_all_pids()["llbot"] == 1234
+        assert pm.get_all_pids()["llbot"] == 1234
+        assert process.poll.call_count == 1
+        
+        del pm._processes["llbot"]
+        assert pm.get_all_pids()["llbot"] is None
+    
     def test_get_process_status_default_stopped(self):
         """测试默认进程状态为STOPPED"""
         from core.process_manager import ProcessManager, ProcessStatus
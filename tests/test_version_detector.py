@@ -0,0 +1,48 @@
+"""测试版本检测模块"""
+
+import json
+import os
+
+from core.version_detector import VersionDetector
+
+
+def _write_package(directory, version):
+    with open(directory / 'package.json', 'w', encoding='utf-8') as f:
+        json.dump({"version": version}, f)
+
+
+def test_detect_llbot_version_cached_until_package_changes(tmp_path):
+    """测试文件未变化时复用缓存，package.json 变化后重新检测"""
+    script = tmp_path / 'llbot.js'
+    script.write_text('// llbot\n', encoding='utf-8')
+    _write_package(tmp_path, '1.0.0')
+    detector = VersionDetector()
+    assert detector.detect_llbot_version(str(script)) == '1.0.0'
+    
+    calls = []
+    original = detector._detect_llbot_version
+    detector._detect_llbot_version = lambda path: calls.append(path) or original(path)
+    assert detector.detect_llbot_version(str(script)) == '1.0.0'
+    assert calls == []
+    
+    _write_package(tmp_path, '1.0.10')
+    pkg = tmp_path / 'package.json'
+    st = os.stat(pkg)
+    os.utime(pkg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert detector.detect_llbot_version(str(script)) == '1.0.10'
+    assert len(calls) == 1
+
+
+def test_clear_cache_forces_redetect(tmp_path):
+    """测试清空缓存后重新检测版本"""
+    pmhq = tmp_path / 'pmhq.exe'
+    pmhq.write_bytes(b'')
+    _write_package(tmp_path, '2.0.0')
+    detector = VersionDetector()
+    assert detector.detect_pmhq_version(str(pmhq)) == '2.0.0'
+    
+    calls = []
+    detector._detect_pmhq_version = lambda path: calls.append(path) or '2.0.1'
+    detector.clear_cache()
+    assert detector.detect_pmhq_version(str(pmhq)) == '2.0.1'
+    assert calls == [str(pmhq)]
@@ -1,135 +1,236 @@
 """系统配置页面"""
 
+import os
+import sys
+import logging
 import flet as ft
 import tkinter as tk
 from tkinter import filedialog
 import threading
+import queue
 import subprocess
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict
 from pathlib import Path
 from core.config_manager import ConfigManager, ConfigError
 from utils.startup_manager import is_startup_enabled, enable_startup, disable_startup
 
+logger = logging.getLogger(__name__)
+
+_FOLDER_OPEN_ICON = ft.Icons.FOLDER_OPEN
+_EXE_FILETYPES = (("可执行文件", "*.exe"), ("所有文件", "*.*"))
+_JS_FILETYPES = (("JavaScript文件", "*.js"), ("所有文件", "*.*"))
+# (配置键, 标签, 提示, 文件对话框标题, 文件类型)
+_PATH_FIELD_SPECS = (
+    ("qq_path", "QQ路径", "QQ可执行文件的路径",
+     "选择QQ可执行文件", _EXE_FILETYPES),
+    ("pmhq_path", "PMHQ路径", "pmhq.exe的路径",
+     "选择PMHQ可执行文件", _EXE_FILETYPES),
+    ("llbot_path", "LLBot路径", "llbot.js的路径",
+     "选择LLBot脚本文件", _JS_FILETYPES),
+    ("node_path", "Node.js路径", "node.exe的路径",
+     "选择Node.js可执行文件", _EXE_FILETYPES),
+)
+_PATH_KEYS = tuple(spec[0] for spec in _PATH_FIELD_SPECS)
+_VALIDATE_DELAY = 0.3
+
+
+def _section_header(icon, title: str) -> ft.Row:
+    return ft.Row([
+        ft.Icon(icon, size=24, color=ft.Colors.PRIMARY),
+        ft.Text(title, size=22, weight=ft.FontWeight.W_600),
+    ], spacing=10)
+
+
+def _section_card(content: ft.Control) -> ft.Card:
+    return ft.Card(
+        content=ft.Container(content=content, padding=24),
+        elevation=3,
+    )
+
+
+_LogCleaner = None
+
+
+def _get_log_cleaner_class():
+    """main 模块会导入 ui 包，LogCleaner 只能在首次使用时解析，之后复用缓存"""
+    global _LogCleaner
+    if _LogCleaner is None:
+        # 以脚本方式运行时 main 是 __main__，直接 import main 会把入口模块再执行一遍
+        cls = getattr(sys.modules.get("__main__"), "LogCleaner", None)
+        if cls is None:
+            from main import LogCleaner as cls
+        _LogCleaner = cls
+    return _LogCleaner
+
+
+_picker_queue: Optional[queue.Queue] = None
+
+
+def _picker_worker(jobs: queue.Queue):
+    # Tk 对象只能在创建它的线程中使用，因此由同一个常驻线程持有隐藏的根窗口并串行处理所有选择请求
+    root = None
+    while True:
+        job = jobs.get()
+        try:
+            if root is None:
+                root = tk.Tk()
+                root.withdraw()
+            root.attributes('-topmost', True)
+            job(root)
+        except tk.TclError:
+            # 根窗口失效时销毁，下次请求重新创建
+            logger.exception("文件选择对话框出错，重建 Tk 根窗口")
+            if root is not None:
+                try:
+                    root.destroy()
+                except tk.TclError:
+                    pass
+            root = None
+        except Exception:
+            logger.exception("文件选择对话框出错")
+
 
 def _pick_file_native(callback, title="选择文件", filetypes=None, initial_dir=None):
     """使用 tkinter 原生文件对话框（Flet 0.80 的 FilePicker 在 desktop 模式有 bug）"""
-    def _pick():
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
-        
-        kwargs = {"title": title}
+    global _picker_queue
+    
+    def _pick(root):
+        kwargs = {"title": title, "parent": root}
         if filetypes:
             kwargs["filetypes"] = filetypes
         if initial_dir:
             kwargs["initialdir"] = initial_dir
         
         file_path = filedialog.askopenfilename(**kwargs)
-        root.destroy()
         if file_path:
             callback(file_path)
     
-    threading.Thread(target=_pick, daemon=True).start()
+    if _picker_queue is None:
+        _picker_queue = queue.Queue()
+        threading.Thread(target=_picker_worker, args=(_picker_queue,), daemon=True).start()
+    _picker_queue.put(_pick)
 
 
 class ConfigPage:
+    # 所有实例共用一个清理队列和守护线程，连续保存时清理任务串行执行，且不会阻塞进程退出
+    _cleanup_queue: Optional[queue.Queue] = None
+    _log_cleaner = None
+    
+    # (控件属性名, 配置键, 默认值)，refresh 时按表逐项比对
+    _FIELD_BINDINGS = (
+        ("qq_path_field", "qq_path", ""),
+        ("pmhq_path_field", "pmhq_path", ""),
+        ("llbot_path_field", "llbot_path", ""),
+        ("node_path_field", "node_path", ""),
+        ("auto_login_qq_field", "auto_login_qq", ""),
+        ("auto_start_bot_checkbox", "auto_start_bot", False),
+        ("headless_checkbox", "headless", False),
+        ("minimize_to_tray_on_start_checkbox", "minimize_to_tray_on_start", False),
+        ("startup_command_enabled_checkbox", "startup_command_enabled", False),
+        ("startup_command_field", "startup_command", ""),
+        ("log_save_enabled_checkbox", "log_save_enabled", True),
+    )
+    
     def __init__(self, config_manager: ConfigManager,
                  on_config_saved: Optional[Callable] = None):
         self.config_manager = config_manager
         self.on_config_saved = on_config_saved
         self.control = None
         self.current_config = {}
+        # current_config 是否来自成功读取的配置文件；读取失败时为默认值，保存时不能据此判断无变化
+        self._config_valid = False
         self._page = None
-        
-    def build(self):
+        self._retention_hours = 168
+        self._last_snack = None
+        self._config_mtime = None
+        self._content_built = False
+        self._default_config = None
+        self._validate_timers: Dict[str, threading.Timer] = {}
+        self._path_fields: Dict[str, ft.TextField] = {}
+        
+    def _defaults(self) -> dict:
+        if self._default_config is None:
+            self._default_config = self.config_manager.get_default_config()
+        # 返回副本，调用方修改不会污染缓存
+        return dict(self._default_config)
+    
+    def _get_config_mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.config_manager.config_path)
+        except OSError:
+            return None
+    
+    def build(self, lazy: bool = False):
+        """构建页面控件
+
+        Args:
+            lazy: 为 True 时只返回占位容器，实际内容在首次 on_page_enter() 时创建
+        """
+        # 重复导航时复用已构建的控件，仅在配置文件被修改过时刷新字段
+        if self.control is not None:
+            self.refresh()
+            return self.control
+        
+        self.control = ft.Container(expand=True)
+        if not lazy:
+            self._build_content()
+        return self.control
+    
+    def on_page_enter(self):
+        if not self._content_built:
+            self._build_content()
+    
+    def _build_content(self):
         # 加载当前配置
+        self._config_mtime = self._get_config_mtime()
         try:
             self.current_config = self.config_manager.load_config()
-        except ConfigError as e:
-            self.current_config = self.config_manager.get_default_config()
-        
-        # 创建输入字段
-        self.qq_path_field = ft.TextField(
-            label="QQ路径",
-            hint_text="QQ可执行文件的路径",
-            value=self.current_config.get("qq_path", ""),
-            expand=True,
-            read_only=False,
-            disabled=False,
-        )
-        
-        self.qq_path_button = ft.IconButton(
-            icon=ft.Icons.FOLDER_OPEN,
-            tooltip="选择文件",
-            on_click=self._on_select_qq_path
-        )
-        
-        self.pmhq_path_field = ft.TextField(
-            label="PMHQ路径",
-            hint_text="pmhq.exe的路径",
-            value=self.current_config.get("pmhq_path", ""),
-            expand=True,
-            read_only=False,
-            disabled=False,
-        )
-        
-        self.pmhq_path_button = ft.IconButton(
-            icon=ft.Icons.FOLDER_OPEN,
-            tooltip="选择文件",
-            on_click=self._on_select_pmhq_path
-        )
-        
-        self.llbot_path_field = ft.TextField(
-            label="LLBot路径",
-            hint_text="llbot.js的路径",
-            value=self.current_config.get("llbot_path", ""),
-            expand=True,
-            read_only=False,
-            disabled=False,
-        )
-        
-        self.llbot_path_button = ft.IconButton(
-            icon=ft.Icons.FOLDER_OPEN,
-            tooltip="选择文件",
-            on_click=self._on_select_llbot_path
-        )
-        
-        self.node_path_field = ft.TextField(
-            label="Node.js路径",
-            hint_text="node.exe的路径",
-            value=self.current_config.get("node_path", ""),
-            expand=True,
-            read_only=False,
-            disabled=False,
-        )
-        
-        self.node_path_button = ft.IconButton(
-            icon=ft.Icons.FOLDER_OPEN,
-            tooltip="选择文件",
-            on_click=self._on_select_node_path
-        )
+            self._config_valid = True
+        except ConfigError:
+            self.current_config = self._defaults()
+            self._config_valid = False
+        # 一次性合并默认值，后续直接按键取值
+        cfg = {**self._defaults(), **self.current_config}
+        
+        # 创建路径字段及其文件选择按钮
+        self._path_fields = {}
+        path_rows = []
+        for key, label, hint, picker_title, filetypes in _PATH_FIELD_SPECS:
+            field = ft.TextField(
+                label=label,
+                hint_text=hint,
+                value=cfg[key],
+                expand=True,
+                data=key,
+                on_change=self._on_path_change,
+            )
+            button = self._make_picker_button(key, self._make_path_picker(key, picker_title, filetypes))
+            setattr(self, f"{key}_field", field)
+            setattr(self, f"{key}_button", button)
+            self._path_fields[key] = field
+            path_rows.append(ft.Row([field, button], spacing=8))
         
         self.auto_login_qq_field = ft.TextField(
             label="自动登录QQ号",
             hint_text="启动时自动登录的QQ号",
-            value=self.current_config.get("auto_login_qq", ""),
+            value=cfg["auto_login_qq"],
             width=250,
             keyboard_type=ft.KeyboardType.NUMBER,
         )
         
         self.auto_start_bot_checkbox = ft.Checkbox(
             label="启动软件后自动启动bot",
-            value=self.current_config.get("auto_start_bot", False),
+            value=cfg["auto_start_bot"],
         )
         
         self.headless_checkbox = ft.Checkbox(
             label="无头模式（不显示QQ窗口，可能有掉线风险）",
-            value=self.current_config.get("headless", False),
+            value=cfg["headless"],
         )
         
         self.minimize_to_tray_on_start_checkbox = ft.Checkbox(
             label="启动后自动缩进托盘",
-            value=self.current_config.get("minimize_to_tray_on_start", False),
+            value=cfg["minimize_to_tray_on_start"],
         )
         
         self.startup_checkbox = ft.Checkbox(
@@ -140,13 +241,13 @@ class ConfigPage:
         
         self.startup_command_enabled_checkbox = ft.Checkbox(
             label="启用启动后自动运行命令",
-            value=self.current_config.get("startup_command_enabled", False),
+            value=cfg["startup_command_enabled"],
         )
         
         self.startup_command_field = ft.TextField(
             label="启动后自动运行命令",
             hint_text="启动后将以多进程形式运行此命令",
-            value=self.current_config.get("startup_command", ""),
+            value=cfg["startup_command"],
             multiline=True,
             min_lines=2,
             max_lines=4,
@@ -164,18 +265,20 @@ class ConfigPage:
         # 日志设置字段
         self.log_save_enabled_checkbox = ft.Checkbox(
             label="保存日志到文件",
-            value=self.current_config.get("log_save_enabled", True),
+            value=cfg["log_save_enabled"],
         )
         
         # 配置文件存秒数，UI显示小时数
-        retention_seconds = self.current_config.get("log_retention_seconds", 604800)
+        retention_seconds = cfg["log_retention_seconds"]
         retention_hours = retention_seconds // 3600 if retention_seconds > 0 else 0
+        self._retention_hours = retention_hours
         self.log_retention_hours_field = ft.TextField(
             label="日志保存时长（小时）",
             hint_text="0 表示永久保存",
             value=str(retention_hours),
             width=180,
             keyboard_type=ft.KeyboardType.NUMBER,
+            on_change=self._on_retention_hours_change,
         )
         
         # 悬浮保存按钮
@@ -208,90 +311,34 @@ class ConfigPage:
             ft.Divider(height=2, thickness=2, color=ft.Colors.PRIMARY),
             
             # 启动选项区域
-            ft.Row([
-                ft.Icon(ft.Icons.PLAY_CIRCLE, size=24, color=ft.Colors.PRIMARY),
-                ft.Text(
-                    "启动选项",
-                    size=22,
-                    weight=ft.FontWeight.W_600
-                ),
-            ], spacing=10),
-            ft.Card(
-                content=ft.Container(
-                    content=ft.Column([
-                        self.auto_login_qq_field,
-                        self.auto_start_bot_checkbox,
-                        self.headless_checkbox,
-                        self.minimize_to_tray_on_start_checkbox,
-                        self.startup_checkbox,
-                        ft.Divider(height=16),
-                        ft.Row([
-                            self.startup_command_enabled_checkbox,
-                            self.test_command_button,
-                        ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
-                        self.startup_command_field,
-                    ], spacing=16),
-                    padding=24,
-                ),
-                elevation=3,
-            ),
+            _section_header(ft.Icons.PLAY_CIRCLE, "启动选项"),
+            _section_card(ft.Column([
+                self.auto_login_qq_field,
+                self.auto_start_bot_checkbox,
+                self.headless_checkbox,
+                self.minimize_to_tray_on_start_checkbox,
+                self.startup_checkbox,
+                ft.Divider(height=16),
+                ft.Row([
+                    self.startup_command_enabled_checkbox,
+                    self.test_command_button,
+                ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                self.startup_command_field,
+            ], spacing=16)),
             
             # 日志设置区域
-            ft.Row([
-                ft.Icon(ft.Icons.ARTICLE, size=24, color=ft.Colors.PRIMARY),
-                ft.Text(
-                    "日志设置",
-                    size=22,
-                    weight=ft.FontWeight.W_600
-                ),
-            ], spacing=10),
-            ft.Card(
-                content=ft.Container(
-                    content=ft.Column([
-                        self.log_save_enabled_checkbox,
-                        ft.Row([
-                            self.log_retention_hours_field,
-                            ft.Text("（0 表示永久保存）", size=12, color=ft.Colors.GREY_500),
-                        ], spacing=8, vertical_alignment=ft.CrossAxisAlignment.CENTER),
-                    ], spacing=16),
-                    padding=24,
-                ),
-                elevation=3,
-            ),
+            _section_header(ft.Icons.ARTICLE, "日志设置"),
+            _section_card(ft.Column([
+                self.log_save_enabled_checkbox,
+                ft.Row([
+                    self.log_retention_hours_field,
+                    ft.Text("（0 表示永久保存）", size=12, color=ft.Colors.GREY_500),
+                ], spacing=8, vertical_alignment=ft.CrossAxisAlignment.CENTER),
+            ], spacing=16)),
             
             # 路径配置区域
-            ft.Row([
-                ft.Icon(ft.Icons.FOLDER, size=24, color=ft.Colors.PRIMARY),
-                ft.Text(
-                    "路径配置",
-                    size=22,
-                    weight=ft.FontWeight.W_600
-                ),
-            ], spacing=10),
-            ft.Card(
-                content=ft.Container(
-                    content=ft.Column([
-                        ft.Row([
-                            self.qq_path_field,
-                            self.qq_path_button,
-                        ], spacing=8),
-                        ft.Row([
-                            self.pmhq_path_field,
-                            self.pmhq_path_button,
-                        ], spacing=8),
-                        ft.Row([
-                            self.llbot_path_field,
-                            self.llbot_path_button,
-                        ], spacing=8),
-                        ft.Row([
-                            self.node_path_field,
-                            self.node_path_button,
-                        ], spacing=8),
-                    ], spacing=16),
-                    padding=24,
-                ),
-                elevation=3,
-            ),
+            _section_header(ft.Icons.FOLDER, "路径配置"),
+            _section_card(ft.Column(path_rows, spacing=16)),
             
             # 底部留白
             ft.Container(height=60),
@@ -308,26 +355,23 @@ class ConfigPage:
             expand=True,
         )
         
-        self.control = ft.Stack([
+        self.control.content = ft.Stack([
             scrollable_content,
             floating_buttons,
         ], expand=True)
-        
-        # 明确设置所有路径字段为可编辑状态
-        self.qq_path_field.read_only = False
-        self.qq_path_field.disabled = False
-        self.pmhq_path_field.read_only = False
-        self.pmhq_path_field.disabled = False
-        self.llbot_path_field.read_only = False
-        self.llbot_path_field.disabled = False
-        self.node_path_field.read_only = False
-        self.node_path_field.disabled = False
-        
-        return self.control
+        self._content_built = True
 
     
+    @staticmethod
+    def _make_picker_button(key: str, on_click: Callable) -> ft.IconButton:
+        return ft.IconButton(
+            icon=_FOLDER_OPEN_ICON,
+            tooltip="选择文件",
+            data=key,
+            on_click=on_click,
+        )
+    
     def _get_initial_directory(self, current_path: str) -> str:
-        import os
         if not current_path:
             return os.getcwd()
         
@@ -346,57 +390,48 @@ class ConfigPage:
         else:
             return os.getcwd()
     
-    def _on_select_qq_path(self, e):
-        initial_dir = self._get_initial_directory(self.qq_path_field.value)
-        def on_selected(path):
-            self.qq_path_field.value = path
-            if self._page:
-                self._page.update()
-        _pick_file_native(
-            on_selected,
-            title="选择QQ可执行文件",
-            filetypes=[("可执行文件", "*.exe"), ("所有文件", "*.*")],
-            initial_dir=initial_dir
-        )
+    def _make_path_picker(self, key: str, title: str, filetypes: tuple) -> Callable:
+        def handler(e):
+            _pick_file_native(
+                lambda path: self._on_path_selected(key, path),
+                title=title,
+                filetypes=filetypes,
+                initial_dir=self._get_initial_directory(self._path_fields[key].value),
+            )
+        return handler
     
-    def _on_select_pmhq_path(self, e):
-        initial_dir = self._get_initial_directory(self.pmhq_path_field.value)
-        def on_selected(path):
-            self.pmhq_path_field.value = path
-            if self._page:
-                self._page.update()
-        _pick_file_native(
-            on_selected,
-            title="选择PMHQ可执行文件",
-            filetypes=[("可执行文件", "*.exe"), ("所有文件", "*.*")],
-            initial_dir=initial_dir
-        )
+    def _on_path_selected(self, key: str, path: str):
+        field = self._path_fields.get(key)
+        if field is None:
+            return
+        field.value = path
+        # 只同步被修改的字段，而不是整页
+        self._safe_update(field)
+        self._schedule_validation(key, field)
     
-    def _on_select_llbot_path(self, e):
-        initial_dir = self._get_initial_directory(self.llbot_path_field.value)
-        def on_selected(path):
-            self.llbot_path_field.value = path
-            if self._page:
-                self._page.update()
-        _pick_file_native(
-            on_selected,
-            title="选择LLBot脚本文件",
-            filetypes=[("JavaScript文件", "*.js"), ("所有文件", "*.*")],
-            initial_dir=initial_dir
-        )
+    def _on_path_change(self, e):
+        self._schedule_validation(e.control.data, e.control)
     
-    def _on_select_node_path(self, e):
-        initial_dir = self._get_initial_directory(self.node_path_field.value)
-        def on_selected(path):
-            self.node_path_field.value = path
-            if self._page:
-                self._page.update()
-        _pick_file_native(
-            on_selected,
-            title="选择Node.js可执行文件",
-            filetypes=[("可执行文件", "*.exe"), ("所有文件", "*.*")],
-            initial_dir=initial_dir
-        )
+    def _schedule_validation(self, key: str, field: ft.TextField):
+        # 路径校验会访问文件系统，停止输入一段时间后再在后台线程执行
+        timer = self._validate_timers.get(key)
+        if timer is not None:
+            timer.cancel()
+        timer = threading.Timer(_VALIDATE_DELAY, self._validate_path_field, args=(key, field))
+        timer.daemon = True
+        self._validate_timers[key] = timer
+        timer.start()
+    
+    def _validate_path_field(self, key: str, field: ft.TextField):
+        # 清空其他路径字段，使校验结果只反映当前字段
+        config = dict(self.current_config)
+        config.update(dict.fromkeys(_PATH_KEYS, ""))
+        config[key] = field.value.strip()
+        is_valid, error_msg = self.config_manager.validate_config(config)
+        error = None if is_valid else error_msg
+        if field.error != error:
+            field.error = error
+            self._safe_update(field)
     
     def _on_startup_change(self, e):
         if e.control.value:
@@ -405,22 +440,21 @@ class ConfigPage:
             if not auto_login_qq:
                 self._show_startup_confirm_dialog()
             else:
-                self._enable_startup_and_auto_start()
+                self._run_in_background(self._enable_startup_and_auto_start)
         else:
-            disable_startup()
+            self._run_in_background(disable_startup)
     
     def _show_startup_confirm_dialog(self):
         def on_confirm(e):
             if self._page:
                 self._page.pop_dialog()
-            self._enable_startup_and_auto_start()
+            self._run_in_background(self._enable_startup_and_auto_start)
         
         def on_cancel(e):
-            if self._page:
-                self._page.pop_dialog()
             self.startup_checkbox.value = False
             if self._page:
-                self._page.update()
+                self._page.pop_dialog()
+            self._safe_update(self.startup_checkbox)
         
         dialog = ft.AlertDialog(
             modal=True,
@@ -439,14 +473,13 @@ class ConfigPage:
     def _enable_startup_and_auto_start(self):
         if enable_startup():
             # 同时勾选"启动后自动启动bot"
-            self.auto_start_bot_checkbox.value = True
-            if self._page:
-                self._page.update()
+            if not self.auto_start_bot_checkbox.value:
+                self.auto_start_bot_checkbox.value = True
+                self._safe_update(self.auto_start_bot_checkbox)
         else:
             self.startup_checkbox.value = False
+            self._safe_update(self.startup_checkbox)
             self._show_error("启用开机自启失败")
-            if self._page:
-                self._page.update()
     
     def _on_test_command(self, e):
         command = self.startup_command_field.value.strip()
@@ -468,109 +501,198 @@ class ConfigPage:
         
         threading.Thread(target=run_command, daemon=True).start()
     
+    def _on_retention_hours_change(self, e):
+        # 输入时即过滤非数字字符，保存时直接使用解析好的小时数
+        value = e.control.value
+        if not value.isdecimal():
+            # 常见的纯数字输入不会走到这里，无需逐字符过滤
+            value = "".join(c for c in value if c.isdecimal())
+            if value != e.control.value:
+                e.control.value = value
+                self._safe_update(e.control)
+        self._retention_hours = int(value) if value else 168
+    
     def _on_save_config(self, e):
-        try:
-            config = self.config_manager.load_config()
-        except ConfigError:
-            config = self.config_manager.get_default_config()
-        
-        try:
-            config["qq_path"] = self.qq_path_field.value.strip()
-            config["pmhq_path"] = self.pmhq_path_field.value.strip()
-            config["llbot_path"] = self.llbot_path_field.value.strip()
-            config["node_path"] = self.node_path_field.value.strip()
-            config["auto_login_qq"] = self.auto_login_qq_field.value.strip()
-            config["auto_start_bot"] = self.auto_start_bot_checkbox.value
-            config["headless"] = self.headless_checkbox.value
-            config["minimize_to_tray_on_start"] = self.minimize_to_tray_on_start_checkbox.value
-            config["startup_command_enabled"] = self.startup_command_enabled_checkbox.value
-            config["startup_command"] = self.startup_command_field.value.strip()
-            config["log_save_enabled"] = self.log_save_enabled_checkbox.value
-            # 解析日志保存时长（UI输入小时，保存为秒）
-            retention_hours_str = self.log_retention_hours_field.value.strip()
-            retention_hours = int(retention_hours_str) if retention_hours_str else 168
-            config["log_retention_seconds"] = retention_hours * 3600
-        except ValueError:
-            self._show_error("配置数据无效")
-            return
-        
-        # 验证配置
-        is_valid, error_msg = self.config_manager.validate_config(config)
-        if not is_valid:
-            self._show_error(f"配置验证失败: {error_msg}")
+        updates = {
+            "qq_path": self.qq_path_field.value.strip(),
+            "pmhq_path": self.pmhq_path_field.value.strip(),
+            "llbot_path": self.llbot_path_field.value.strip(),
+            "node_path": self.node_path_field.value.strip(),
+            "auto_login_qq": self.auto_login_qq_field.value.strip(),
+            "auto_start_bot": self.auto_start_bot_checkbox.value,
+            "headless": self.headless_checkbox.value,
+            "minimize_to_tray_on_start": self.minimize_to_tray_on_start_checkbox.value,
+            "startup_command_enabled": self.startup_command_enabled_checkbox.value,
+            "startup_command": self.startup_command_field.value.strip(),
+            "log_save_enabled": self.log_save_enabled_checkbox.value,
+            # UI输入小时，保存为秒
+            "log_retention_seconds": self._retention_hours * 3600,
+        }
+        
+        if self._config_valid and all(self.current_config.get(key) == value for key, value in updates.items()):
+            self._show_success("配置无变化")
             return
         
-        # 保存配置
-        success = self.config_manager.save_config(config)
-        if success:
+        # 读取、验证和写入配置都涉及磁盘 I/O，放到后台线程执行，期间禁用保存按钮防止重复提交
+        self.save_button.disabled = True
+        self._safe_update(self.save_button)
+        self._run_in_background(self._do_save, updates)
+    
+    def _do_save(self, updates: dict):
+        try:
+            try:
+                config = self.config_manager.load_config()
+            except ConfigError:
+                config = self._defaults()
+            log_settings_changed = any(
+                config.get(key) != updates[key]
+                for key in ("log_retention_seconds", "log_save_enabled")
+            )
+            config.update(updates)
+            
+            is_valid, error_msg = self.config_manager.validate_config(config)
+            if not is_valid:
+                self._show_error(f"配置验证失败: {error_msg}")
+                return
+            
+            if not self.config_manager.save_config(config):
+                self._show_error("配置保存失败，请检查文件权限")
+                return
+            
             self.current_config = config
+            self._config_valid = True
+            self._config_mtime = self._get_config_mtime()
             self._show_success("配置保存成功")
             
-            # 触发日志清理（如果保存天数有变化）
-            self._trigger_log_cleanup()
+            # 只修改路径等字段时不必扫描日志目录
+            if log_settings_changed:
+                self._trigger_log_cleanup()
             
-            # 调用回调函数
             if self.on_config_saved:
                 self.on_config_saved(config)
-        else:
-            self._show_error("配置保存失败，请检查文件权限")
+        finally:
+            self.save_button.disabled = False
+            self._safe_update(self.save_button)
     
     def _trigger_log_cleanup(self):
         try:
-            from main import LogCleaner
-            log_cleaner = LogCleaner()
+            if ConfigPage._log_cleaner is None:
+                ConfigPage._log_cleaner = _get_log_cleaner_class()()
             # 在后台线程中执行清理，避免阻塞UI
-            import threading
-            threading.Thread(target=log_cleaner.cleanup_now, daemon=True).start()
+            ConfigPage._get_cleanup_queue().put(ConfigPage._log_cleaner.cleanup_now)
         except Exception:
             pass  # 忽略清理失败
     
-    def _show_error(self, message: str):
+    @classmethod
+    def _get_cleanup_queue(cls) -> queue.Queue:
+        if cls._cleanup_queue is None:
+            cls._cleanup_queue = queue.Queue()
+            threading.Thread(target=cls._cleanup_worker, args=(cls._cleanup_queue,),
+                             name="log-cleanup", daemon=True).start()
+        return cls._cleanup_queue
+    
+    @staticmethod
+    def _cleanup_worker(jobs: queue.Queue):
+        while True:
+            job = jobs.get()
+            try:
+                job()
+            except Exception:
+                logger.exception("日志清理失败")
+    
+    def _run_in_background(self, func: Callable, *args):
+        # 未挂载到页面时（如测试中）没有线程池可用，直接同步执行
         if self._page:
-            snack = ft.SnackBar(
-                content=ft.Text(message, color=ft.Colors.WHITE),
-                bgcolor=ft.Colors.RED_600,
-                duration=2000,
-            )
-            self._page.overlay.append(snack)
-            snack.open = True
-            self._page.update()
+            self._page.run_thread(func, *args)
+        else:
+            func(*args)
+    
+    def _safe_update(self, *controls):
+        """更新指定控件（默认整个配置页），未挂载到页面时静默跳过"""
+        # 先检查页面引用，启动阶段或测试中无需进入异常路径
+        if self._page is None or self.control is None:
+            return
+        for control in controls or (self.control,):
+            try:
+                control.update()
+            except Exception:
+                pass
+    
+    def _show_message(self, message: str, bgcolor):
+        page = self._page
+        if not page:
+            return
+        # 连续点击保存等场景下同一条提示仍在显示，无需再推送一次整页更新
+        last = self._last_snack
+        if last is not None and last.open and last.bgcolor == bgcolor and last.content.value == message:
+            return
+        
+        snack = ft.SnackBar(
+            content=ft.Text(message, color=ft.Colors.WHITE),
+            bgcolor=bgcolor,
+            duration=2000,
+            on_dismiss=self._on_snack_dismiss,
+        )
+        # 用新提示替换上一条，避免 overlay 中的 SnackBar 不断累积
+        if last is not None and last in page.overlay:
+            page.overlay.remove(last)
+        page.overlay.append(snack)
+        snack.open = True
+        self._last_snack = snack
+        page.update()
+    
+    def _on_snack_dismiss(self, e):
+        e.control.open = False
+    
+    def _show_error(self, message: str):
+        self._show_message(message, ft.Colors.RED_600)
     
     def _show_success(self, message: str):
-        if self._page:
-            snack = ft.SnackBar(
-                content=ft.Text(message, color=ft.Colors.WHITE),
-                bgcolor=ft.Colors.GREEN_600,
-                duration=2000,
-            )
-            self._page.overlay.append(snack)
-            snack.open = True
-            self._page.update()
+        self._show_message(message, ft.Colors.GREEN_600)
     
     def refresh(self):
+        if not self._content_built:
+            return
+        # 开机自启状态保存在系统中而非配置文件，可能在应用外被修改，每次都重新读取
+        startup_enabled = is_startup_enabled()
+        startup_changed = self.startup_checkbox.value != startup_enabled
+        if startup_changed:
+            self.startup_checkbox.value = startup_enabled
+        
+        # 配置文件自上次加载后未被修改时，无需重新读取和解析 JSON
+        mtime = self._get_config_mtime()
+        if mtime is not None and mtime == self._config_mtime:
+            if startup_changed:
+                self._safe_update(self.startup_checkbox)
+            return
         try:
-            self.current_config = self.config_manager.load_config()
+            new_config = self.config_manager.load_config()
+            self._config_valid = True
+            self._config_mtime = mtime
+            if new_config == self.current_config:
+                if startup_changed:
+                    self._safe_update(self.startup_checkbox)
+                return
+            self.current_config = new_config
             
-            self.qq_path_field.value = self.current_config.get("qq_path", "")
-            self.pmhq_path_field.value = self.current_config.get("pmhq_path", "")
-            self.llbot_path_field.value = self.current_config.get("llbot_path", "")
-            self.node_path_field.value = self.current_config.get("node_path", "")
-            self.auto_login_qq_field.value = self.current_config.get("auto_login_qq", "")
-            self.auto_start_bot_checkbox.value = self.current_config.get("auto_start_bot", False)
-            self.headless_checkbox.value = self.current_config.get("headless", False)
-            self.minimize_to_tray_on_start_checkbox.value = self.current_config.get("minimize_to_tray_on_start", False)
-            self.startup_checkbox.value = is_startup_enabled()
-            self.startup_command_enabled_checkbox.value = self.current_config.get("startup_command_enabled", False)
-            self.startup_command_field.value = self.current_config.get("startup_command", "")
-            self.log_save_enabled_checkbox.value = self.current_config.get("log_save_enabled", True)
-            retention_seconds = self.current_config.get("log_retention_seconds", 604800)
+            changed = startup_changed
+            for attr, key, default in self._FIELD_BINDINGS:
+                field = getattr(self, attr)
+                value = new_config.get(key, default)
+                if field.value != value:
+                    field.value = value
+                    changed = True
+            
+            retention_seconds = new_config.get("log_retention_seconds", 604800)
             retention_hours = retention_seconds // 3600 if retention_seconds > 0 else 0
-            self.log_retention_hours_field.value = str(retention_hours)
+            self._retention_hours = retention_hours
+            if self.log_retention_hours_field.value != str(retention_hours):
+                self.log_retention_hours_field.value = str(retention_hours)
+                changed = True
             
-            if self._page:
-                try:
-                    self._page.update()
-                except Exception:
-                    pass
+            # 只提交配置页自身的差异，而非整页
+            if changed:
+                self._safe_update()
         except ConfigError as e:
+            self._config_valid = False
             self._show_error(f"加载配置失败: {str(e)}")
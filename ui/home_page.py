@@ -3,16 +3,173 @@ from pathlib import Path
 import asyncio
 
 import flet as ft
-from typing import Optional, Callable, List
-from datetime import datetime
+from typing import Optional, Callable, Dict, List
 import psutil
+import logging
 import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from core.process_manager import ProcessManager, ProcessStatus
+from core.async_log_collector import LogEntry
 from core.config_manager import ConfigManager
 from core.update_checker import UpdateChecker, UpdateInfo
 from core.version_detector import VersionDetector
 from utils.downloader import Downloader, DownloadError
-from utils.constants import DEFAULT_CONFIG, NPM_PACKAGES, GITHUB_REPOS
+from utils.login_service import LoginService
+from utils.pmhq_client import PMHQClient
+from utils.qq_path import get_win_reg_qq_path, clear_win_reg_qq_path_cache
+from utils.constants import (
+    DEFAULT_CONFIG, NPM_PACKAGES, GITHUB_REPOS,
+    RESOURCE_MONITOR_INTERVAL, RESOURCE_MONITOR_MAX_INTERVAL,
+)
+from ui.login_dialog import LoginDialog
+
+logger = logging.getLogger(__name__)
+
+_CPU_COUNT = psutil.cpu_count() or 1
+_INV_CPU_COUNT = 1.0 / _CPU_COUNT
+
+# 资源卡片的最小刷新间隔（秒），间隔内只有数值明显变化时才更新控件
+_MIN_RESOURCE_UPDATE_INTERVAL = 0.5
+
+# 连续多少次采样的 CPU（百分点）与内存（MB）变化都低于阈值时，资源刷新周期翻倍
+_RESOURCE_STEADY_TICKS = 3
+_RESOURCE_STEADY_CPU_DELTA = 1.0
+_RESOURCE_STEADY_MEM_DELTA = 5.0
+
+# 资源卡片状态样式：(图标, 图标颜色, 文本, 文本颜色)
+_STATUS_NOT_DOWNLOADED = (ft.Icons.DOWNLOAD, ft.Colors.ORANGE_600, "未下载", ft.Colors.ORANGE_700)
+_STATUS_RUNNING = (ft.Icons.CHECK_CIRCLE, ft.Colors.GREEN_600, "运行中", ft.Colors.GREEN_700)
+_STATUS_STOPPED = (ft.Icons.CIRCLE, ft.Colors.GREY_400, "未启动", ft.Colors.GREY_600)
+
+# 日志预览行样式：(文本颜色, 图标, 图标颜色)
+_LOG_STYLE_STDERR = (ft.Colors.RED_700, ft.Icons.ERROR_OUTLINE, ft.Colors.RED_600)
+_LOG_STYLE_STDOUT = (ft.Colors.ON_SURFACE, ft.Icons.INFO_OUTLINE, ft.Colors.BLUE_600)
+_LOG_LIST_BGCOLOR = ft.Colors.with_opacity(0.05, ft.Colors.PRIMARY)
+
+# 全局启动按钮各状态样式共用的内边距与形状
+_START_BUTTON_PADDING = ft.Padding.symmetric(horizontal=40, vertical=16)
+_START_BUTTON_SHAPE = ft.RoundedRectangleBorder(radius=28)
+
+# 字节换算为 MB 的系数，用乘法代替两次除法
+_MB_INV = 1.0 / 1048576
+
+# 可用内存变化缓慢，多张卡片在同一刷新周期内共用一次采样
+_AVAILABLE_MEMORY_TTL = 2.0
+_available_memory_cache = (0.0, 0.0)
+
+
+def _get_inv_available_memory_mb() -> float:
+    """返回可用内存（MB）的倒数，调用方用乘法代替除法；可用内存为 0 时返回 0"""
+    global _available_memory_cache
+    now = time.monotonic()
+    sampled_at, inv_value = _available_memory_cache
+    if now - sampled_at >= _AVAILABLE_MEMORY_TTL or inv_value <= 0:
+        value = psutil.virtual_memory().available * _MB_INV
+        inv_value = 1.0 / value if value > 0 else 0.0
+        _available_memory_cache = (now, inv_value)
+    return inv_value
+
+
+def _value_changed(old, new: float) -> bool:
+    """进度值变化超过阈值才需要写回控件"""
+    return old is None or abs(new - old) > 0.001
+
+
+
+# 本地捆绑的 node/ffmpeg/ffprobe 所在目录
+_LOCAL_BIN_DIR = "bin/llbot"
+
+# 等待登录完成的总时长与轮询间隔范围（秒）
+_LOGIN_WAIT_TIMEOUT = 60
+_LOGIN_POLL_MIN_INTERVAL = 0.1
+_LOGIN_POLL_MAX_INTERVAL = 2.0
+
+# 启动检测的本地回退：(组件, bin/llbot 下的文件名, 找到后写入的配置项)
+# FFmpeg/FFprobe 只确认存在，不写入配置
+_LOCAL_FALLBACKS = (
+    ("node", "node.exe", "node_path"),
+    ("ffmpeg", "ffmpeg.exe", None),
+    ("ffprobe", "ffprobe.exe", None),
+)
+
+# 下载进度的界面刷新间隔（秒）
+_DOWNLOAD_UI_INTERVAL = 0.1
+# 下载完成提示的停留时间（秒）
+_DOWNLOAD_DONE_CLOSE_DELAY = 0.3
+_DOWNLOAD_STATUS_TEMPLATE = "%s MB / %s MB (%d%%)"
+
+
+def _format_mb(num_bytes: int) -> str:
+    """将字节数格式化为保留一位小数的 MB 字符串，只用整数运算"""
+    tenths = (num_bytes * 10) >> 20
+    return "%d.%d" % (tenths // 10, tenths % 10)
+
+
+# 各组件的默认路径，启动流程中反复作为 config.get 的默认值
+_DEF_PMHQ = DEFAULT_CONFIG["pmhq_path"]
+_DEF_LLBOT = DEFAULT_CONFIG["llbot_path"]
+_DEF_NODE = DEFAULT_CONFIG["node_path"]
+_DEF_FFMPEG = DEFAULT_CONFIG["ffmpeg_path"]
+_DEF_FFPROBE = DEFAULT_CONFIG["ffprobe_path"]
+
+
+def _archive_path(path: str, suffix: str) -> str:
+    """把目标文件的扩展名换成 .zip，扩展名不匹配时直接追加"""
+    if path.endswith(suffix):
+        return path[:-len(suffix)] + ".zip"
+    return path + ".zip"
+
+
+@dataclass(frozen=True)
+class _DownloadSpec:
+    """组件下载任务描述，对话框控件与下载状态通过属性名存放在 HomePage 上"""
+    name: str
+    title: str
+    message: str
+    dialog_attr: str
+    widget_prefix: str
+    key: str
+    download_fn: str
+    config_key: str
+    default_path: str
+    archive_suffix: Optional[str]
+    next_checks: tuple
+
+
+_DOWNLOAD_SPECS = {
+    "pmhq": _DownloadSpec(
+        "PMHQ", "下载PMHQ", "PMHQ可执行文件不存在，需要下载。",
+        "download_dialog", "download", "pmhq",
+        "download_pmhq", "pmhq_path", _DEF_PMHQ, ".exe", ("node", "ffmpeg", "llbot"),
+    ),
+    "llbot": _DownloadSpec(
+        "LLBot", "下载LLBot", "LLBot文件不存在，需要下载。",
+        "download_llbot_dialog", "llbot_download", "llbot",
+        "download_llbot", "llbot_path", _DEF_LLBOT, ".js", (),
+    ),
+    "node": _DownloadSpec(
+        "Node.exe", "下载Node.exe", "Node.exe文件不存在，需要下载。",
+        "download_node_dialog", "node_download", "node",
+        "download_node", "node_path", _DEF_NODE, None, ("ffmpeg", "llbot"),
+    ),
+    "ffmpeg": _DownloadSpec(
+        "FFmpeg.exe", "下载FFmpeg/FFprobe", "FFmpeg/FFprobe文件不存在，需要下载。",
+        "download_ffmpeg_dialog", "ffmpeg_download", "ffmpeg",
+        "download_ffmpeg", "ffmpeg_path", _DEF_FFMPEG, None, ("llbot",),
+    ),
+    "ffprobe": _DownloadSpec(
+        "FFprobe.exe", "下载FFprobe.exe", "FFprobe.exe文件不存在，需要下载。",
+        "download_ffprobe_dialog", "ffprobe_download", "ffprobe",
+        "download_ffprobe", "ffprobe_path", _DEF_FFPROBE, None, ("llbot",),
+    ),
+}
 
 
 class ProcessResourceCard:
@@ -30,8 +187,12 @@ class ProcessResourceCard:
         self.file_exists = True
         self.control = None
         self._version_text = None
+        self.version = ""
+        self._last_display = None
+        self._last_update_ts = 0.0
         
     def build(self):
+        self._last_display = None
         self.status_icon = ft.Icon(
             ft.Icons.CIRCLE,
             color=ft.Colors.GREY_400,
@@ -116,59 +277,83 @@ class ProcessResourceCard:
         return self.control
     
     def update_resources(self, cpu_percent: float, memory_mb: float, is_running: bool, 
-                        file_exists: bool = True, version: str = "", system_cpu: float = 0.0):
+                        file_exists: bool = True, version: str = "", system_cpu: float = 0.0) -> bool:
+        """更新卡片数据，返回控件是否有改动（由调用方统一提交更新）"""
         if not self.control:
-            return
+            return False
         
         try:
             if not self.control.page:
-                return
+                return False
             if not self.status_icon.page or not self.cpu_text.page:
-                return
+                return False
         except Exception:
-            return
+            return False
+        
+        now = time.monotonic()
+        if (now - self._last_update_ts < _MIN_RESOURCE_UPDATE_INTERVAL
+                and is_running == self.is_running
+                and file_exists == self.file_exists
+                and version == self.version
+                and abs(cpu_percent - self.cpu_percent) < 1.0
+                and abs(memory_mb - self.memory_mb) < 5):
+            return False
+        self._last_update_ts = now
         
         self.cpu_percent = cpu_percent
         self.memory_mb = memory_mb
         self.is_running = is_running
         self.file_exists = file_exists
+        self.version = version
+        
+        if self.show_download_status and not file_exists:
+            status = _STATUS_NOT_DOWNLOADED
+        elif is_running:
+            status = _STATUS_RUNNING
+        else:
+            status = _STATUS_STOPPED
+        
+        normalized_cpu = cpu_percent * _INV_CPU_COUNT
+        new_cpu_text = f"CPU: {normalized_cpu:.1f}%"
+        available_cpu = 100.0 - system_cpu
+        cpu_ratio = normalized_cpu / available_cpu if available_cpu > 0 else 0
+        new_cpu_value = cpu_ratio if cpu_ratio < 1.0 else 1.0
+        
+        new_memory_text = f"内存: {memory_mb:.0f} MB"
+        memory_ratio = memory_mb * _get_inv_available_memory_mb()
+        new_memory_value = memory_ratio if memory_ratio < 1.0 else 1.0
+        
+        display = (status, new_cpu_text, round(new_cpu_value, 3),
+                   new_memory_text, round(new_memory_value, 3), version)
+        if display == self._last_display:
+            return False
+        self._last_display = display
         
         try:
-            if self.show_download_status and not file_exists:
-                self.status_icon.name = ft.Icons.DOWNLOAD
-                self.status_icon.color = ft.Colors.ORANGE_600
-                self.status_text.value = "未下载"
-                self.status_text.color = ft.Colors.ORANGE_700
-            elif is_running:
-                self.status_icon.name = ft.Icons.CHECK_CIRCLE
-                self.status_icon.color = ft.Colors.GREEN_600
-                self.status_text.value = "运行中"
-                self.status_text.color = ft.Colors.GREEN_700
-            else:
-                self.status_icon.name = ft.Icons.CIRCLE
-                self.status_icon.color = ft.Colors.GREY_400
-                self.status_text.value = "未启动"
-                self.status_text.color = ft.Colors.GREY_600
-            
-            cpu_count = psutil.cpu_count() or 1
-            normalized_cpu = cpu_percent / cpu_count
-            self.cpu_text.value = f"CPU: {normalized_cpu:.1f}%"
-            available_cpu = 100.0 - system_cpu
-            cpu_ratio = normalized_cpu / available_cpu if available_cpu > 0 else 0
-            self.cpu_progress.value = min(cpu_ratio, 1.0)
+            # 只写入有变化的属性，避免向 Flutter 端发送重复数据
+            if self.status_text.value != status[2]:
+                self.status_icon.name, self.status_icon.color = status[0], status[1]
+                self.status_text.value, self.status_text.color = status[2], status[3]
+            if self.cpu_text.value != new_cpu_text:
+                self.cpu_text.value = new_cpu_text
+            if _value_changed(self.cpu_progress.value, new_cpu_value):
+                self.cpu_progress.value = new_cpu_value
+            if self.memory_text.value != new_memory_text:
+                self.memory_text.value = new_memory_text
+            if _value_changed(self.memory_progress.value, new_memory_value):
+                self.memory_progress.value = new_memory_value
             
-            self.memory_text.value = f"内存: {memory_mb:.0f} MB"
-            available_memory_mb = psutil.virtual_memory().available / 1024 / 1024
-            memory_ratio = memory_mb / available_memory_mb if available_memory_mb > 0 else 0
-            self.memory_progress.value = min(memory_ratio, 1.0)
-            
-            if version and self._version_text:
-                self._version_text.value = version
-                self._version_text.visible = True
-            elif self._version_text:
-                self._version_text.visible = False
+            if self._version_text:
+                if version:
+                    if self._version_text.value != version:
+                        self._version_text.value = version
+                    if not self._version_text.visible:
+                        self._version_text.visible = True
+                elif self._version_text.visible:
+                    self._version_text.visible = False
         except Exception:
             pass
+        return True
 
 
 class ResourceMonitorCard:
@@ -178,6 +363,9 @@ class ResourceMonitorCard:
         self.cpu_percent = 0.0
         self.memory_percent = 0.0
         self.control = None
+        self._last_update_ts = 0.0
+        self._last_cpu_rounded = None
+        self._last_mem_rounded = None
         
     def build(self):
         """构建UI组件"""
@@ -249,24 +437,48 @@ class ResourceMonitorCard:
         )
         return self.control
     
-    def update_resources(self, cpu_percent: float, memory_percent: float):
+    def update_resources(self, cpu_percent: float, memory_percent: float) -> bool:
         if not self.control:
-            return
+            return False
         
         try:
             if not self.control.page:
-                return
+                return False
         except Exception:
-            return
+            return False
+        
+        # 按显示精度（0.1%）比较，数值没有可见变化时直接返回
+        cpu_rounded = round(cpu_percent, 1)
+        mem_rounded = round(memory_percent, 1)
+        if cpu_rounded == self._last_cpu_rounded and mem_rounded == self._last_mem_rounded:
+            return False
+        
+        now = time.monotonic()
+        if (now - self._last_update_ts < _MIN_RESOURCE_UPDATE_INTERVAL
+                and abs(cpu_percent - self.cpu_percent) < 1.0
+                and abs(memory_percent - self.memory_percent) < 1.0):
+            return False
+        self._last_update_ts = now
+        self._last_cpu_rounded = cpu_rounded
+        self._last_mem_rounded = mem_rounded
         
         self.cpu_percent = cpu_percent
         self.memory_percent = memory_percent
         
-        self.cpu_text.value = f"CPU: {cpu_percent:.1f}%"
-        self.cpu_progress.value = cpu_percent / 100.0
-        
-        self.memory_text.value = f"内存: {memory_percent:.1f}%"
-        self.memory_progress.value = memory_percent / 100.0
+        new_cpu_text = f"CPU: {cpu_percent:.1f}%"
+        if self.cpu_text.value != new_cpu_text:
+            self.cpu_text.value = new_cpu_text
+        cpu_value = cpu_percent * 0.01
+        if _value_changed(self.cpu_progress.value, cpu_value):
+            self.cpu_progress.value = cpu_value
+        
+        new_memory_text = f"内存: {memory_percent:.1f}%"
+        if self.memory_text.value != new_memory_text:
+            self.memory_text.value = new_memory_text
+        memory_value = memory_percent * 0.01
+        if _value_changed(self.memory_progress.value, memory_value):
+            self.memory_progress.value = memory_value
+        return True
 
 
 class LogPreviewCard:
@@ -277,24 +489,38 @@ class LogPreviewCard:
         self.log_entries = []
         self.control = None
         self._last_log_hash = None
+        self._last_log_seq = None
         self.page = None
+    
+    @property
+    def last_log_seq(self) -> Optional[int]:
+        """最近一次渲染时的日志序号"""
+        return self._last_log_seq
         
     def build(self):
         """构建UI组件"""
         # 预创建10个日志行控件，避免频繁创建/销毁导致 Flutter 内存泄漏
-        self._log_rows = []
+        # 行、图标、文本分别存放在并行列表中，按下标访问
+        self._log_row_containers = []
+        self._log_icons = []
+        self._log_texts = []
+        text_color, icon_name, icon_color = _LOG_STYLE_STDOUT
         for _ in range(10):
-            icon = ft.Icon(ft.Icons.INFO_OUTLINE, size=14, color=ft.Colors.BLUE_600)
+            icon = ft.Icon(icon_name, size=14, color=icon_color)
             text = ft.Text(
                 "",
                 size=13,
-                color=ft.Colors.ON_SURFACE,
+                color=text_color,
                 max_lines=2,
                 overflow=ft.TextOverflow.ELLIPSIS,
                 expand=True
             )
             row = ft.Row([icon, text], spacing=6, vertical_alignment=ft.CrossAxisAlignment.START, visible=False)
-            self._log_rows.append((row, icon, text))
+            self._log_row_containers.append(row)
+            self._log_icons.append(icon)
+            self._log_texts.append(text)
+        # 每行当前显示的日志条目
+        self._row_entries = [None] * len(self._log_row_containers)
         
         self._empty_text = ft.Text(
             "暂无日志",
@@ -309,7 +535,7 @@ class LogPreviewCard:
         )
         
         self.log_list = ft.Column(
-            controls=[self._empty_container] + [row for row, _, _ in self._log_rows],
+            controls=[self._empty_container] + self._log_row_containers,
             spacing=6,
             scroll=ft.ScrollMode.AUTO,
             expand=True,
@@ -343,7 +569,7 @@ class LogPreviewCard:
                     ft.Container(
                         content=self.log_list,
                         height=220,
-                        bgcolor=ft.Colors.with_opacity(0.05, ft.Colors.PRIMARY),
+                        bgcolor=_LOG_LIST_BGCOLOR,
                         border_radius=8,
                         padding=12,
                         expand=True,
@@ -359,71 +585,74 @@ class LogPreviewCard:
         if self.on_view_all_callback:
             self.on_view_all_callback()
     
-    def update_logs(self, log_entries: List[dict]):
+    def update_logs(self, log_entries: List[LogEntry], seq: Optional[int] = None) -> bool:
         if not self.control:
-            return
+            return False
+        
+        # 日志序号未变化说明内容没有更新，直接跳过
+        if seq is not None and seq == self._last_log_seq:
+            return False
         
         try:
             if not self.control.page:
-                return
+                return False
             # 检查子控件是否还在页面上
             if not self._empty_container.page:
-                return
+                return False
         except Exception:
-            return
+            return False
         
         entries = log_entries[-10:]
         
-        # 计算日志哈希，只在内容变化时才更新UI
-        if entries:
-            last_entry = entries[-1]
-            current_hash = (
-                len(entries),
-                last_entry.get("timestamp", ""),
-                last_entry.get("message", "")[:50]
-            )
-        else:
-            current_hash = (0, "", "")
-        
-        if current_hash == self._last_log_hash:
-            return
+        if seq is None:
+            # 调用方未提供序号时，按条数和最后一条日志的序号判断是否变化
+            current_hash = (len(entries), entries[-1].seq if entries else 0)
+            
+            if current_hash == self._last_log_hash:
+                return False
+            self._last_log_hash = current_hash
         
-        self._last_log_hash = current_hash
+        self._last_log_seq = seq
         self.log_entries = entries
         
         try:
-            if not self.log_entries:
-                self._empty_container.visible = True
-                for row, _, _ in self._log_rows:
-                    row.visible = False
-            else:
-                self._empty_container.visible = False
+            has_entries = bool(self.log_entries)
+            if self._empty_container.visible == has_entries:
+                self._empty_container.visible = not has_entries
+            
+            shown = self._row_entries
+            rows = self._log_row_containers
+            icons = self._log_icons
+            texts = self._log_texts
+            n = min(len(self.log_entries), len(rows))
+            for i in range(n):
+                entry = self.log_entries[i]
+                # 该行显示的仍是同一条日志时无需改动任何属性
+                if shown[i] is entry:
+                    continue
+                shown[i] = entry
                 
-                for i, (row, icon_ctrl, text_ctrl) in enumerate(self._log_rows):
-                    if i < len(self.log_entries):
-                        entry = self.log_entries[i]
-                        timestamp = entry.get("timestamp", "")
-                        process_name = entry.get("process_name", "")
-                        level = entry.get("level", "stdout")
-                        message = entry.get("message", "")
-                        
-                        if level == "stderr":
-                            text_ctrl.color = ft.Colors.RED_700
-                            icon_ctrl.name = ft.Icons.ERROR_OUTLINE
-                            icon_ctrl.color = ft.Colors.RED_600
-                        else:
-                            text_ctrl.color = ft.Colors.ON_SURFACE
-                            icon_ctrl.name = ft.Icons.INFO_OUTLINE
-                            icon_ctrl.color = ft.Colors.BLUE_600
-                        if process_name == "LLBot":
-                            text_ctrl.value = message
-                        else:
-                            text_ctrl.value = f"[{timestamp}] [{process_name}] {message}"
-                        row.visible = True
-                    else:
-                        row.visible = False
+                text_ctrl = texts[i]
+                style = _LOG_STYLE_STDERR if entry.level == "stderr" else _LOG_STYLE_STDOUT
+                if text_ctrl.color != style[0]:
+                    text_ctrl.color = style[0]
+                    icons[i].name, icons[i].color = style[1], style[2]
+                if entry.process_name == "LLBot":
+                    rendered = entry.message
+                else:
+                    rendered = f"[{entry.time_text()}] [{entry.process_name}] {entry.message}"
+                if text_ctrl.value != rendered:
+                    text_ctrl.value = rendered
+                if not rows[i].visible:
+                    rows[i].visible = True
+            
+            for i in range(n, len(rows)):
+                if shown[i] is not None:
+                    shown[i] = None
+                    rows[i].visible = False
         except Exception:
             pass
+        return True
 
 
 class HomePage:
@@ -449,36 +678,90 @@ class HomePage:
         self.control = None
         self.page = None
         self.download_dialog = None
-        self.is_downloading = False
         self.download_llbot_dialog = None
-        self.is_downloading_llbot = False
         self.download_node_dialog = None
-        self.is_downloading_node = False
         self.download_ffmpeg_dialog = None
-        self.is_downloading_ffmpeg = False
         self.download_ffprobe_dialog = None
-        self.is_downloading_ffprobe = False
+        # 当前下载任务的组件键，同一时间只有一个下载；下载任务由常驻工作线程串行执行
+        self._active_dl: Optional[str] = None
+        self._dl_queue: queue.Queue = queue.Queue()
+        self._dl_worker_thread: Optional[threading.Thread] = None
         self._is_downloading_update = False
-        self._updates_found = []
+        # 横幅中显示的待更新组件：显示名 -> UpdateInfo
+        self._updates_found: Dict[str, UpdateInfo] = {}
         self._pending_app_update_script = None
         
         self._log_update_scheduled = False
-        self._log_update_lock = __import__('threading').Lock()
+        self._log_update_lock = threading.Lock()
         self._log_update_pending = False
         self.is_starting = False
-    
-    def _safe_update(self):
+        # 启动序列进行中标记，防止并发调用重复拉起 PMHQ、重复弹出对话框；由 _start_all_services 负责获取与释放
+        self._start_in_progress = threading.Lock()
+        self._process_cache = {}
+        # 资源刷新周期（秒）：数值稳定时逐步放大，出现明显变化时恢复为基础周期
+        self._refresh_period = RESOURCE_MONITOR_INTERVAL
+        self._steady_ticks = 0
+        self._last_resource_sample: Optional[tuple] = None
+        # 已有后台资源采样排队时，新的刷新请求直接合并
+        self._resource_refresh_lock = threading.Lock()
+        self._resource_refresh_pending = False
+        # 单次启动流程内的文件存在性缓存，键为规范化后的路径
+        self._exists_cache = {}
+        # bin/llbot 目录下的文件名（小写），一次枚举回答所有本地可执行文件的检查
+        self._bin_llbot_entries: Optional[set] = None
+        # node --version 需要启动子进程，同一启动流程内每个路径只检查一次
+        self._node_ver_cache = {}
+        self._cfg_cache = None
+        # 错误提示与QQ安装对话框首次使用时创建，之后复用
+        self._error_dialog: Optional[ft.AlertDialog] = None
+        self._qq_dialog: Optional[ft.AlertDialog] = None
+        # 关闭后 dismiss 事件尚未处理时请求再次打开的对话框，等 dismiss 完成后重新打开
+        self._dialogs_pending_reopen: set = set()
+        self._qq_install_config: dict = {}
+    
+    @property
+    def is_downloading(self) -> bool:
+        """是否有组件正在下载"""
+        return self._active_dl is not None
+    
+    def _safe_update(self, *controls):
+        """在事件循环中提交一次更新；传入控件时只提交这些控件"""
         page = self.page
         if page:
             async def do_update():
                 try:
-                    page.update()
+                    page.update(*controls)
                 except Exception:
                     pass
             try:
                 page.run_task(do_update)
             except Exception:
                 pass
+    
+    def _run_in_background(self, func: Callable, *args):
+        """在页面的线程池中执行后台任务，复用线程；未挂载到页面时退回独立线程"""
+        page = self.page
+        if page:
+            page.run_thread(func, *args)
+        else:
+            threading.Thread(target=func, args=args, daemon=True).start()
+    
+    def _close_dialog_later(self, dialog, delay: float):
+        """延迟关闭指定对话框；只关闭该对话框，不影响之后打开的其他对话框"""
+        page = self.page
+        if page:
+            async def do_close():
+                await asyncio.sleep(delay)
+                try:
+                    if dialog.open:
+                        dialog.open = False
+                        dialog.update()
+                except Exception:
+                    pass
+            try:
+                page.run_task(do_close)
+            except Exception:
+                pass
         
     def build(self):
         """构建UI组件"""
@@ -506,17 +789,28 @@ class HomePage:
         # 服务运行状态
         self.services_running = False
         
-        # 创建全局启动/停止按钮
+        # 创建全局启动/停止按钮，各状态的样式只创建一次，切换时直接替换引用
+        self._style_start = ft.ButtonStyle(
+            bgcolor=ft.Colors.GREEN_600,
+            padding=_START_BUTTON_PADDING,
+            shape=_START_BUTTON_SHAPE,
+        )
+        self._style_stop = ft.ButtonStyle(
+            bgcolor=ft.Colors.RED_600,
+            padding=_START_BUTTON_PADDING,
+            shape=_START_BUTTON_SHAPE,
+        )
+        self._style_starting = ft.ButtonStyle(
+            bgcolor=ft.Colors.ORANGE_600,
+            padding=_START_BUTTON_PADDING,
+            shape=_START_BUTTON_SHAPE,
+        )
         self._start_button_text = ft.Text("启动", color=ft.Colors.WHITE, size=16, weight=ft.FontWeight.W_500)
         self._start_button_icon = ft.Icon(ft.Icons.PLAY_ARROW, color=ft.Colors.WHITE, size=24)
         self.global_start_button = ft.Button(
             content=ft.Row([self._start_button_icon, self._start_button_text], spacing=8, alignment=ft.MainAxisAlignment.CENTER),
             on_click=self._on_global_button_click,
-            style=ft.ButtonStyle(
-                bgcolor=ft.Colors.GREEN_600,
-                padding=ft.padding.symmetric(horizontal=40, vertical=16),
-                shape=ft.RoundedRectangleBorder(radius=28),
-            ),
+            style=self._style_start,
             height=56,
             width=160,
         )
@@ -540,13 +834,6 @@ class HomePage:
             visible=False,
         )
         
-        # 创建下载对话框
-        self._build_download_dialog()
-        self._build_llbot_download_dialog()
-        self._build_node_download_dialog()
-        self._build_ffmpeg_download_dialog()
-        self._build_ffprobe_download_dialog()
-        
         # 悬浮启动按钮
         floating_button = ft.Container(
             content=self.global_start_button,
@@ -618,59 +905,10 @@ class HomePage:
         
         return self.control
     
-    def _build_download_dialog(self):
-        self.download_progress_bar = ft.ProgressBar(
-            value=0,
-            width=400,
-            height=10,
-            color=ft.Colors.BLUE_600,
-            bgcolor=ft.Colors.BLUE_100,
-        )
-        
-        self.download_progress_text = ft.Text(
-            "准备下载...",
-            size=14,
-            text_align=ft.TextAlign.CENTER,
-        )
-        
-        self.download_status_text = ft.Text(
-            "0 MB / 0 MB (0%)",
-            size=13,
-            color=ft.Colors.GREY_700,
-            text_align=ft.TextAlign.CENTER,
-        )
-        
-        self.download_cancel_button = ft.TextButton(
-            "取消",
-            on_click=self._on_download_cancel_click,
-        )
-        
-        self.download_dialog = ft.AlertDialog(
-            modal=True,
-            title=ft.Text("下载PMHQ"),
-            content=ft.Container(
-                content=ft.Column([
-                    ft.Text(
-                        "PMHQ可执行文件不存在，需要下载。",
-                        size=14,
-                    ),
-                    ft.Container(height=20),
-                    self.download_progress_text,
-                    ft.Container(height=10),
-                    self.download_progress_bar,
-                    ft.Container(height=10),
-                    self.download_status_text,
-                ], tight=True, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                width=450,
-            ),
-            actions=[
-                self.download_cancel_button,
-            ],
-            actions_alignment=ft.MainAxisAlignment.END,
-        )
-    
-    def _build_llbot_download_dialog(self):
-        self.llbot_download_progress_bar = ft.ProgressBar(
+    @staticmethod
+    def _make_download_dialog(title: str, message: str, on_cancel: Callable) -> tuple:
+        """创建下载对话框，返回 (对话框, 进度条, 进度文本, 状态文本, 取消按钮)"""
+        progress_bar = ft.ProgressBar(
             value=0,
             width=400,
             height=10,
@@ -678,97 +916,66 @@ class HomePage:
             bgcolor=ft.Colors.BLUE_100,
         )
         
-        self.llbot_download_progress_text = ft.Text(
+        progress_text = ft.Text(
             "准备下载...",
             size=14,
             text_align=ft.TextAlign.CENTER,
         )
         
-        self.llbot_download_status_text = ft.Text(
+        status_text = ft.Text(
             "0 MB / 0 MB (0%)",
             size=13,
             color=ft.Colors.GREY_700,
             text_align=ft.TextAlign.CENTER,
         )
         
-        self.llbot_download_cancel_button = ft.TextButton(
+        cancel_button = ft.TextButton(
             "取消",
-            on_click=self._on_llbot_download_cancel_click,
+            on_click=on_cancel,
         )
         
-        self.download_llbot_dialog = ft.AlertDialog(
+        dialog = ft.AlertDialog(
             modal=True,
-            title=ft.Text("下载LLBot"),
+            title=ft.Text(title),
             content=ft.Container(
                 content=ft.Column([
                     ft.Text(
-                        "LLBot文件不存在，需要下载。",
+                        message,
                         size=14,
                     ),
                     ft.Container(height=20),
-                    self.llbot_download_progress_text,
+                    progress_text,
                     ft.Container(height=10),
-                    self.llbot_download_progress_bar,
+                    progress_bar,
                     ft.Container(height=10),
-                    self.llbot_download_status_text,
+                    status_text,
                 ], tight=True, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
                 width=450,
             ),
             actions=[
-                self.llbot_download_cancel_button,
+                cancel_button,
             ],
             actions_alignment=ft.MainAxisAlignment.END,
         )
-    
-    def _build_node_download_dialog(self):
-        self.node_download_progress_bar = ft.ProgressBar(
-            value=0,
-            width=400,
-            height=10,
-            color=ft.Colors.BLUE_600,
-            bgcolor=ft.Colors.BLUE_100,
-        )
-        
-        self.node_download_progress_text = ft.Text(
-            "准备下载...",
-            size=14,
-            text_align=ft.TextAlign.CENTER,
-        )
-        
-        self.node_download_status_text = ft.Text(
-            "0 MB / 0 MB (0%)",
-            size=13,
-            color=ft.Colors.GREY_700,
-            text_align=ft.TextAlign.CENTER,
-        )
-        
-        self.node_download_cancel_button = ft.TextButton(
-            "取消",
-            on_click=self._on_node_download_cancel_click,
-        )
-        
-        self.download_node_dialog = ft.AlertDialog(
-            modal=True,
-            title=ft.Text("下载Node.exe"),
-            content=ft.Container(
-                content=ft.Column([
-                    ft.Text(
-                        "Node.exe文件不存在，需要下载。",
-                        size=14,
-                    ),
-                    ft.Container(height=20),
-                    self.node_download_progress_text,
-                    ft.Container(height=10),
-                    self.node_download_progress_bar,
-                    ft.Container(height=10),
-                    self.node_download_status_text,
-                ], tight=True, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                width=450,
-            ),
-            actions=[
-                self.node_download_cancel_button,
-            ],
-            actions_alignment=ft.MainAxisAlignment.END,
+        return dialog, progress_bar, progress_text, status_text, cancel_button
+    
+    def _build_download_dialog(self, spec: _DownloadSpec):
+        dialog, progress_bar, progress_text, status_text, cancel_button = self._make_download_dialog(
+            spec.title, spec.message, lambda e: self._on_download_cancel(spec))
+        setattr(self, spec.dialog_attr, dialog)
+        setattr(self, f"{spec.widget_prefix}_progress_bar", progress_bar)
+        setattr(self, f"{spec.widget_prefix}_progress_text", progress_text)
+        setattr(self, f"{spec.widget_prefix}_status_text", status_text)
+        setattr(self, f"{spec.widget_prefix}_cancel_button", cancel_button)
+    
+    def _download_widgets(self, spec: _DownloadSpec) -> tuple:
+        """返回 (进度条, 进度文本, 状态文本, 取消按钮)"""
+        prefix = spec.widget_prefix
+        return (
+            getattr(self, f"{prefix}_progress_bar"),
+            getattr(self, f"{prefix}_progress_text"),
+            getattr(self, f"{prefix}_status_text"),
+            getattr(self, f"{prefix}_cancel_button"),
         )
     
     def _on_global_button_click(self, e):
@@ -782,23 +989,18 @@ class HomePage:
         if not running:
             self.is_starting = False
         if running:
-            self._start_button_text.value = "停止"
-            self._start_button_icon.name = ft.Icons.STOP
-            self.global_start_button.style = ft.ButtonStyle(
-                bgcolor=ft.Colors.RED_600,
-                padding=ft.padding.symmetric(horizontal=40, vertical=16),
-                shape=ft.RoundedRectangleBorder(radius=28),
-            )
+            text, icon, style = "停止", ft.Icons.STOP, self._style_stop
         else:
-            self._start_button_text.value = "启动"
-            self._start_button_icon.name = ft.Icons.PLAY_ARROW
-            self.global_start_button.style = ft.ButtonStyle(
-                bgcolor=ft.Colors.GREEN_600,
-                padding=ft.padding.symmetric(horizontal=40, vertical=16),
-                shape=ft.RoundedRectangleBorder(radius=28),
-            )
-        if self.page:
-            self.page.update()
+            text, icon, style = "启动", ft.Icons.PLAY_ARROW, self._style_start
+        # 只负责按钮本身：状态未变化时不写属性也不刷新；修改了其他控件的调用方需自行提交页面更新
+        if (self._start_button_text.value == text
+                and self._start_button_icon.name == icon
+                and self.global_start_button.style is style):
+            return
+        self._start_button_text.value = text
+        self._start_button_icon.name = icon
+        self.global_start_button.style = style
+        self._safe_update(self.global_start_button)
     
     def _stop_all_services(self):
         # 检查QQ是否在运行
@@ -842,9 +1044,7 @@ class HomePage:
             self.page.show_dialog(dialog)
     
     def _do_stop_services(self, stop_qq: bool = False):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"停止所有服务, stop_qq={stop_qq}")
+        logger.info("停止所有服务, stop_qq=%s", stop_qq)
         
         try:
             if self.async_log_collector:
@@ -854,23 +1054,20 @@ class HomePage:
             logger.info("所有服务已停止")
             
             self._update_button_state(False)
+            # 服务状态变化后资源数值会随之变化，恢复快速刷新
+            self._reset_refresh_period()
             self.refresh_process_resources()
             if self.page:
                 self.page.update()
                 
         except Exception as ex:
-            logger.error(f"停止服务失败: {ex}")
+            logger.error("停止服务失败: %s", ex)
             self._show_error_dialog("停止失败", str(ex))
     
     def _on_global_start_click(self, e):
-        import logging
-        import shutil
-        from datetime import datetime
-        from core.async_log_collector import LogEntry
-        logger = logging.getLogger(__name__)
         logger.info("全局启动按钮被点击")
         
-        if self.is_downloading or self.is_downloading_llbot or self.is_downloading_node or self.is_downloading_ffmpeg or self.is_downloading_ffprobe:
+        if self.is_downloading:
             logger.info("正在下载中，忽略点击")
             return
         
@@ -886,23 +1083,13 @@ class HomePage:
         
         self._start_button_text.value = "启动中"
         self._start_button_icon.name = ft.Icons.HOURGLASS_EMPTY
-        self.global_start_button.style = ft.ButtonStyle(
-            bgcolor=ft.Colors.ORANGE_600,
-            padding=ft.padding.symmetric(horizontal=40, vertical=16),
-            shape=ft.RoundedRectangleBorder(radius=28),
-        )
+        self.global_start_button.style = self._style_starting
         if self.page:
             self.page.update()
         
         if self.async_log_collector:
-            entry = LogEntry(
-                timestamp=datetime.now(),
-                process_name="系统",
-                level="stdout",
-                message="正在启动..."
-            )
-            self.async_log_collector._logs.append(entry)
-            self._refresh_log_preview()
+            self.async_log_collector.add_system_log("正在启动...")
+            self._refresh_log_preview_debounced()
         
         # 延迟执行启动逻辑，让 UI 先更新
         def do_start():
@@ -911,11 +1098,70 @@ class HomePage:
         if self.page:
             self.page.run_thread(do_start)
     
+    def _exists(self, path: str) -> bool:
+        """检查文件是否存在，同一启动流程内每个路径只访问一次文件系统"""
+        key = os.path.normcase(os.path.normpath(path))
+        exists = self._exists_cache.get(key)
+        if exists is None:
+            exists = self.downloader.check_file_exists(path)
+            self._exists_cache[key] = exists
+        return exists
+    
+    def _local_bin_exists(self, name: str) -> bool:
+        """检查 bin/llbot 下的文件是否存在，目录只枚举一次"""
+        if self._bin_llbot_entries is None:
+            entries = set()
+            try:
+                with os.scandir(_LOCAL_BIN_DIR) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            entries.add(entry.name.lower())
+            except OSError:
+                pass
+            self._bin_llbot_entries = entries
+        return name.lower() in self._bin_llbot_entries
+    
+    def _node_version_valid(self, node_path: str) -> bool:
+        """检查Node.js版本是否 >= 22，同一启动流程内每个路径只执行一次 node --version"""
+        key = os.path.normcase(os.path.abspath(node_path))
+        valid = self._node_ver_cache.get(key)
+        if valid is None:
+            valid = self.downloader.check_node_version_valid(node_path)
+            self._node_ver_cache[key] = valid
+        return valid
+    
+    def _resolve_node_path(self, node_path: str) -> Optional[str]:
+        """按 配置路径 -> 系统PATH -> bin/llbot/node.exe 的顺序返回第一个可用的 Node.js
+        
+        候选路径按需探测，找到可用的即停止；存在性与版本检查复用启动流程内的缓存
+        """
+        candidates = (
+            # (来源, 获取路径, 是否要求版本 >= 22)
+            ("配置路径", lambda: node_path if self._exists(node_path) else None, True),
+            ("系统PATH", self.downloader.check_node_available, True),
+            ("本地目录", lambda: f"{_LOCAL_BIN_DIR}/node.exe" if self._local_bin_exists("node.exe") else None, False),
+        )
+        for source, locate, check_version in candidates:
+            path = locate()
+            if not path:
+                continue
+            if check_version and not self._node_version_valid(path):
+                logger.warning("%s的Node.js版本低于22: %s", source, path)
+                continue
+            return path
+        return None
+    
+    def _get_config(self, force: bool = False) -> dict:
+        """获取启动流程使用的配置，同一流程内只读取一次配置文件"""
+        if force or self._cfg_cache is None:
+            self._cfg_cache = self.config_manager.load_config()
+        return self._cfg_cache
+    
     def _do_start_services(self):
-        import logging
-        import shutil
-        from pathlib import Path
-        logger = logging.getLogger(__name__)
+        # 每次启动重新检查文件，避免沿用上一次启动的结果
+        self._exists_cache.clear()
+        self._bin_llbot_entries = None
+        self._node_ver_cache.clear()
         
         # 迁移旧版 llonebot 数据目录到 llbot
         old_data_dir = Path("bin/llonebot/data")
@@ -924,740 +1170,279 @@ class HomePage:
             try:
                 new_data_dir.parent.mkdir(parents=True, exist_ok=True)
                 shutil.copytree(old_data_dir, new_data_dir)
-                logger.info(f"已迁移数据目录: {old_data_dir} -> {new_data_dir}")
+                logger.info("已迁移数据目录: %s -> %s", old_data_dir, new_data_dir)
             except Exception as ex:
-                logger.warning(f"迁移数据目录失败: {ex}")
+                logger.warning("迁移数据目录失败: %s", ex)
         
         # 获取配置
         try:
-            config = self.config_manager.load_config()
-            logger.info(f"配置加载成功: {config}")
+            config = self._get_config(force=True)
+            logger.info("配置加载成功: %s", config)
         except Exception as ex:
-            logger.error(f"配置加载失败: {ex}")
+            logger.error("配置加载失败: %s", ex)
             self._update_button_state(False)
             self._show_error_dialog("配置加载失败", str(ex))
             return
         
-        pmhq_path = config.get("pmhq_path", DEFAULT_CONFIG["pmhq_path"])
-        llbot_path = config.get("llbot_path", DEFAULT_CONFIG["llbot_path"])
-        node_path = config.get("node_path", DEFAULT_CONFIG["node_path"])
-        logger.info(f"PMHQ路径: {pmhq_path}")
-        logger.info(f"LLBot路径: {llbot_path}")
-        logger.info(f"Node.exe路径: {node_path}")
-        
-        # 检查PMHQ文件是否存在
-        pmhq_exists = self.downloader.check_file_exists(pmhq_path)
-        logger.info(f"PMHQ文件存在: {pmhq_exists}")
-        
-        # 检查Node.exe文件是否存在（先检查配置路径，再检查环境变量，最后检查bin/llbot/node.exe）
-        # 同时检查版本是否 >= 22
-        node_exists = self.downloader.check_file_exists(node_path)
-        if node_exists:
-            if not self.downloader.check_node_version_valid(node_path):
-                logger.warning(f"配置路径的Node.js版本低于22: {node_path}")
-                node_exists = False
-        
+        pmhq_path = config.get("pmhq_path", _DEF_PMHQ)
+        llbot_path = config.get("llbot_path", _DEF_LLBOT)
+        node_path = config.get("node_path", _DEF_NODE)
+        logger.info("PMHQ路径: %s", pmhq_path)
+        logger.info("LLBot路径: %s", llbot_path)
+        logger.info("Node.exe路径: %s", node_path)
+        
+        # 各项检测互不依赖，并行执行，耗时取决于最慢的一项
+        # Node.js 配置路径需要执行 node --version，一并放入线程池
+        with ThreadPoolExecutor(max_workers=5, thread_name_prefix="startup-check") as pool:
+            pmhq_fut = pool.submit(self._exists, pmhq_path)
+            llbot_fut = pool.submit(self._exists, llbot_path)
+            node_cfg_fut = pool.submit(
+                lambda: self._exists(node_path) and self._node_version_valid(node_path)
+            )
+            node_sys_fut = pool.submit(self.downloader.check_node_available)
+            ffmpeg_sys_fut = pool.submit(self.downloader.check_ffmpeg_available)
+            ffprobe_sys_fut = pool.submit(self.downloader.check_ffprobe_available)
+            pmhq_exists = pmhq_fut.result()
+            llbot_exists = llbot_fut.result()
+            node_exists = node_cfg_fut.result()
+            system_node = node_sys_fut.result()
+            system_ffmpeg = ffmpeg_sys_fut.result()
+            system_ffprobe = ffprobe_sys_fut.result()
+        logger.info("PMHQ文件存在: %s", pmhq_exists)
+        logger.info("LLBot文件存在: %s", llbot_exists)
+        
+        # 自动检测到的路径先记录下来，检测结束后统一保存一次
+        dirty = {}
+        found = {"node": node_exists, "ffmpeg": bool(system_ffmpeg), "ffprobe": bool(system_ffprobe)}
+        if system_ffmpeg:
+            logger.info("在系统PATH中找到FFmpeg: %s", system_ffmpeg)
+        if system_ffprobe:
+            logger.info("在系统PATH中找到FFprobe: %s", system_ffprobe)
+        
+        # Node.js 依次检查配置路径、环境变量（版本需 >= 22），都不可用时再回退到本地目录
         if not node_exists:
-            system_node = self.downloader.check_node_available()
+            if self._exists(node_path):
+                logger.warning("配置路径的Node.js版本低于22: %s", node_path)
             if system_node:
-                if self.downloader.check_node_version_valid(system_node):
-                    logger.info(f"在系统PATH中找到Node.js (版本>=22): {system_node}")
-                    node_exists = True
+                if self._node_version_valid(system_node):
+                    logger.info("在系统PATH中找到Node.js (版本>=22): %s", system_node)
+                    found["node"] = True
                     config["node_path"] = system_node
-                    self.config_manager.save_config(config)
+                    dirty["node_path"] = system_node
                 else:
-                    logger.warning(f"系统PATH中的Node.js版本低于22: {system_node}")
-            
-            if not node_exists:
-                local_node_path = "bin/llbot/node.exe"
-                if self.downloader.check_file_exists(local_node_path):
-                    logger.info(f"在本地目录找到Node.js: {local_node_path}")
-                    node_exists = True
-                    config["node_path"] = local_node_path
-                    self.config_manager.save_config(config)
-        logger.info(f"Node.exe可用: {node_exists}")
-        
-        # 检查FFmpeg.exe是否存在（先检查环境变量，再检查bin/llbot/）
-        ffmpeg_exists = self.downloader.check_ffmpeg_exists()
-        if ffmpeg_exists:
-            system_ffmpeg = self.downloader.check_ffmpeg_available()
-            if system_ffmpeg:
-                logger.info(f"在系统PATH中找到FFmpeg: {system_ffmpeg}")
-            else:
-                logger.info("在本地目录找到FFmpeg: bin/llbot/ffmpeg.exe")
-        logger.info(f"FFmpeg.exe可用: {ffmpeg_exists}")
-        
-        # 检查FFprobe.exe是否存在（先检查环境变量，再检查bin/llbot/）
-        ffprobe_exists = self.downloader.check_ffprobe_exists()
-        if ffprobe_exists:
-            system_ffprobe = self.downloader.check_ffprobe_available()
-            if system_ffprobe:
-                logger.info(f"在系统PATH中找到FFprobe: {system_ffprobe}")
-            else:
-                logger.info("在本地目录找到FFprobe: bin/llbot/ffprobe.exe")
-        logger.info(f"FFprobe.exe可用: {ffprobe_exists}")
-        
-        # 检查LLBot文件是否存在
-        llbot_exists = self.downloader.check_file_exists(llbot_path)
-        logger.info(f"LLBot文件存在: {llbot_exists}")
+                    logger.warning("系统PATH中的Node.js版本低于22: %s", system_node)
+        
+        # 前面都没找到的组件回退到 bin/llbot 下的捆绑文件
+        for tool, exe, config_key in _LOCAL_FALLBACKS:
+            if not found[tool] and self._local_bin_exists(exe):
+                local_path = f"{_LOCAL_BIN_DIR}/{exe}"
+                logger.info("在本地目录找到%s: %s", tool, local_path)
+                found[tool] = True
+                if config_key:
+                    config[config_key] = local_path
+                    dirty[config_key] = local_path
+        
+        node_exists = found["node"]
+        ffmpeg_exists = found["ffmpeg"]
+        ffprobe_exists = found["ffprobe"]
+        logger.info("Node.exe可用: %s", node_exists)
+        logger.info("FFmpeg.exe可用: %s", ffmpeg_exists)
+        logger.info("FFprobe.exe可用: %s", ffprobe_exists)
+        
+        if dirty:
+            self.config_manager.save_config(config)
         
         if not pmhq_exists:
             logger.info("PMHQ文件不存在，显示下载对话框")
-            self._show_download_dialog()
+            self._show_download("pmhq")
         elif not node_exists:
             logger.info("Node.exe不可用，显示下载对话框")
-            self._show_node_download_dialog()
+            self._show_download("node")
         elif not ffmpeg_exists or not ffprobe_exists:
             logger.info("FFmpeg/FFprobe不可用，显示下载对话框")
-            self._show_ffmpeg_download_dialog()
+            self._show_download("ffmpeg")
         elif not llbot_exists:
             logger.info("LLBot文件不存在，显示下载对话框")
-            self._show_llbot_download_dialog()
+            self._show_download("llbot")
         else:
             logger.info("所有文件存在，直接启动服务")
             self._start_all_services()
     
-    def _show_download_dialog(self):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info("显示下载对话框")
+    def _show_download(self, key: str):
+        spec = _DOWNLOAD_SPECS[key]
+        logger.info("显示%s下载对话框", spec.name)
         
         if not self.page:
             logger.error("页面引用为空，无法显示对话框")
             return
         
-        self.download_progress_bar.value = 0
-        self.download_progress_text.value = "准备下载..."
-        self.download_status_text.value = "0 MB / 0 MB (0%)"
-        self.download_cancel_button.disabled = False
-        self.download_cancel_button.text = "取消"
-        self.is_downloading = True
-        
-        if self.page:
-            self.page.show_dialog(self.download_dialog)
-        logger.info("下载对话框已显示")
-        
-        import threading
-        download_thread = threading.Thread(target=self._download_pmhq)
-        download_thread.daemon = True
-        download_thread.start()
-        logger.info("下载线程已启动")
-    
-    def _download_pmhq(self):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info("开始下载PMHQ")
+        # 下载对话框在首次需要时才创建
+        if getattr(self, spec.dialog_attr) is None:
+            self._build_download_dialog(spec)
+        
+        progress_bar, progress_text, status_text, cancel_button = self._download_widgets(spec)
+        progress_bar.value = 0
+        progress_text.value = "准备下载..."
+        status_text.value = "0 MB / 0 MB (0%)"
+        cancel_button.disabled = False
+        cancel_button.text = "取消"
+        self._active_dl = spec.key
+        
+        self.page.show_dialog(getattr(self, spec.dialog_attr))
+        logger.info("%s下载对话框已显示", spec.name)
+        
+        if self._dl_worker_thread is None:
+            self._dl_worker_thread = threading.Thread(
+                target=self._dl_worker, name="component-download", daemon=True)
+            self._dl_worker_thread.start()
+        self._dl_queue.put(spec)
+        logger.info("%s下载任务已提交", spec.name)
+    
+    def _dl_worker(self):
+        """常驻下载线程，依次执行提交的下载任务"""
+        while True:
+            spec = self._dl_queue.get()
+            # 排队期间已被取消的任务直接丢弃
+            if self._active_dl == spec.key:
+                self._run_download(spec)
+    
+    def _run_download(self, spec: _DownloadSpec):
+        logger.info("开始下载%s", spec.name)
+        progress_bar, progress_text, status_text, cancel_button = self._download_widgets(spec)
         
         try:
-            config = self.config_manager.load_config()
-            pmhq_path = config.get("pmhq_path", DEFAULT_CONFIG["pmhq_path"])
-            pmhq_path = pmhq_path.replace('.exe', '.zip')
-            logger.info(f"下载目标路径: {pmhq_path}")
+            config = self._get_config()
+            target_path = config.get(spec.config_key, spec.default_path)
+            if spec.archive_suffix:
+                # 压缩包与目标文件放在同一位置
+                target_path = _archive_path(target_path, spec.archive_suffix)
+            logger.info("下载目标路径: %s", target_path)
+            
+            target_dir = os.path.dirname(target_path)
+            if target_dir:
+                os.makedirs(target_dir, exist_ok=True)
             
-            pmhq_dir = os.path.dirname(pmhq_path)
-            if pmhq_dir and not os.path.exists(pmhq_dir):
-                logger.info(f"创建目录: {pmhq_dir}")
-                os.makedirs(pmhq_dir, exist_ok=True)
+            last_ui_ts = 0.0
+            last_total = 0
+            total_mb = ""
+            # 回调按数据块触发，循环内用到的属性先绑定为局部变量
+            key = spec.key
+            safe_update = self._safe_update
+            monotonic = time.monotonic
             
             def progress_callback(downloaded: int, total: int):
-                if not self.is_downloading:
+                nonlocal last_ui_ts, last_total, total_mb
+                if self._active_dl != key:
                     raise DownloadError("下载已取消")
                 
+                # 每个数据块都会回调，界面最多每 100ms 刷新一次（下载完成时必定刷新）
+                now = monotonic()
+                if now - last_ui_ts < _DOWNLOAD_UI_INTERVAL and downloaded != total:
+                    return
+                last_ui_ts = now
+                
                 if total > 0:
-                    progress = downloaded / total
-                    self.download_progress_bar.value = progress
+                    if total != last_total:
+                        # 文件总大小在一次下载中不变，只格式化一次
+                        last_total = total
+                        total_mb = _format_mb(total)
+                    progress_bar.value = downloaded / total
+                    percentage = downloaded * 100 // total
                     
-                    downloaded_mb = downloaded / 1024 / 1024
-                    total_mb = total / 1024 / 1024
-                    percentage = int(progress * 100)
+                    progress_text.value = "正在下载... %d%%" % percentage
+                    status_text.value = _DOWNLOAD_STATUS_TEMPLATE % (_format_mb(downloaded), total_mb, percentage)
                     
-                    self.download_progress_text.value = f"正在下载... {percentage}%"
-                    self.download_status_text.value = f"{downloaded_mb:.1f} MB / {total_mb:.1f} MB ({percentage}%)"
-                    
-                    self._safe_update()
+                    safe_update(progress_bar, progress_text, status_text)
             
-            success = self.downloader.download_pmhq(pmhq_path, progress_callback)
+            success = getattr(self.downloader, spec.download_fn)(target_path, progress_callback)
             
-            if success and self.is_downloading:
-                self.download_progress_text.value = "下载完成！"
-                self.download_cancel_button.text = "关闭"
-                self._safe_update()
-                
-                import time
-                time.sleep(1)
+            if success:
+                # 下载产生了新文件，存在性缓存作废
+                self._exists_cache.clear()
+                self._bin_llbot_entries = None
+                self._node_ver_cache.clear()
+            if success and self._active_dl == spec.key:
+                progress_text.value = "下载完成！"
+                cancel_button.text = "关闭"
+                self._safe_update(progress_text, cancel_button)
                 
-                if self.page:
-                    self.page.pop_dialog()
-                
-                # 检查Node.exe是否需要下载（同时检查版本 >= 22）
-                config = self.config_manager.load_config()
-                node_path = config.get("node_path", DEFAULT_CONFIG["node_path"])
-                node_exists = self.downloader.check_file_exists(node_path)
-                if node_exists and not self.downloader.check_node_version_valid(node_path):
-                    logger.warning(f"配置路径的Node.js版本低于22: {node_path}")
-                    node_exists = False
+                # 完成提示短暂停留后由事件循环关闭对话框，下载线程直接继续后续步骤
+                self._close_dialog_later(getattr(self, spec.dialog_attr), _DOWNLOAD_DONE_CLOSE_DELAY)
                 
-                if not node_exists:
-                    self._show_node_download_dialog()
-                else:
-                    ffmpeg_exists = self.downloader.check_ffmpeg_exists()
-                    ffprobe_exists = self.downloader.check_ffprobe_exists()
-                    
-                    if not ffmpeg_exists or not ffprobe_exists:
-                        self._show_ffmpeg_download_dialog()
-                    else:
-                        llbot_path = config.get("llbot_path", DEFAULT_CONFIG["llbot_path"])
-                        llbot_exists = self.downloader.check_file_exists(llbot_path)
-                        
-                        if not llbot_exists:
-                            self._show_llbot_download_dialog()
-                        else:
-                            self._start_all_services()
+                self._continue_startup(spec.next_checks)
             
         except DownloadError as ex:
-            if self.is_downloading:
-                self.download_progress_text.value = "下载失败"
-                self.download_status_text.value = str(ex)
-                self.download_cancel_button.text = "关闭"
-                self._safe_update()
+            if self._active_dl == spec.key:
+                progress_text.value = "下载失败"
+                status_text.value = str(ex)
+                cancel_button.text = "关闭"
+                self._safe_update(progress_text, status_text, cancel_button)
         except Exception as ex:
-            if self.is_downloading:
-                self.download_progress_text.value = "下载失败"
-                self.download_status_text.value = f"错误: {str(ex)}"
-                self.download_cancel_button.text = "关闭"
-                self._safe_update()
+            if self._active_dl == spec.key:
+                progress_text.value = "下载失败"
+                status_text.value = f"错误: {str(ex)}"
+                cancel_button.text = "关闭"
+                self._safe_update(progress_text, status_text, cancel_button)
         finally:
-            self.is_downloading = False
+            # 后续组件的下载可能已在 _continue_startup 中提交，不能覆盖
+            if self._active_dl == spec.key:
+                self._active_dl = None
+    
+    def _continue_startup(self, checks: tuple):
+        """下载完成后按顺序检查剩余组件，缺失则继续下载，全部就绪后启动服务"""
+        config = self._get_config()
+        for check in checks:
+            if check == "node":
+                # 检查Node.exe是否需要下载（同时检查版本 >= 22）
+                if not self._resolve_node_path(config.get("node_path", _DEF_NODE)):
+                    self._show_download("node")
+                    return
+            elif check == "ffmpeg":
+                if not self.downloader.check_ffmpeg_exists() or not self.downloader.check_ffprobe_exists():
+                    self._show_download("ffmpeg")
+                    return
+            elif check == "llbot":
+                llbot_path = config.get("llbot_path", _DEF_LLBOT)
+                if not self._exists(llbot_path):
+                    self._show_download("llbot")
+                    return
+        self._start_all_services()
     
-    def _on_download_cancel_click(self, e):
-        self.is_downloading = False
+    def _on_download_cancel(self, spec: _DownloadSpec):
+        if self._active_dl == spec.key:
+            self._active_dl = None
         self._update_button_state(False)  # 恢复按钮状态
         if self.page:
             self.page.pop_dialog()
+            self.page.update()
     
-    def _show_llbot_download_dialog(self):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info("显示LLBot下载对话框")
-        
-        if not self.page:
-            logger.error("页面引用为空，无法显示对话框")
+    def _start_all_services(self):
+        # 非阻塞获取，检查与占用在同一步完成，并发的启动请求只有一个能进入
+        if not self._start_in_progress.acquire(blocking=False):
+            logger.info("启动序列已在进行中，忽略重复请求")
             return
-        
-        self.llbot_download_progress_bar.value = 0
-        self.llbot_download_progress_text.value = "准备下载..."
-        self.llbot_download_status_text.value = "0 MB / 0 MB (0%)"
-        self.llbot_download_cancel_button.disabled = False
-        self.llbot_download_cancel_button.text = "取消"
-        self.is_downloading_llbot = True
-        
-        self.page.show_dialog(self.download_llbot_dialog)
-        logger.info("LLBot下载对话框已显示")
-        
-        import threading
-        download_thread = threading.Thread(target=self._download_llbot)
-        download_thread.daemon = True
-        download_thread.start()
-        logger.info("LLBot下载线程已启动")
-    
-    def _download_llbot(self):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info("开始下载LLBot")
-        
+        # 无论启动序列正常返回、提前返回还是抛出异常，都释放标记
         try:
-            config = self.config_manager.load_config()
-            llbot_path = config.get("llbot_path", DEFAULT_CONFIG["llbot_path"])
-            llbot_zip_path = llbot_path.replace('.js', '.zip')
-            if not llbot_zip_path.endswith('.zip'):
-                llbot_zip_path = llbot_path + '.zip'
-            logger.info(f"下载目标路径: {llbot_zip_path}")
-            
-            llbot_dir = os.path.dirname(llbot_zip_path)
-            if llbot_dir and not os.path.exists(llbot_dir):
-                logger.info(f"创建目录: {llbot_dir}")
-                os.makedirs(llbot_dir, exist_ok=True)
-            
-            def progress_callback(downloaded: int, total: int):
-                if not self.is_downloading_llbot:
-                    raise DownloadError("下载已取消")
-                
-                if total > 0:
-                    progress = downloaded / total
-                    self.llbot_download_progress_bar.value = progress
-                    
-                    downloaded_mb = downloaded / 1024 / 1024
-                    total_mb = total / 1024 / 1024
-                    percentage = int(progress * 100)
-                    
-                    self.llbot_download_progress_text.value = f"正在下载... {percentage}%"
-                    self.llbot_download_status_text.value = f"{downloaded_mb:.1f} MB / {total_mb:.1f} MB ({percentage}%)"
-                    
-                    self._safe_update()
-            
-            success = self.downloader.download_llbot(llbot_zip_path, progress_callback)
-            
-            if success and self.is_downloading_llbot:
-                self.llbot_download_progress_text.value = "下载完成！"
-                self.llbot_download_cancel_button.text = "关闭"
-                self._safe_update()
-                
-                import time
-                time.sleep(1)
-                
-                if self.page:
-                    self.page.pop_dialog()
-                
-                self._start_all_services()
-            
-        except DownloadError as ex:
-            if self.is_downloading_llbot:
-                self.llbot_download_progress_text.value = "下载失败"
-                self.llbot_download_status_text.value = str(ex)
-                self.llbot_download_cancel_button.text = "关闭"
-                self._safe_update()
-        except Exception as ex:
-            if self.is_downloading_llbot:
-                self.llbot_download_progress_text.value = "下载失败"
-                self.llbot_download_status_text.value = f"错误: {str(ex)}"
-                self.llbot_download_cancel_button.text = "关闭"
-                self._safe_update()
+            self._run_start_sequence()
         finally:
-            self.is_downloading_llbot = False
-    
-    def _on_llbot_download_cancel_click(self, e):
-        self.is_downloading_llbot = False
-        self._update_button_state(False)
-        if self.page:
-            self.page.pop_dialog()
-    
-    def _show_node_download_dialog(self):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info("显示Node.exe下载对话框")
-        
-        if not self.page:
-            logger.error("页面引用为空，无法显示对话框")
-            return
-        
-        self.node_download_progress_bar.value = 0
-        self.node_download_progress_text.value = "准备下载..."
-        self.node_download_status_text.value = "0 MB / 0 MB (0%)"
-        self.node_download_cancel_button.disabled = False
-        self.node_download_cancel_button.text = "取消"
-        self.is_downloading_node = True
-        
-        self.page.show_dialog(self.download_node_dialog)
-        logger.info("Node.exe下载对话框已显示")
-        
-        import threading
-        download_thread = threading.Thread(target=self._download_node)
-        download_thread.daemon = True
-        download_thread.start()
-        logger.info("Node.exe下载线程已启动")
+            self._start_in_progress.release()
     
-    def _download_node(self):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info("开始下载Node.exe")
-        
+    def _run_start_sequence(self):
         try:
-            config = self.config_manager.load_config()
-            node_path = config.get("node_path", DEFAULT_CONFIG["node_path"])
-            logger.info(f"下载目标路径: {node_path}")
+            config = self._get_config()
             
-            node_dir = os.path.dirname(node_path)
-            if node_dir and not os.path.exists(node_dir):
-                logger.info(f"创建目录: {node_dir}")
-                os.makedirs(node_dir, exist_ok=True)
-            
-            def progress_callback(downloaded: int, total: int):
-                if not self.is_downloading_node:
-                    raise DownloadError("下载已取消")
-                
-                if total > 0:
-                    progress = downloaded / total
-                    self.node_download_progress_bar.value = progress
-                    
-                    downloaded_mb = downloaded / 1024 / 1024
-                    total_mb = total / 1024 / 1024
-                    percentage = int(progress * 100)
-                    
-                    self.node_download_progress_text.value = f"正在下载... {percentage}%"
-                    self.node_download_status_text.value = f"{downloaded_mb:.1f} MB / {total_mb:.1f} MB ({percentage}%)"
-                    
-                    self._safe_update()
-            
-            success = self.downloader.download_node(node_path, progress_callback)
-            
-            if success and self.is_downloading_node:
-                self.node_download_progress_text.value = "下载完成！"
-                self.node_download_cancel_button.text = "关闭"
-                self._safe_update()
-                
-                import time
-                time.sleep(1)
-                
-                if self.page:
-                    self.page.pop_dialog()
-                
-                ffmpeg_exists = self.downloader.check_ffmpeg_exists()
-                ffprobe_exists = self.downloader.check_ffprobe_exists()
-                
-                if not ffmpeg_exists or not ffprobe_exists:
-                    self._show_ffmpeg_download_dialog()
-                else:
-                    llbot_path = config.get("llbot_path", DEFAULT_CONFIG["llbot_path"])
-                    llbot_exists = self.downloader.check_file_exists(llbot_path)
-                    
-                    if not llbot_exists:
-                        self._show_llbot_download_dialog()
-                    else:
-                        self._start_all_services()
-            
-        except DownloadError as ex:
-            if self.is_downloading_node:
-                self.node_download_progress_text.value = "下载失败"
-                self.node_download_status_text.value = str(ex)
-                self.node_download_cancel_button.text = "关闭"
-                self._safe_update()
-        except Exception as ex:
-            if self.is_downloading_node:
-                self.node_download_progress_text.value = "下载失败"
-                self.node_download_status_text.value = f"错误: {str(ex)}"
-                self.node_download_cancel_button.text = "关闭"
-                self._safe_update()
-        finally:
-            self.is_downloading_node = False
-    
-    def _on_node_download_cancel_click(self, e):
-        self.is_downloading_node = False
-        self._update_button_state(False)  # 恢复按钮状态
-        if self.page:
-            self.page.pop_dialog()
-    
-    def _build_ffmpeg_download_dialog(self):
-        self.ffmpeg_download_progress_bar = ft.ProgressBar(
-            value=0,
-            width=400,
-            height=10,
-            color=ft.Colors.BLUE_600,
-            bgcolor=ft.Colors.BLUE_100,
-        )
-        
-        self.ffmpeg_download_progress_text = ft.Text(
-            "准备下载...",
-            size=14,
-            text_align=ft.TextAlign.CENTER,
-        )
-        
-        self.ffmpeg_download_status_text = ft.Text(
-            "0 MB / 0 MB (0%)",
-            size=13,
-            color=ft.Colors.GREY_700,
-            text_align=ft.TextAlign.CENTER,
-        )
-        
-        self.ffmpeg_download_cancel_button = ft.TextButton(
-            "取消",
-            on_click=self._on_ffmpeg_download_cancel_click,
-        )
-        
-        self.download_ffmpeg_dialog = ft.AlertDialog(
-            modal=True,
-            title=ft.Text("下载FFmpeg/FFprobe"),
-            content=ft.Container(
-                content=ft.Column([
-                    ft.Text(
-                        "FFmpeg/FFprobe文件不存在，需要下载。",
-                        size=14,
-                    ),
-                    ft.Container(height=20),
-                    self.ffmpeg_download_progress_text,
-                    ft.Container(height=10),
-                    self.ffmpeg_download_progress_bar,
-                    ft.Container(height=10),
-                    self.ffmpeg_download_status_text,
-                ], tight=True, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                width=450,
-            ),
-            actions=[
-                self.ffmpeg_download_cancel_button,
-            ],
-            actions_alignment=ft.MainAxisAlignment.END,
-        )
-    
-    def _show_ffmpeg_download_dialog(self):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info("显示FFmpeg.exe下载对话框")
-        
-        if not self.page:
-            logger.error("页面引用为空，无法显示对话框")
-            return
-        
-        self.ffmpeg_download_progress_bar.value = 0
-        self.ffmpeg_download_progress_text.value = "准备下载..."
-        self.ffmpeg_download_status_text.value = "0 MB / 0 MB (0%)"
-        self.ffmpeg_download_cancel_button.disabled = False
-        self.ffmpeg_download_cancel_button.text = "取消"
-        self.is_downloading_ffmpeg = True
-        
-        self.page.show_dialog(self.download_ffmpeg_dialog)
-        logger.info("FFmpeg.exe下载对话框已显示")
-        
-        import threading
-        download_thread = threading.Thread(target=self._download_ffmpeg)
-        download_thread.daemon = True
-        download_thread.start()
-        logger.info("FFmpeg.exe下载线程已启动")
-    
-    def _download_ffmpeg(self):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info("开始下载FFmpeg.exe")
-        
-        try:
-            config = self.config_manager.load_config()
-            ffmpeg_path = config.get("ffmpeg_path", DEFAULT_CONFIG["ffmpeg_path"])
-            logger.info(f"下载目标路径: {ffmpeg_path}")
-            
-            ffmpeg_dir = os.path.dirname(ffmpeg_path)
-            if ffmpeg_dir and not os.path.exists(ffmpeg_dir):
-                logger.info(f"创建目录: {ffmpeg_dir}")
-                os.makedirs(ffmpeg_dir, exist_ok=True)
-            
-            def progress_callback(downloaded: int, total: int):
-                if not self.is_downloading_ffmpeg:
-                    raise DownloadError("下载已取消")
-                
-                if total > 0:
-                    progress = downloaded / total
-                    self.ffmpeg_download_progress_bar.value = progress
-                    
-                    downloaded_mb = downloaded / 1024 / 1024
-                    total_mb = total / 1024 / 1024
-                    percentage = int(progress * 100)
-                    
-                    self.ffmpeg_download_progress_text.value = f"正在下载... {percentage}%"
-                    self.ffmpeg_download_status_text.value = f"{downloaded_mb:.1f} MB / {total_mb:.1f} MB ({percentage}%)"
-                    
-                    self._safe_update()
-            
-            success = self.downloader.download_ffmpeg(ffmpeg_path, progress_callback)
-            
-            if success and self.is_downloading_ffmpeg:
-                self.ffmpeg_download_progress_text.value = "下载完成！"
-                self.ffmpeg_download_cancel_button.text = "关闭"
-                self._safe_update()
-                
-                import time
-                time.sleep(1)
-                
-                if self.page:
-                    self.page.pop_dialog()
-                
-                config = self.config_manager.load_config()
-                llbot_path = config.get("llbot_path", DEFAULT_CONFIG["llbot_path"])
-                llbot_exists = self.downloader.check_file_exists(llbot_path)
-                
-                if not llbot_exists:
-                    self._show_llbot_download_dialog()
-                else:
-                    self._start_all_services()
-            
-        except DownloadError as ex:
-            if self.is_downloading_ffmpeg:
-                self.ffmpeg_download_progress_text.value = "下载失败"
-                self.ffmpeg_download_status_text.value = str(ex)
-                self.ffmpeg_download_cancel_button.text = "关闭"
-                self._safe_update()
-        except Exception as ex:
-            if self.is_downloading_ffmpeg:
-                self.ffmpeg_download_progress_text.value = "下载失败"
-                self.ffmpeg_download_status_text.value = f"错误: {str(ex)}"
-                self.ffmpeg_download_cancel_button.text = "关闭"
-                self._safe_update()
-        finally:
-            self.is_downloading_ffmpeg = False
-    
-    def _on_ffmpeg_download_cancel_click(self, e):
-        self.is_downloading_ffmpeg = False
-        self._update_button_state(False)  # 恢复按钮状态
-        if self.page:
-            self.page.pop_dialog()
-    
-    def _build_ffprobe_download_dialog(self):
-        self.ffprobe_download_progress_bar = ft.ProgressBar(
-            value=0,
-            width=400,
-            height=10,
-            color=ft.Colors.BLUE_600,
-            bgcolor=ft.Colors.BLUE_100,
-        )
-        
-        self.ffprobe_download_progress_text = ft.Text(
-            "准备下载...",
-            size=14,
-            text_align=ft.TextAlign.CENTER,
-        )
-        
-        self.ffprobe_download_status_text = ft.Text(
-            "0 MB / 0 MB (0%)",
-            size=13,
-            color=ft.Colors.GREY_700,
-            text_align=ft.TextAlign.CENTER,
-        )
-        
-        self.ffprobe_download_cancel_button = ft.TextButton(
-            "取消",
-            on_click=self._on_ffprobe_download_cancel_click,
-        )
-        
-        self.download_ffprobe_dialog = ft.AlertDialog(
-            modal=True,
-            title=ft.Text("下载FFprobe.exe"),
-            content=ft.Container(
-                content=ft.Column([
-                    ft.Text(
-                        "FFprobe.exe文件不存在，需要下载。",
-                        size=14,
-                    ),
-                    ft.Container(height=20),
-                    self.ffprobe_download_progress_text,
-                    ft.Container(height=10),
-                    self.ffprobe_download_progress_bar,
-                    ft.Container(height=10),
-                    self.ffprobe_download_status_text,
-                ], tight=True, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                width=450,
-            ),
-            actions=[
-                self.ffprobe_download_cancel_button,
-            ],
-            actions_alignment=ft.MainAxisAlignment.END,
-        )
-    
-    def _show_ffprobe_download_dialog(self):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info("显示FFprobe.exe下载对话框")
-        
-        if not self.page:
-            logger.error("页面引用为空，无法显示对话框")
-            return
-        
-        self.ffprobe_download_progress_bar.value = 0
-        self.ffprobe_download_progress_text.value = "准备下载..."
-        self.ffprobe_download_status_text.value = "0 MB / 0 MB (0%)"
-        self.ffprobe_download_cancel_button.disabled = False
-        self.ffprobe_download_cancel_button.text = "取消"
-        self.is_downloading_ffprobe = True
-        
-        self.page.show_dialog(self.download_ffprobe_dialog)
-        logger.info("FFprobe.exe下载对话框已显示")
-        
-        import threading
-        download_thread = threading.Thread(target=self._download_ffprobe)
-        download_thread.daemon = True
-        download_thread.start()
-        logger.info("FFprobe.exe下载线程已启动")
-    
-    def _download_ffprobe(self):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info("开始下载FFprobe.exe")
-        
-        try:
-            config = self.config_manager.load_config()
-            ffprobe_path = config.get("ffprobe_path", DEFAULT_CONFIG["ffprobe_path"])
-            logger.info(f"下载目标路径: {ffprobe_path}")
-            
-            ffprobe_dir = os.path.dirname(ffprobe_path)
-            if ffprobe_dir and not os.path.exists(ffprobe_dir):
-                logger.info(f"创建目录: {ffprobe_dir}")
-                os.makedirs(ffprobe_dir, exist_ok=True)
-            
-            def progress_callback(downloaded: int, total: int):
-                if not self.is_downloading_ffprobe:
-                    raise DownloadError("下载已取消")
-                
-                if total > 0:
-                    progress = downloaded / total
-                    self.ffprobe_download_progress_bar.value = progress
-                    
-                    downloaded_mb = downloaded / 1024 / 1024
-                    total_mb = total / 1024 / 1024
-                    percentage = int(progress * 100)
-                    
-                    self.ffprobe_download_progress_text.value = f"正在下载... {percentage}%"
-                    self.ffprobe_download_status_text.value = f"{downloaded_mb:.1f} MB / {total_mb:.1f} MB ({percentage}%)"
-                    
-                    self._safe_update()
-            
-            success = self.downloader.download_ffprobe(ffprobe_path, progress_callback)
-            
-            if success and self.is_downloading_ffprobe:
-                self.ffprobe_download_progress_text.value = "下载完成！"
-                self.ffprobe_download_cancel_button.text = "关闭"
-                self._safe_update()
-                
-                import time
-                time.sleep(1)
-                
-                if self.page:
-                    self.page.pop_dialog()
-                
-                config = self.config_manager.load_config()
-                llbot_path = config.get("llbot_path", DEFAULT_CONFIG["llbot_path"])
-                llbot_exists = self.downloader.check_file_exists(llbot_path)
-                
-                if not llbot_exists:
-                    self._show_llbot_download_dialog()
-                else:
-                    self._start_all_services()
-            
-        except DownloadError as ex:
-            if self.is_downloading_ffprobe:
-                self.ffprobe_download_progress_text.value = "下载失败"
-                self.ffprobe_download_status_text.value = str(ex)
-                self.ffprobe_download_cancel_button.text = "关闭"
-                self._safe_update()
-        except Exception as ex:
-            if self.is_downloading_ffprobe:
-                self.ffprobe_download_progress_text.value = "下载失败"
-                self.ffprobe_download_status_text.value = f"错误: {str(ex)}"
-                self.ffprobe_download_cancel_button.text = "关闭"
-                self._safe_update()
-        finally:
-            self.is_downloading_ffprobe = False
-    
-    def _on_ffprobe_download_cancel_click(self, e):
-        self.is_downloading_ffprobe = False
-        self._update_button_state(False)  # 恢复按钮状态
-        if self.page:
-            self.page.pop_dialog()
-    
-    def _start_all_services(self):
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        try:
-            config = self.config_manager.load_config()
-            
-            # 启动PMHQ
-            pmhq_path = config.get("pmhq_path", DEFAULT_CONFIG["pmhq_path"])
-            qq_path = config.get("qq_path", "")
-            auto_login_qq = config.get("auto_login_qq", "")
-            headless = config.get("headless", False)
+            # 启动PMHQ
+            pmhq_path = config.get("pmhq_path", _DEF_PMHQ)
+            qq_path = config.get("qq_path", "")
+            auto_login_qq = config.get("auto_login_qq", "")
+            headless = config.get("headless", False)
             
             # 如果QQ路径为空，尝试从注册表获取
             if not qq_path:
-                from utils.qq_path import get_win_reg_qq_path
                 reg_qq_path = get_win_reg_qq_path()
                 if reg_qq_path and reg_qq_path.exists():
                     qq_path = str(reg_qq_path)
-                    logger.info(f"从注册表获取到QQ路径: {qq_path}")
+                    logger.info("从注册表获取到QQ路径: %s", qq_path)
                     config["qq_path"] = qq_path
                     self.config_manager.save_config(config)
                 else:
@@ -1665,10 +1450,9 @@ class HomePage:
                     self._update_button_state(False)
                     self._show_qq_install_dialog(config)
                     return
-            
-            # 检查QQ路径是否真实存在
-            if not Path(qq_path).exists():
-                logger.warning(f"QQ路径不存在: {qq_path}")
+            # 检查QQ路径是否真实存在（注册表路径上面已检查过，不再重复 stat）
+            elif not Path(qq_path).exists():
+                logger.warning("QQ路径不存在: %s", qq_path)
                 self._update_button_state(False)  # 恢复按钮状态
                 self._show_error_dialog(
                     "QQ路径无效", 
@@ -1676,14 +1460,14 @@ class HomePage:
                 )
                 return
             
-            if self.downloader.check_file_exists(pmhq_path):
+            if self._exists(pmhq_path):
                 # 无头模式下，不传递auto_login_qq给pmhq，改用HTTP API登录
                 pmhq_auto_login = "" if headless else auto_login_qq
-                logger.info(f"正在启动PMHQ: {pmhq_path}, qq_path={qq_path}, auto_login_qq={pmhq_auto_login}, headless={headless}")
+                logger.info("正在启动PMHQ: %s, qq_path=%s, auto_login_qq=%s, headless=%s", pmhq_path, qq_path, pmhq_auto_login, headless)
                 pmhq_success = self.process_manager.start_pmhq(pmhq_path, qq_path=qq_path, auto_login_qq=pmhq_auto_login, headless=headless)
                 if pmhq_success:
                     pmhq_pid = self.process_manager.get_pid("pmhq")
-                    logger.info(f"PMHQ启动成功，PID: {pmhq_pid}")
+                    logger.info("PMHQ启动成功，PID: %s", pmhq_pid)
                     pmhq_process = self.process_manager.get_process("pmhq")
                     if pmhq_process:
                         if self.async_log_collector:
@@ -1709,7 +1493,7 @@ class HomePage:
             self._start_llbot_service(config)
             
         except Exception as ex:
-            logger.error(f"启动服务失败: {ex}")
+            logger.error("启动服务失败: %s", ex)
             self._update_button_state(False)  # 恢复按钮状态
             self._show_error_dialog("启动失败", str(ex))
     
@@ -1720,10 +1504,6 @@ class HomePage:
             auto_login_qq: 自动登录的QQ号
             config: 配置字典
         """
-        import logging
-        import threading
-        import time
-        logger = logging.getLogger(__name__)
         
         pmhq_port = self.process_manager.get_pmhq_port()
         if not pmhq_port:
@@ -1733,15 +1513,12 @@ class HomePage:
             return
         
         def login_thread():
-            # 等待PMHQ完全启动
-            time.sleep(2)
-            
-            from utils.login_service import LoginService
+            # LoginService 的请求会先轮询等待 PMHQ 就绪，无需固定等待
             login_service = LoginService(pmhq_port)
             
             # 如果指定了自动登录QQ号，尝试快速登录
             if auto_login_qq:
-                logger.info(f"尝试快速登录: {auto_login_qq}")
+                logger.info("尝试快速登录: %s", auto_login_qq)
                 
                 # 获取可快速登录的账号列表
                 quick_accounts = login_service.get_quick_login_accounts()
@@ -1756,11 +1533,11 @@ class HomePage:
                 if target_account:
                     result = login_service.quick_login(auto_login_qq)
                     if result.success:
-                        logger.info(f"快速登录成功: {auto_login_qq}")
+                        logger.info("快速登录成功: %s", auto_login_qq)
                         self._wait_for_login_and_start_llbot(config)
                         return
                     else:
-                        logger.warning(f"快速登录失败: {result.error_msg}")
+                        logger.warning("快速登录失败: %s", result.error_msg)
                         # 显示登录对话框
                         async def show_login_dialog():
                             self._show_login_dialog_with_error(pmhq_port, config, result.error_msg)
@@ -1768,7 +1545,7 @@ class HomePage:
                             self.page.run_task(show_login_dialog)
                         return
                 else:
-                    logger.warning(f"指定的QQ号 {auto_login_qq} 不在可快速登录列表中")
+                    logger.warning("指定的QQ号 %s 不在可快速登录列表中", auto_login_qq)
             
             # 没有指定自动登录QQ号，或者指定的QQ号不可用，显示登录对话框
             async def show_login_dialog():
@@ -1776,15 +1553,9 @@ class HomePage:
             if self.page:
                 self.page.run_task(show_login_dialog)
         
-        thread = threading.Thread(target=login_thread, daemon=True)
-        thread.start()
+        self._run_in_background(login_thread)
     
     def _wait_for_login_and_start_llbot(self, config: dict):
-        import logging
-        import threading
-        import time
-        from utils.pmhq_client import PMHQClient
-        logger = logging.getLogger(__name__)
         
         pmhq_port = self.process_manager.get_pmhq_port()
         if not pmhq_port:
@@ -1794,24 +1565,28 @@ class HomePage:
         
         def wait_thread():
             client = PMHQClient(pmhq_port, timeout=5)
-            max_attempts = 60
-            for _ in range(max_attempts):
+            # 轮询间隔从 100ms 逐步放大到 2s，登录很快完成时能立即发现
+            deadline = time.monotonic() + _LOGIN_WAIT_TIMEOUT
+            delay = _LOGIN_POLL_MIN_INTERVAL
+            while True:
                 info = client.fetch_self_info()
                 if info and info.uin:
-                    logger.info(f"登录完成，uin: {info.uin}")
+                    logger.info("登录完成，uin: %s", info.uin)
                     async def start_llbot():
                         self._start_llbot_service(config)
                     if self.page:
                         self.page.run_task(start_llbot)
                     return
-                time.sleep(1)
+                if time.monotonic() + delay > deadline:
+                    break
+                time.sleep(delay)
+                delay = min(delay * 1.5, _LOGIN_POLL_MAX_INTERVAL)
             
             logger.warning("等待登录超时")
             self.is_starting = False
             self._update_button_state(False)
         
-        thread = threading.Thread(target=wait_thread, daemon=True)
-        thread.start()
+        self._run_in_background(wait_thread)
     
     def _show_login_dialog(self, pmhq_port: int, config: dict):
         """显示登录对话框
@@ -1820,17 +1595,12 @@ class HomePage:
             pmhq_port: PMHQ端口号
             config: 配置字典
         """
-        from ui.login_dialog import LoginDialog
         
         def on_login_success(uin: str):
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info(f"登录成功: {uin}")
+            logger.info("登录成功: %s", uin)
             self._start_llbot_service(config)
         
         def on_cancel():
-            import logging
-            logger = logging.getLogger(__name__)
             logger.info("用户取消登录")
             self.is_starting = False
             self._update_button_state(False)
@@ -1861,35 +1631,18 @@ class HomePage:
         self._show_login_dialog(pmhq_port, config)
     
     def _start_llbot_service(self, config: dict):
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        node_path = config.get("node_path", DEFAULT_CONFIG["node_path"])
-        llbot_path = config.get("llbot_path", DEFAULT_CONFIG["llbot_path"])
-        
-        # 检查node是否可用（配置路径 -> 环境变量 -> bin/llbot/node.exe）
-        node_available = self.downloader.check_file_exists(node_path)
-        if node_available and not self.downloader.check_node_version_valid(node_path):
-            logger.warning(f"配置路径的Node.js版本低于22: {node_path}")
-            node_available = False
-        
-        if not node_available:
-            system_node = self.downloader.check_node_available()
-            if system_node and self.downloader.check_node_version_valid(system_node):
-                node_path = system_node
-                node_available = True
-            else:
-                local_node_path = "bin/llbot/node.exe"
-                if self.downloader.check_file_exists(local_node_path):
-                    node_path = local_node_path
-                    node_available = True
         
-        if node_available and self.downloader.check_file_exists(llbot_path):
-            logger.info(f"正在启动LLBot: node={node_path}, script={llbot_path}")
+        node_path = config.get("node_path", _DEF_NODE)
+        llbot_path = config.get("llbot_path", _DEF_LLBOT)
+        
+        node_path = self._resolve_node_path(node_path)
+        
+        if node_path and self._exists(llbot_path):
+            logger.info("正在启动LLBot: node=%s, script=%s", node_path, llbot_path)
             llbot_success = self.process_manager.start_llbot(node_path, llbot_path)
             if llbot_success:
                 llbot_pid = self.process_manager.get_pid("llbot")
-                logger.info(f"LLBot启动成功，PID: {llbot_pid}")
+                logger.info("LLBot启动成功，PID: %s", llbot_pid)
                 llbot_process = self.process_manager.get_process("llbot")
                 if llbot_process:
                     if self.async_log_collector:
@@ -1901,6 +1654,8 @@ class HomePage:
         
         self.is_starting = False
         self._update_button_state(True)
+        # 服务状态变化后资源数值会随之变化，恢复快速刷新
+        self._reset_refresh_period()
         self.refresh_process_resources()
         
         # 执行启动后自动运行命令
@@ -1911,15 +1666,12 @@ class HomePage:
     
     def _execute_startup_command(self):
         try:
-            config = self.config_manager.load_config()
+            config = self._get_config()
             startup_command_enabled = config.get("startup_command_enabled", False)
             startup_command = config.get("startup_command", "").strip()
             
             if startup_command_enabled and startup_command:
-                import subprocess
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.info(f"执行启动命令: {startup_command}")
+                logger.info("执行启动命令: %s", startup_command)
                 
                 subprocess.Popen(
                     f'cmd /c {startup_command}',
@@ -1929,143 +1681,183 @@ class HomePage:
                     creationflags=subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
                 )
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"执行启动命令失败: {e}")
+            logger.warning("执行启动命令失败: %s", e)
+    
+    def _open_dialog(self, dialog):
+        """打开可复用的对话框；仍在显示时只刷新内容"""
+        if dialog.open:
+            dialog.update()
+            return
+        try:
+            self.page.show_dialog(dialog)
+        except RuntimeError:
+            # 上次关闭后的 dismiss 事件尚未处理，对话框仍在对话框栈中；
+            # 此时直接打开会被随后到达的 dismiss 从栈中移除，因此推迟到 dismiss 处理完成后再打开
+            self._dialogs_pending_reopen.add(dialog)
+    
+    def _on_reusable_dialog_dismiss(self, e):
+        dialog = e.control
+        if dialog not in self._dialogs_pending_reopen:
+            return
+        self._dialogs_pending_reopen.discard(dialog)
+        if self.page:
+            self.page.show_dialog(dialog)
     
     def _show_error_dialog(self, title: str, message: str):
         if not self.page:
             return
         
-        error_dialog = ft.AlertDialog(
-            modal=True,
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[
-                ft.TextButton("确定", on_click=lambda e: self._close_dialog(error_dialog)),
-            ],
-        )
+        # 错误对话框只创建一次，之后只替换标题和内容
+        if self._error_dialog is None:
+            self._error_dialog = ft.AlertDialog(
+                modal=True,
+                title=ft.Text(title),
+                content=ft.Text(message),
+                actions=[
+                    ft.TextButton("确定", on_click=lambda e: self._close_dialog(self._error_dialog)),
+                ],
+                on_dismiss=self._on_reusable_dialog_dismiss,
+            )
+        else:
+            self._error_dialog.title.value = title
+            self._error_dialog.content.value = message
         
-        self.page.show_dialog(error_dialog)
+        self._open_dialog(self._error_dialog)
     
-    def _show_qq_install_dialog(self, config: dict):
-        import logging
-        import threading
-        import subprocess
-        import tempfile
-        from utils.qq_path import get_win_reg_qq_path
-        logger = logging.getLogger(__name__)
-        
-        if not self.page:
-            return
-        
-        progress_bar = ft.ProgressBar(width=350, value=0, visible=False)
-        progress_text = ft.Text("", size=12, visible=False)
-        status_text = ft.Text("未检测到QQ安装，是否下载并安装QQ？", size=14)
+    def _build_qq_install_dialog(self):
+        self._qq_progress_bar = ft.ProgressBar(width=350, value=0, visible=False)
+        self._qq_progress_text = ft.Text("", size=12, visible=False)
+        self._qq_status_text = ft.Text("", size=14)
         
-        confirm_btn = ft.ElevatedButton("下载并安装")
-        cancel_btn = ft.TextButton("取消")
+        self._qq_confirm_btn = ft.ElevatedButton("下载并安装", on_click=self._on_qq_install_confirm)
+        self._qq_cancel_btn = ft.TextButton("取消", on_click=lambda e: self._close_dialog(self._qq_dialog))
         
-        qq_dialog = ft.AlertDialog(
+        self._qq_dialog = ft.AlertDialog(
             modal=True,
             title=ft.Text("未找到QQ", weight=ft.FontWeight.BOLD),
             content=ft.Container(
                 content=ft.Column([
-                    status_text,
+                    self._qq_status_text,
                     ft.Container(height=10),
-                    progress_bar,
-                    progress_text,
+                    self._qq_progress_bar,
+                    self._qq_progress_text,
                 ], tight=True),
                 width=400,
             ),
-            actions=[cancel_btn, confirm_btn],
+            actions=[self._qq_cancel_btn, self._qq_confirm_btn],
             actions_alignment=ft.MainAxisAlignment.END,
+            on_dismiss=self._on_reusable_dialog_dismiss,
         )
+    
+    def _show_qq_install_dialog(self, config: dict):
         
-        def do_download_and_install(e):
-            confirm_btn.disabled = True
-            cancel_btn.disabled = True
-            progress_bar.visible = True
-            progress_text.visible = True
-            status_text.value = "正在下载QQ安装程序..."
-            self.page.update()
+        if not self.page:
+            return
+        
+        # 对话框只创建一次，每次打开时恢复初始状态
+        if self._qq_dialog is None:
+            self._build_qq_install_dialog()
+        self._qq_install_config = config
+        self._qq_status_text.value = "未检测到QQ安装，是否下载并安装QQ？"
+        self._qq_progress_bar.value = 0
+        self._qq_progress_bar.visible = False
+        self._qq_progress_text.value = ""
+        self._qq_progress_text.visible = False
+        self._qq_confirm_btn.disabled = False
+        self._qq_cancel_btn.disabled = False
+        
+        self._open_dialog(self._qq_dialog)
+    
+    def _on_qq_install_confirm(self, e):
+        self._qq_confirm_btn.disabled = True
+        self._qq_cancel_btn.disabled = True
+        self._qq_progress_bar.visible = True
+        self._qq_progress_text.visible = True
+        self._qq_status_text.value = "正在下载QQ安装程序..."
+        self.page.update()
+        
+        self._run_in_background(self._run_qq_install, self._qq_install_config)
+    
+    def _run_qq_install(self, config: dict):
+        progress_bar = self._qq_progress_bar
+        progress_text = self._qq_progress_text
+        status_text = self._qq_status_text
+        try:
+            temp_dir = tempfile.gettempdir()
+            qq_installer_path = os.path.join(temp_dir, "QQ_installer.exe")
             
-            def download_task():
-                try:
-                    temp_dir = tempfile.gettempdir()
-                    qq_installer_path = os.path.join(temp_dir, "QQ_installer.exe")
-                    
-                    def on_progress(downloaded, total):
-                        if total > 0:
-                            percent = downloaded / total
-                            progress_bar.value = percent
-                            progress_text.value = f"{downloaded / 1024 / 1024:.1f} MB / {total / 1024 / 1024:.1f} MB ({percent * 100:.1f}%)"
-                        else:
-                            progress_text.value = f"已下载: {downloaded / 1024 / 1024:.1f} MB"
-                        self._safe_update()
-                    
-                    self.downloader.download_qq(qq_installer_path, progress_callback=on_progress)
-                    
-                    status_text.value = "下载完成，正在静默安装QQ..."
-                    progress_bar.value = None
-                    self._safe_update()
-                    
-                    subprocess.run([qq_installer_path, "/S"], capture_output=True, timeout=300)
-                    
-                    try:
-                        os.unlink(qq_installer_path)
-                    except Exception:
-                        pass
-                    
-                    reg_qq_path = get_win_reg_qq_path()
-                    if reg_qq_path and reg_qq_path.exists():
-                        logger.info(f"QQ安装成功: {reg_qq_path}")
-                        self._close_dialog(qq_dialog)
-                        
-                        config["qq_path"] = str(reg_qq_path)
-                        self.config_manager.save_config(config)
-                        
-                        def show_success():
-                            if self.page:
-                                # 清理旧的 overlay 避免累积
-                                self.page.overlay.clear()
-                                snackbar = ft.SnackBar(content=ft.Text("QQ安装成功！"), bgcolor=ft.Colors.GREEN_700)
-                                self.page.overlay.append(snackbar)
-                                snackbar.open = True
-                                self.page.update()
-                        if self.page:
-                            self.page.run_thread(show_success)
-                        
-                        self._on_global_start_click(None)
-                    else:
-                        raise Exception("安装完成但未能检测到QQ路径")
-                        
-                except subprocess.TimeoutExpired:
-                    logger.error("QQ安装超时")
-                    status_text.value = "安装超时，请手动安装QQ后重试"
-                    progress_bar.visible = False
-                    progress_text.visible = False
-                    confirm_btn.disabled = False
-                    cancel_btn.disabled = False
-                    self._safe_update()
-                except Exception as ex:
-                    logger.error(f"QQ下载或安装失败: {ex}")
-                    status_text.value = f"安装失败: {ex}"
-                    progress_bar.visible = False
-                    progress_text.visible = False
-                    confirm_btn.disabled = False
-                    cancel_btn.disabled = False
-                    self._safe_update()
+            last_ui_ts = 0.0
             
-            threading.Thread(target=download_task, daemon=True).start()
-        
-        def do_cancel(e):
-            self._close_dialog(qq_dialog)
-        
-        confirm_btn.on_click = do_download_and_install
-        cancel_btn.on_click = do_cancel
-        
-        self.page.show_dialog(qq_dialog)
+            def on_progress(downloaded, total):
+                nonlocal last_ui_ts
+                # 界面最多每 100ms 刷新一次（下载完成时必定刷新）
+                now = time.monotonic()
+                if now - last_ui_ts < _DOWNLOAD_UI_INTERVAL and downloaded != total:
+                    return
+                last_ui_ts = now
+                
+                downloaded_mb = downloaded * _MB_INV
+                if total > 0:
+                    percent = downloaded / total
+                    progress_bar.value = percent
+                    progress_text.value = f"{downloaded_mb:.1f} MB / {total * _MB_INV:.1f} MB ({percent * 100:.1f}%)"
+                else:
+                    progress_text.value = f"已下载: {downloaded_mb:.1f} MB"
+                self._safe_update(progress_bar, progress_text)
+            
+            self.downloader.download_qq(qq_installer_path, progress_callback=on_progress)
+            
+            status_text.value = "下载完成，正在静默安装QQ..."
+            progress_bar.value = None
+            self._safe_update()
+            
+            subprocess.run([qq_installer_path, "/S"], capture_output=True, timeout=300)
+            
+            try:
+                os.unlink(qq_installer_path)
+            except Exception:
+                pass
+            
+            # 安装可能改变了注册表中的路径，重新查询
+            clear_win_reg_qq_path_cache()
+            reg_qq_path = get_win_reg_qq_path()
+            if reg_qq_path and reg_qq_path.exists():
+                logger.info("QQ安装成功: %s", reg_qq_path)
+                self._close_dialog(self._qq_dialog)
+                
+                config["qq_path"] = str(reg_qq_path)
+                self.config_manager.save_config(config)
+                
+                def show_success():
+                    if self.page:
+                        # 清理旧的 overlay 避免累积
+                        self.page.overlay.clear()
+                        snackbar = ft.SnackBar(content=ft.Text("QQ安装成功！"), bgcolor=ft.Colors.GREEN_700)
+                        self.page.overlay.append(snackbar)
+                        snackbar.open = True
+                        self.page.update()
+                if self.page:
+                    self.page.run_thread(show_success)
+                
+                self._on_global_start_click(None)
+            else:
+                raise Exception("安装完成但未能检测到QQ路径")
+                
+        except subprocess.TimeoutExpired:
+            logger.error("QQ安装超时")
+            status_text.value = "安装超时，请手动安装QQ后重试"
+            self._reset_qq_install_controls()
+        except Exception as ex:
+            logger.error("QQ下载或安装失败: %s", ex)
+            status_text.value = f"安装失败: {ex}"
+            self._reset_qq_install_controls()
+    
+    def _reset_qq_install_controls(self):
+        self._qq_progress_bar.visible = False
+        self._qq_progress_text.visible = False
+        self._qq_confirm_btn.disabled = False
+        self._qq_cancel_btn.disabled = False
+        self._safe_update()
     
     def _close_dialog(self, dialog):
         if self.page:
@@ -2109,14 +1901,19 @@ class HomePage:
             self.on_navigate_logs()
     
     def _get_process_resources_sync(self, pid: int) -> tuple:
+        # 复用 Process 对象，cpu_percent(None) 按两次采样间的差值计算，无需阻塞等待
+        # 进程退出时采样本身会抛出 NoSuchProcess，不再单独调用 is_running()
+        proc = self._process_cache.get(pid)
         try:
-            proc = psutil.Process(pid)
-            if not proc.is_running():
-                return 0.0, 0.0, False
-            cpu = proc.cpu_percent(interval=0.05)
-            mem = proc.memory_info().rss / 1024 / 1024
+            if proc is None:
+                proc = psutil.Process(pid)
+                self._process_cache[pid] = proc
+            with proc.oneshot():
+                cpu = proc.cpu_percent(None)
+                mem = proc.memory_info().rss * _MB_INV
             return cpu, mem, True
         except (psutil.NoSuchProcess, psutil.AccessDenied):
+            self._process_cache.pop(pid, None)
             return 0.0, 0.0, False
     
     def _collect_resources_sync(self):
@@ -2147,6 +1944,10 @@ class HomePage:
                 total_cpu += cpu
                 total_mem += mem
         
+        # 进程重启后旧 PID 不再被查询，释放其 Process 对象
+        for stale_pid in self._process_cache.keys() - {manager_pid, pmhq_pid, llbot_pid}:
+            self._process_cache.pop(stale_pid, None)
+        
         # PMHQ 是启动器，启动 QQ 后就会退出，所以只检查 LLBot 状态
         bot_running = llbot_running
         
@@ -2155,7 +1956,12 @@ class HomePage:
         qq_running = False
         qq_version = ""
         
-        qq_pid = self.process_manager.fetch_qq_process_info()
+        # 空闲时（未启动服务、没有托管进程、也没有已知的 QQ 进程）不向 PMHQ 查询，
+        # 避免停止服务后每个刷新周期都去连接已经不存在的 PMHQ 端口
+        idle = (not self.services_running and not self.is_starting
+                and not pmhq_pid and not llbot_pid
+                and self.process_manager.get_qq_pid() is None)
+        qq_pid = None if idle else self.process_manager.fetch_qq_process_info()
         if qq_pid:
             qq_running = True
             qq_resources = self.process_manager.get_qq_resources()
@@ -2165,7 +1971,6 @@ class HomePage:
             if not hasattr(self, '_cached_qq_version') or not self._cached_qq_version:
                 pmhq_port = self.process_manager.get_pmhq_port()
                 if pmhq_port:
-                    from utils.pmhq_client import PMHQClient
                     client = PMHQClient(pmhq_port, timeout=2)
                     device_info = client.get_device_info(timeout=2)
                     if device_info:
@@ -2209,16 +2014,92 @@ class HomePage:
             except Exception:
                 return
             
-            bot_data = data["bot"]
-            system_cpu = data.get("system_cpu", 0.0)
-            self.bot_card.update_resources(bot_data[0], bot_data[1], bot_data[2], system_cpu=system_cpu)
-            
-            qq_data = data["qq"]
-            self.qq_card.update_resources(qq_data[0], qq_data[1], qq_data[2], version=qq_data[3], system_cpu=system_cpu)
+            # 两张卡片的改动合并为一次提交
+            dirty = self._apply_resources(data, adapt=True)
+            if dirty:
+                self._safe_update(*dirty)
+        except Exception:
+            pass
+    
+    @property
+    def refresh_period(self) -> float:
+        """资源监控循环下一次刷新前应等待的秒数"""
+        return self._refresh_period
+    
+    def set_refresh_period(self, seconds: float):
+        self._refresh_period = min(max(seconds, RESOURCE_MONITOR_INTERVAL), RESOURCE_MONITOR_MAX_INTERVAL)
+    
+    def _reset_refresh_period(self):
+        self._steady_ticks = 0
+        self._refresh_period = RESOURCE_MONITOR_INTERVAL
+    
+    def _adapt_refresh_period(self, data: dict):
+        """根据本次与上次采样的差异调整刷新周期"""
+        bot_cpu, bot_mem, bot_running = data["bot"]
+        qq_cpu, qq_mem, qq_running, _ = data["qq"]
+        sample = (bot_cpu, bot_mem, qq_cpu, qq_mem, bot_running, qq_running)
+        last = self._last_resource_sample
+        self._last_resource_sample = sample
+        
+        steady = (
+            last is not None
+            and sample[4:] == last[4:]
+            and abs(bot_cpu - last[0]) < _RESOURCE_STEADY_CPU_DELTA
+            and abs(qq_cpu - last[2]) < _RESOURCE_STEADY_CPU_DELTA
+            and abs(bot_mem - last[1]) < _RESOURCE_STEADY_MEM_DELTA
+            and abs(qq_mem - last[3]) < _RESOURCE_STEADY_MEM_DELTA
+        )
+        if not steady:
+            self._reset_refresh_period()
+            return
+        self._steady_ticks += 1
+        if self._steady_ticks >= _RESOURCE_STEADY_TICKS:
+            self._steady_ticks = 0
+            self.set_refresh_period(self._refresh_period * 2)
+    
+    def _apply_resources(self, data: dict, adapt: bool = False) -> list:
+        """把采样结果写入资源卡片（只修改属性，不提交），返回有改动的控件
+        
+        只有周期性监控循环传入 adapt=True，启动、停止、导航触发的临时采样不参与刷新周期的调整
+        """
+        if adapt:
+            self._adapt_refresh_period(data)
+        bot_data = data["bot"]
+        system_cpu = data.get("system_cpu", 0.0)
+        dirty = []
+        if self.bot_card.update_resources(bot_data[0], bot_data[1], bot_data[2], system_cpu=system_cpu):
+            dirty.append(self.bot_card.control)
+        
+        qq_data = data["qq"]
+        if self.qq_card.update_resources(qq_data[0], qq_data[1], qq_data[2], version=qq_data[3], system_cpu=system_cpu):
+            dirty.append(self.qq_card.control)
+        return dirty
+    
+    def refresh_all(self, log_entries: List[LogEntry], seq: Optional[int] = None):
+        """刷新资源卡片和日志预览，所有改动合并为一次提交"""
+        if not self.page or not hasattr(self, 'control') or not self.control:
+            return
+        
+        try:
+            if self.control.page != self.page:
+                return
+        except Exception:
+            return
+        
+        dirty = []
+        try:
+            dirty.extend(self._apply_resources(self._collect_resources_sync(), adapt=True))
         except Exception:
             pass
+        if self.log_card.update_logs(log_entries, seq):
+            dirty.append(self.log_card.control)
+            # 有新日志时恢复默认周期，避免日志预览随资源稳定而延迟显示
+            self._reset_refresh_period()
+        if dirty:
+            self._safe_update(*dirty)
     
     def refresh_process_resources(self):
+        """在后台线程采样并刷新资源卡片，调用方不会被 psutil 或 PMHQ 查询阻塞"""
         if not self.page or not hasattr(self, 'control') or not self.control:
             return
         
@@ -2228,19 +2109,26 @@ class HomePage:
         except Exception:
             return
         
+        with self._resource_refresh_lock:
+            if self._resource_refresh_pending:
+                return
+            self._resource_refresh_pending = True
+        self._run_in_background(self._refresh_process_resources_now)
+    
+    def _refresh_process_resources_now(self):
+        # 采样前清除标记，采样期间到达的请求会再排一次，不会读到过期状态
+        with self._resource_refresh_lock:
+            self._resource_refresh_pending = False
         try:
             data = self._collect_resources_sync()
-            
-            bot_data = data["bot"]
-            system_cpu = data.get("system_cpu", 0.0)
-            self.bot_card.update_resources(bot_data[0], bot_data[1], bot_data[2], system_cpu=system_cpu)
-            
-            qq_data = data["qq"]
-            self.qq_card.update_resources(qq_data[0], qq_data[1], qq_data[2], version=qq_data[3], system_cpu=system_cpu)
+            # 两张卡片的改动合并为一次提交
+            dirty = self._apply_resources(data)
+            if dirty:
+                self._safe_update(*dirty)
         except Exception:
             pass
     
-    async def refresh_logs_async(self, log_entries: List[dict]):
+    async def refresh_logs_async(self, log_entries: List[LogEntry], seq: Optional[int] = None):
         if not self.page or not hasattr(self, 'control') or not self.control:
             return
         
@@ -2254,9 +2142,10 @@ class HomePage:
         except Exception:
             return
         
-        self.log_card.update_logs(log_entries)
+        if self.log_card.update_logs(log_entries, seq):
+            self._safe_update(self.log_card.control)
     
-    def refresh_logs(self, log_entries: List[dict]):
+    def refresh_logs(self, log_entries: List[LogEntry], seq: Optional[int] = None):
         if not self.page or not hasattr(self, 'control') or not self.control:
             return
         
@@ -2266,23 +2155,37 @@ class HomePage:
         except Exception:
             return
         
-        self.log_card.update_logs(log_entries)
+        if self.log_card.update_logs(log_entries, seq):
+            self._safe_update(self.log_card.control)
     
     def _refresh_log_preview(self):
         if self.log_collector:
-            logs = self.log_collector.get_recent_logs(10)
-            log_entries = [
-                {
-                    "timestamp": log.timestamp.strftime("%H:%M:%S"),
-                    "process_name": log.process_name,
-                    "level": log.level,
-                    "message": log.message,
-                }
-                for log in logs
-            ]
-            self.log_card.update_logs(log_entries)
-            if self.page:
-                self.page.update()
+            seq = self.log_collector.seq
+            log_entries = self.log_collector.get_recent_logs(10)
+            if self.log_card.update_logs(log_entries, seq):
+                self._safe_update(self.log_card.control)
+    
+    def _refresh_log_preview_debounced(self):
+        """合并短时间内的多次日志预览刷新请求，200ms 内最多刷新一次"""
+        with self._log_update_lock:
+            self._log_update_pending = True
+            if self._log_update_scheduled:
+                return
+            self._log_update_scheduled = True
+        timer = threading.Timer(0.2, self._flush_log_update)
+        timer.daemon = True
+        timer.start()
+    
+    def _flush_log_update(self):
+        with self._log_update_lock:
+            self._log_update_scheduled = False
+            if not self._log_update_pending:
+                return
+            self._log_update_pending = False
+        try:
+            self._refresh_log_preview()
+        except Exception:
+            pass
     
     def _on_new_log(self, entry):
         """新日志回调 - 已废弃，日志更新由资源监控线程统一处理
@@ -2300,25 +2203,22 @@ class HomePage:
         if component:
             component_map = {"app": "管理器", "pmhq": "PMHQ", "llbot": "LLBot"}
             display_name = component_map.get(component, component)
-            self._updates_found = [(name, info) for name, info in self._updates_found if name != display_name]
+            self._updates_found.pop(display_name, None)
             
             # 如果还有其他更新，更新横幅文字
             if self._updates_found:
-                update_names = [name for name, _ in self._updates_found]
-                self.update_banner.content.controls[1].value = f"发现新版本: {', '.join(update_names)}"
+                self.update_banner.content.controls[1].value = f"发现新版本: {', '.join(self._updates_found)}"
             else:
                 self.update_banner.visible = False
         else:
             # 清除所有更新
-            self._updates_found = []
+            self._updates_found.clear()
             self.update_banner.visible = False
         
         if self.page:
             self.page.update()
     
     def check_for_updates(self):
-        import logging
-        logger = logging.getLogger(__name__)
         
         if not self.update_manager:
             logger.warning("UpdateManager未设置，跳过更新检查")
@@ -2327,13 +2227,14 @@ class HomePage:
         logger.info("开始检查组件更新...")
         
         def on_check_complete(all_check_results):
-            updates_found = [(name, info) for name, info in all_check_results if info.has_update]
+            updates_found = {name: info for name, info in all_check_results if info.has_update}
+            self._updates_found = updates_found
             if updates_found:
-                update_names = [name for name, _ in updates_found]
-                logger.info(f"发现更新: {', '.join(update_names)}")
+                banner_names = ', '.join(updates_found)
+                logger.info("发现更新: %s", banner_names)
                 
                 async def show_banner():
-                    self.update_banner.content.controls[1].value = f"发现新版本: {', '.join(update_names)}"
+                    self.update_banner.content.controls[1].value = f"发现新版本: {banner_names}"
                     self.update_banner.visible = True
                     if self.page:
                         self.page.update()
@@ -2404,8 +2305,6 @@ class HomePage:
             self.page.show_dialog(confirm_dialog)
     
     def _start_component_updates(self):
-        import logging
-        logger = logging.getLogger(__name__)
         
         if not self.update_manager:
             return
@@ -2438,18 +2337,40 @@ class HomePage:
             if self.page:
                 self.page.run_task(update_status)
         
+        last_ui_ts = 0.0
+        # 最新一次待显示的 (已下载, 总大小)；界面任务尚未执行时只覆盖数值，不重复调度
+        pending_progress = None
+        progress_scheduled = False
+        
+        async def apply_progress():
+            nonlocal progress_scheduled
+            # 先清除调度标记再读取数值，期间到达的新进度会重新调度，不会丢失
+            progress_scheduled = False
+            downloaded, total = pending_progress
+            progress = downloaded / total
+            progress_bar.value = progress
+            progress_text.value = f"下载中... {downloaded * _MB_INV:.1f} MB / {total * _MB_INV:.1f} MB ({progress * 100:.0f}%)"
+            if self.page:
+                self.page.update(progress_bar, progress_text)
+        
         def on_download_progress(name: str, downloaded: int, total: int):
+            nonlocal last_ui_ts, pending_progress, progress_scheduled
             if total > 0:
-                progress = downloaded / total
-                async def update_progress():
-                    progress_bar.value = progress
-                    progress_text.value = f"下载中... {downloaded / 1024 / 1024:.1f} MB / {total / 1024 / 1024:.1f} MB ({progress * 100:.0f}%)"
-                    if self.page:
-                        self.page.update()
-                if self.page:
-                    self.page.run_task(update_progress)
+                # 界面最多每 100ms 刷新一次（下载完成时必定刷新）
+                now = time.monotonic()
+                if now - last_ui_ts < _DOWNLOAD_UI_INTERVAL and downloaded != total:
+                    return
+                last_ui_ts = now
+                
+                pending_progress = (downloaded, total)
+                if not progress_scheduled and self.page:
+                    progress_scheduled = True
+                    self.page.run_task(apply_progress)
         
         def on_download_complete(success_list, error_list, had_running_processes):
+            # 组件文件已替换，下次检查更新时重新检测版本
+            self.version_detector.clear_cache()
+            
             async def on_complete():
                 # 先显示完成状态
                 progress_bar.value = 1.0
@@ -2458,7 +2379,6 @@ class HomePage:
                     self.page.update()
                 
                 # 短暂延迟后关闭对话框
-                import asyncio
                 await asyncio.sleep(0.5)
                 
                 # 关闭下载对话框
@@ -2488,8 +2408,6 @@ class HomePage:
         self.update_manager.download_all_updates_async()
 
     def _auto_restart_after_update(self):
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info("更新完成，自动重新启动服务...")
         
         # 直接调用启动服务的方法
@@ -2502,12 +2420,10 @@ class HomePage:
             success_list: 成功更新的组件列表
             error_list: 失败的组件列表
         """
-        import subprocess
         
         other_updates = [s for s in success_list if s != "管理器"]
         
         def on_restart(e):
-            import os  # 在函数开始时导入os模块
             self._close_dialog(restart_dialog)
             # 启动更新脚本并退出当前程序
             script = self.update_manager.pending_app_update_script if self.update_manager else None
@@ -2523,7 +2439,6 @@ class HomePage:
             # 直接退出程序，不触发关闭确认对话框
             if self.page:
                 # 通过主窗口实例直接调用关闭方法
-                from ui.main_window import MainWindow
                 # 获取主窗口实例（通过页面的用户数据）
                 main_window = getattr(self.page, 'main_window', None)
                 if main_window and hasattr(main_window, '_do_close'):
@@ -2557,12 +2472,13 @@ class HomePage:
                 self.page.show_dialog(info_dialog)
         
         # 构建消息
-        msg = "管理器新版本已下载完成！\n\n需要重启程序以完成更新。"
+        parts = ["管理器新版本已下载完成！\n\n需要重启程序以完成更新。"]
         if other_updates:
-            msg += f"\n\n其他组件（{', '.join(other_updates)}）也已更新。"
+            parts.append(f"其他组件（{', '.join(other_updates)}）也已更新。")
         if error_list:
-            msg += f"\n\n以下组件更新失败: {', '.join([name for name, _ in error_list])}"
-        msg += "\n\n是否立即重启？"
+            parts.append("以下组件更新失败: " + ", ".join(name for name, _ in error_list))
+        parts.append("是否立即重启？")
+        msg = "\n\n".join(parts)
         
         restart_dialog = ft.AlertDialog(
             title=ft.Text("更新已就绪"),
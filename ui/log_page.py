@@ -7,6 +7,11 @@ from typing import Optional, List, Tuple
 from core.async_log_collector import AsyncLogCollector, LogEntry
 from utils.constants import MAX_LOG_LINES
 
+# 日志行文本颜色与选中行背景色，刷新和点击时直接引用
+_LOG_COLOR_STDERR = ft.Colors.RED_700
+_LOG_COLOR_STDOUT = ft.Colors.ON_SURFACE
+_SELECTED_ROW_BGCOLOR = ft.Colors.with_opacity(0.2, ft.Colors.PRIMARY)
+
 
 class LogPage:
     """日志页面组件 - 使用固定控件池避免内存泄漏"""
@@ -25,6 +30,8 @@ class LogPage:
         self._last_log_hash = None
         # 固定控件池
         self._log_rows: List[Tuple[ft.Container, ft.Text]] = []
+        # 每行当前显示的日志条目，条目未变的行无需重新格式化
+        self._row_entries: List[Optional[LogEntry]] = []
         # 选中的行索引集合
         self._selected_rows: set = set()
         # 主窗口引用，用于检查导航状态
@@ -67,12 +74,13 @@ class LogPage:
 
         # 预创建固定数量的日志行控件
         self._log_rows = []
+        self._row_entries = [None] * self.MAX_DISPLAY
         for i in range(self.MAX_DISPLAY):
             text = ft.Text(
                 value="",
                 size=13,
                 font_family="Cascadia Code, Consolas, monospace",
-                color=ft.Colors.ON_SURFACE,
+                color=_LOG_COLOR_STDOUT,
                 expand=True,
             )
             row = ft.Row(
@@ -167,8 +175,7 @@ class LogPage:
         if entry.process_name == "LLBot":
             return f"{prefix} {entry.message}"
         
-        timestamp = entry.timestamp.strftime("%H:%M:%S")
-        return f"{prefix} {timestamp} [{entry.process_name}] {entry.message}"
+        return f"{prefix} {entry.time_text()} [{entry.process_name}] {entry.message}"
 
     def _on_auto_refresh_change(self, e):
         """自动刷新开关变化"""
@@ -185,7 +192,7 @@ class LogPage:
             container.bgcolor = None
         else:
             self._selected_rows.add(idx)
-            container.bgcolor = ft.Colors.with_opacity(0.2, ft.Colors.PRIMARY)
+            container.bgcolor = _SELECTED_ROW_BGCOLOR
         
         has_selection = len(self._selected_rows) > 0
         self.copy_btn.visible = has_selection
@@ -269,6 +276,7 @@ class LogPage:
         for container, row, text in self._log_rows:
             container.visible = False
             text.value = ""
+        self._row_entries = [None] * len(self._log_rows)
         try:
             page = self.control.page if self.control else None
             if page:
@@ -306,23 +314,29 @@ class LogPage:
                     self._empty_container.visible = True
                     for container, row, text in self._log_rows:
                         container.visible = False
+                    self._row_entries = [None] * len(self._log_rows)
                     need_update = True
             else:
                 logs = self.log_collector.get_recent_logs(self.MAX_DISPLAY)
                 if logs:
-                    last_log = logs[-1]
-                    current_hash = (log_count, id(last_log), last_log.timestamp)
+                    # 收集器的变更序号在追加或清空日志时递增，未变化则无需重新格式化
+                    current_hash = self.log_collector.seq
                     if force or current_hash != self._last_log_hash:
                         self._last_log_hash = current_hash
                         self._empty_container.visible = False
 
+                        shown = self._row_entries
                         for i, (container, row, text) in enumerate(self._log_rows):
                             if i < len(logs):
                                 entry = logs[i]
+                                # 该行显示的仍是同一条日志时跳过格式化与比较
+                                if shown[i] is entry and container.visible:
+                                    continue
+                                shown[i] = entry
                                 formatted = self._format_log_entry(entry)
                                 if text.value != formatted:
                                     text.value = formatted
-                                    text.color = ft.Colors.RED_700 if entry.level == "stderr" else ft.Colors.ON_SURFACE
+                                    text.color = _LOG_COLOR_STDERR if entry.level == "stderr" else _LOG_COLOR_STDOUT
                                 if not container.visible:
                                     container.visible = True
                             else:
@@ -149,7 +149,8 @@ class MainWindow:
             on_config_saved=self._on_config_saved
         )
         self.config_page._page = page
-        self.config_page.build()
+        # 系统配置页的控件在首次进入时才创建
+        self.config_page.build(lazy=True)
         
         self.llbot_config_page = LLBotConfigPage(
             get_uin_func=self.process_manager.get_uin
@@ -296,17 +297,9 @@ class MainWindow:
             
             # 恢复日志预览
             if self.async_log_collector:
-                recent_logs = self.async_log_collector.get_recent_logs(10)
-                log_entries = [
-                    {
-                        "timestamp": log.timestamp.strftime("%H:%M:%S"),
-                        "process_name": log.process_name,
-                        "level": log.level,
-                        "message": log.message,
-                    }
-                    for log in recent_logs
-                ]
-                self.home_page.refresh_logs(log_entries)
+                log_seq = self.async_log_collector.seq
+                log_entries = self.async_log_collector.get_recent_logs(10)
+                self.home_page.refresh_logs(log_entries, log_seq)
             
             current_uin = self.process_manager.get_uin()
             current_nickname = self.process_manager.get_nickname()
@@ -374,6 +367,7 @@ class MainWindow:
             elif index == 1:
                 new_content = self.log_page.control
             elif index == 2:
+                self.config_page.on_page_enter()
                 new_content = self.config_page.control
             elif index == 3:
                 new_content = self.llbot_config_page.control
@@ -490,7 +484,7 @@ class MainWindow:
             logger.debug("导航被跳过: 正在导航中")
             return
         
-        if self.home_page.is_starting or self.home_page.is_downloading or self.home_page.is_downloading_llbot or self.home_page.is_downloading_node or self.home_page.is_downloading_ffmpeg or self.home_page.is_downloading_ffprobe:
+        if self.home_page.is_starting or self.home_page.is_downloading:
             logger.debug("导航被跳过: 正在下载或启动中")
             return
         
@@ -760,6 +754,9 @@ class MainWindow:
             # PMHQ 是启动器，启动后会退出，只检查 LLBot 状态
             logger.info(f"恢复按钮状态: LLBot={llbot_running}")
             self.home_page._update_button_state(llbot_running)
+            # 会话重连后整页提交一次，按钮状态未变时 _update_button_state 不会刷新页面
+            if self.page:
+                self.page.update()
             
         except Exception as e:
             logger.error(f"恢复按钮状态失败: {e}", exc_info=True)
@@ -1022,27 +1019,15 @@ class MainWindow:
                 if not self.page or self._navigating:
                     return
                 
-                def collect_logs():
-                    recent_logs = self.async_log_collector.get_recent_logs(10)
-                    return [
-                        {
-                            "timestamp": log.timestamp.strftime("%H:%M:%S"),
-                            "process_name": log.process_name,
-                            "level": log.level,
-                            "message": log.message,
-                        }
-                        for log in recent_logs
-                    ]
-                
-                log_entries = await asyncio.to_thread(collect_logs)
-                
-                # 线程执行完后再次检查状态
-                if self._navigating or self.current_page_index != 0 or not self.page:
+                log_seq = self.async_log_collector.seq
+                if log_seq == self.home_page.log_card.last_log_seq:
                     return
+                
                 if not self.home_page.control or not self.home_page.control.page:
                     return
-                    
-                await self.home_page.refresh_logs_async(log_entries)
+                
+                log_entries = self.async_log_collector.get_recent_logs(10)
+                await self.home_page.refresh_logs_async(log_entries, log_seq)
             except Exception:
                 pass
         
@@ -1057,6 +1042,8 @@ class MainWindow:
                 if not self.home_page.control or not self.home_page.control.page:
                     return
                 await self.home_page.refresh_process_resources_async()
+                # 资源稳定时放慢监控循环，变化时恢复
+                self.async_app.set_resource_interval(self.home_page.refresh_period)
             except Exception:
                 pass
         
@@ -1126,37 +1113,15 @@ class MainWindow:
         while self.monitoring_resources:
             try:
                 if self.current_page_index == 0 and self.page:
-                    try:
-                        self.home_page.refresh_process_resources()
-                    except Exception:
-                        pass
-                    
-                    logs = self.log_collector.get_recent_logs(10)
-                    log_entries = [
-                        {
-                            "timestamp": log.timestamp.strftime("%H:%M:%S"),
-                            "process_name": log.process_name,
-                            "level": log.level,
-                            "message": log.message,
-                        }
-                        for log in logs
-                    ]
-                    self.home_page.refresh_logs(log_entries)
-                    
-                    page = self.page
-                    if page:
-                        async def do_update():
-                            try:
-                                page.update()
-                            except Exception:
-                                pass
-                        try:
-                            page.run_task(do_update)
-                        except Exception:
-                            pass
+                    # 资源卡片与日志预览的改动由 refresh_all 合并为一次提交
+                    log_seq = self.log_collector.seq
+                    log_entries = self.log_collector.get_recent_logs(10)
+                    self.home_page.refresh_all(log_entries, log_seq)
                 
             except Exception:
                 pass
             
-            if self._stop_monitoring_event.wait(timeout=RESOURCE_MONITOR_INTERVAL):
+            # 首页资源稳定时刷新周期会逐步放大，资源变化或有新日志时恢复为 RESOURCE_MONITOR_INTERVAL
+            interval = self.home_page.refresh_period if self.current_page_index == 0 else RESOURCE_MONITOR_INTERVAL
+            if self._stop_monitoring_event.wait(timeout=interval):
                 break
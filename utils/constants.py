@@ -68,6 +68,8 @@ NPM_REGISTRY_MIRRORS = [
 ]
 
 RESOURCE_MONITOR_INTERVAL = 3.0
+# 资源数值持续稳定时刷新周期逐步放大的上限（秒）
+RESOURCE_MONITOR_MAX_INTERVAL = 12.0
 
 DEFAULT_WINDOW_WIDTH = 1200
 DEFAULT_WINDOW_HEIGHT = 800
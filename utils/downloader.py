@@ -5,7 +5,7 @@ import shutil
 import zipfile
 import tarfile
 import logging
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, Tuple
 from utils.constants import UPDATE_CHECK_TIMEOUT, NPM_PACKAGES, NPM_REGISTRY_MIRRORS, NPM_OFFICIAL_REGISTRY, QQ_DOWNLOAD_URL
 from utils.npm_api import get_package_info, get_package_tarball_url, NpmAPIError, NetworkError, TimeoutError
 from utils.http_client import HttpClient, TimeoutError as HttpTimeoutError, ConnectionError as HttpConnectionError
@@ -23,17 +23,59 @@ class Downloader:
     def __init__(self, timeout: int = 30):
         self.timeout = timeout
         self.registry_mirrors = NPM_REGISTRY_MIRRORS.copy()
+        self._path_raw: Optional[str] = None
+        self._path_pruned: Optional[str] = None
+        # node 可执行文件的主版本号缓存：绝对路径 -> (mtime_ns, size, 版本)
+        self._node_version_cache: Dict[str, Tuple[int, int, int]] = {}
     
     def check_file_exists(self, file_path: str) -> bool:
         return os.path.isfile(file_path)
     
+    def _search_path(self) -> Optional[str]:
+        """去重并剔除不存在目录后的 PATH，PATH 不变时只计算一次
+        
+        没有可用目录时返回 None，交由 shutil.which 按默认规则（回退到 os.defpath）查找
+        """
+        raw = os.environ.get("PATH", "")
+        if raw != self._path_raw:
+            seen = set()
+            dirs = []
+            for d in raw.split(os.pathsep):
+                key = os.path.normcase(d)
+                if key in seen:
+                    continue
+                seen.add(key)
+                if d and os.path.isdir(d):
+                    dirs.append(d)
+            self._path_raw = raw
+            self._path_pruned = os.pathsep.join(dirs) or None
+        return self._path_pruned
+    
     def find_in_path(self, executable: str) -> Optional[str]:
-        return shutil.which(executable)
+        return shutil.which(executable, path=self._search_path())
     
     def check_node_available(self) -> Optional[str]:
         return self.find_in_path("node.exe") or self.find_in_path("node")
     
     def get_node_version(self, node_path: str) -> Optional[int]:
+        """获取 Node.js 主版本号；文件未变化时复用上次的结果，不再启动 node 进程"""
+        try:
+            st = os.stat(node_path)
+        except OSError:
+            return self._run_node_version(node_path)
+        
+        key = os.path.normcase(os.path.abspath(node_path))
+        cached = self._node_version_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        
+        version = self._run_node_version(node_path)
+        # 获取失败（超时等）不缓存，下次重新尝试
+        if version is not None:
+            self._node_version_cache[key] = (st.st_mtime_ns, st.st_size, version)
+        return version
+    
+    def _run_node_version(self, node_path: str) -> Optional[int]:
         import subprocess
         import re
         import logging
@@ -293,13 +335,20 @@ class Downloader:
                 if progress_callback:
                     progress_callback(downloaded, total)
             
-            resp = client.download(QQ_DOWNLOAD_URL, chunk_callback=on_chunk, timeout=300)
-            
-            if resp.status >= 400:
-                raise NetworkError(f"HTTP错误 {resp.status}")
-            
-            with open(save_path, 'wb') as f:
-                f.write(resp.data)
+            # 安装包较大，按 1MB 分块直接写入文件，不在内存中缓存整个安装包
+            try:
+                with open(save_path, 'wb') as f:
+                    resp = client.download(QQ_DOWNLOAD_URL, chunk_callback=on_chunk,
+                                           timeout=300, file_obj=f)
+                if resp.status >= 400:
+                    raise NetworkError(f"HTTP错误 {resp.status}")
+            except BaseException:
+                # 下载失败时删除不完整的文件
+                try:
+                    os.remove(save_path)
+                except OSError:
+                    pass
+                raise
             
             logger.info(f"QQ安装程序下载成功: {save_path}")
             return True
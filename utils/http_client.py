@@ -4,7 +4,7 @@ import json
 import urllib.request
 import urllib.error
 import socket
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, BinaryIO
 from dataclasses import dataclass
 
 
@@ -59,7 +59,9 @@ class HttpClient:
     
     def download(self, url: str, headers: Optional[Dict[str, str]] = None,
                  timeout: Optional[int] = None, 
-                 chunk_callback: Optional[callable] = None) -> HttpResponse:
+                 chunk_callback: Optional[callable] = None,
+                 file_obj: Optional[BinaryIO] = None) -> HttpResponse:
+        """下载数据；指定 file_obj 时分块直接写入文件，不在内存中拼接，返回的 data 为空"""
         req = self._build_request('GET', url, headers=headers)
         timeout = timeout or self.timeout
         
@@ -73,7 +75,10 @@ class HttpClient:
                     chunk = response.read(self.DOWNLOAD_CHUNK_SIZE)
                     if not chunk:
                         break
-                    chunks.append(chunk)
+                    if file_obj is not None:
+                        file_obj.write(chunk)
+                    else:
+                        chunks.append(chunk)
                     downloaded += len(chunk)
                     if chunk_callback:
                         chunk_callback(chunk, downloaded, total_size)
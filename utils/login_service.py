@@ -40,6 +40,8 @@ class QRCodeInfo:
 class LoginService:
     PMHQ_READY_TIMEOUT = 30
     PMHQ_CHECK_INTERVAL = 1
+    # 首次探测间隔，之后逐次翻倍直到 PMHQ_CHECK_INTERVAL
+    PMHQ_FIRST_CHECK_INTERVAL = 0.1
     
     def __init__(self, port: int):
         self._port = port
@@ -58,21 +60,25 @@ class LoginService:
             return True
             
         timeout = timeout or self.PMHQ_READY_TIMEOUT
-        elapsed = 0
+        start = time.monotonic()
+        elapsed = 0.0
+        interval = self.PMHQ_FIRST_CHECK_INTERVAL
         
         logger.info(f"等待PMHQ就绪，超时时间: {timeout}秒")
         
+        # PMHQ 通常很快就绪，探测间隔从短到长，避免固定等待
         while elapsed < timeout:
             if self._client.is_ready():
                 self._pmhq_ready = True
-                logger.info(f"PMHQ已就绪，等待了{elapsed}秒")
+                logger.info(f"PMHQ已就绪，等待了{elapsed:.1f}秒")
                 return True
             
             if progress_callback:
                 progress_callback(int(elapsed), int(timeout))
             
-            time.sleep(self.PMHQ_CHECK_INTERVAL)
-            elapsed += self.PMHQ_CHECK_INTERVAL
+            time.sleep(interval)
+            interval = min(interval * 2, self.PMHQ_CHECK_INTERVAL)
+            elapsed = time.monotonic() - start
         
         logger.warning(f"等待PMHQ就绪超时（{timeout}秒）")
         return False
@@ -13,6 +13,8 @@ from utils.http_client import HttpClient, HttpError
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 @dataclass
 class PMHQResponse:
@@ -45,6 +47,8 @@ class PMHQClient:
         self._port = port
         self._base_url = f"http://127.0.0.1:{port}"
         self._client = HttpClient(timeout=timeout)
+        # 无参数调用的请求体固定不变，按函数名缓存编码后的字节
+        self._body_cache: Dict[str, bytes] = {}
     
     @property
     def port(self) -> int:
@@ -54,8 +58,13 @@ class PMHQClient:
     def base_url(self) -> str:
         return self._base_url
     
-    def _call(self, func: str, args: Optional[List] = None, 
-              echo: Optional[str] = None, timeout: Optional[int] = None) -> PMHQResponse:
+    def _encode_body(self, func: str, args: Optional[List], echo: Optional[str]) -> bytes:
+        cacheable = not args and not echo
+        if cacheable:
+            body = self._body_cache.get(func)
+            if body is not None:
+                return body
+        
         payload: Dict[str, Any] = {
             "type": "call",
             "data": {
@@ -67,8 +76,17 @@ class PMHQClient:
         if echo:
             payload["data"]["echo"] = echo
         
+        body = json.dumps(payload).encode('utf-8')
+        if cacheable:
+            self._body_cache[func] = body
+        return body
+    
+    def _call(self, func: str, args: Optional[List] = None, 
+              echo: Optional[str] = None, timeout: Optional[int] = None) -> PMHQResponse:
+        body = self._encode_body(func, args, echo)
+        
         try:
-            resp = self._client.post(self._base_url, json_data=payload, timeout=timeout)
+            resp = self._client.post(self._base_url, data=body, headers=_JSON_HEADERS, timeout=timeout)
             
             if resp.status != 200:
                 return PMHQResponse(success=False, error=f"HTTP {resp.status}")
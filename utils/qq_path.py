@@ -1,7 +1,19 @@
 from pathlib import Path
+from typing import Optional
+
+# 注册表查询结果缓存，只缓存查到的路径；未安装时每次重新查询，安装后即可查到
+_cached_qq_path: Optional[Path] = None
+
+
+def clear_win_reg_qq_path_cache():
+    global _cached_qq_path
+    _cached_qq_path = None
 
 
 def get_win_reg_qq_path():
+    global _cached_qq_path
+    if _cached_qq_path is not None:
+        return _cached_qq_path
     try:
         import winreg
         key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r'SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall\QQ')
@@ -9,7 +21,8 @@ def get_win_reg_qq_path():
         # print('获取到注册表 QQ 安装路径:', qq_uninstall_path)
         if qq_uninstall_path and qq_uninstall_path[0] == '"':
             qq_uninstall_path = qq_uninstall_path[1:-1]
-        return Path(qq_uninstall_path).parent / 'QQ.exe'
+        _cached_qq_path = Path(qq_uninstall_path).parent / 'QQ.exe'
+        return _cached_qq_path
     except Exception as e:
         print(f'获取QQ安装路径失败: {e}')
         return None
\ No newline at end of file